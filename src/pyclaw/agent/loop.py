@@ -171,11 +171,12 @@ class AgentLoop:
 
             for tc in response.tool_calls:
                 tool_name = tc.function.name if tc.function else tc.name
-                tool_args = (
-                    json.loads(tc.function.arguments)
-                    if tc.function and tc.function.arguments
-                    else tc.arguments
-                )
+                if tc.arguments:
+                    tool_args = tc.arguments
+                elif tc.function and tc.function.arguments:
+                    tool_args = json.loads(tc.function.arguments)
+                else:
+                    tool_args = {}
 
                 logger.info("Tool call: %s(%s)", tool_name, list(tool_args.keys()))
                 result = await agent.tools.execute(
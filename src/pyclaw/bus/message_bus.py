@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TypeVar
 
 from pyclaw.models import InboundMessage, OutboundMessage
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class MessageBus:
     """Async pub/sub message bus using asyncio.Queue."""
@@ -30,6 +33,26 @@ class MessageBus:
         except asyncio.TimeoutError:
             return None
 
+    def try_consume_inbound(self) -> InboundMessage | None:
+        """Return a queued inbound message without waiting, or None."""
+        if self._closed:
+            return None
+        try:
+            return self._inbound.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    async def publish_inbound_many(self, msgs: list[InboundMessage]) -> None:
+        """Publish several inbound messages, suspending only while the queue is full."""
+        if not self._closed:
+            await _put_many(self._inbound, msgs)
+
+    async def consume_inbound_batch(self, max_n: int = 32) -> list[InboundMessage]:
+        """Wait (up to 1s) for one inbound message, then take up to max_n queued ones."""
+        if self._closed:
+            return []
+        return await _get_batch(self._inbound, max_n)
+
     async def publish_outbound(self, msg: OutboundMessage) -> None:
         if not self._closed:
             await self._outbound.put(msg)
@@ -42,5 +65,40 @@ class MessageBus:
         except asyncio.TimeoutError:
             return None
 
+    async def publish_outbound_many(self, msgs: list[OutboundMessage]) -> None:
+        """Publish several outbound messages, suspending only while the queue is full."""
+        if not self._closed:
+            await _put_many(self._outbound, msgs)
+
+    async def consume_outbound_batch(self, max_n: int = 32) -> list[OutboundMessage]:
+        """Wait (up to 1s) for one outbound message, then take up to max_n queued ones."""
+        if self._closed:
+            return []
+        return await _get_batch(self._outbound, max_n)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
     def close(self) -> None:
         self._closed = True
+
+
+async def _put_many(queue: asyncio.Queue[_T], items: list[_T]) -> None:
+    for item in items:
+        if queue.full():
+            await queue.put(item)
+        else:
+            queue.put_nowait(item)
+
+
+async def _get_batch(queue: asyncio.Queue[_T], max_n: int) -> list[_T]:
+    # Only the first item is awaited; the rest are whatever is already queued,
+    # so a burst is drained with one wakeup instead of one per message.
+    try:
+        batch = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+    except TimeoutError:
+        return []
+    while len(batch) < max_n and not queue.empty():
+        batch.append(queue.get_nowait())
+    return batch
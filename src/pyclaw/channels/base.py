@@ -6,7 +6,7 @@ import logging
 from typing import Any
 
 from pyclaw.bus.message_bus import MessageBus
-from pyclaw.models import InboundMessage
+from pyclaw.models import InboundMessage, OutboundMessage
 from pyclaw.protocols import Channel
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,23 @@ class BaseChannel(Channel):
                     return True
         return False
 
+    async def send_many(self, msgs: list[OutboundMessage]) -> None:
+        """Send several messages in order.
+
+        Channels whose API can deliver a batch in one call override this. The
+        default sends one by one, attempting every message and then re-raising
+        the first failure.
+        """
+        error: Exception | None = None
+        for msg in msgs:
+            try:
+                await self.send(msg)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
     async def handle_message(
         self,
         sender_id: str,
@@ -107,8 +124,6 @@ class ChannelManager:
         self, channel_name: str, chat_id: str, content: str
     ) -> None:
         """Send a message to a specific channel."""
-        from pyclaw.models import OutboundMessage
-
         ch = self._channels.get(channel_name)
         if ch and ch.is_running():
             await ch.send(OutboundMessage(
@@ -117,6 +132,23 @@ class ChannelManager:
                 content=content,
             ))
 
+    async def send_to_channel_batch(
+        self, channel_name: str, items: list[tuple[str, str]]
+    ) -> None:
+        """Send several (chat_id, content) messages to one channel in a single call."""
+        ch = self._channels.get(channel_name)
+        if not (ch and ch.is_running()) or not items:
+            return
+        msgs = [
+            OutboundMessage(channel=channel_name, chat_id=chat_id, content=content)
+            for chat_id, content in items
+        ]
+        if isinstance(ch, BaseChannel):
+            await ch.send_many(msgs)
+        else:
+            for msg in msgs:
+                await ch.send(msg)
+
     def get_enabled_channels(self) -> list[str]:
         return [name for name, ch in self._channels.items() if ch.is_running()]
 
@@ -67,10 +67,10 @@ class MaixCamChannel(BaseChannel):
                     data = json.loads(line.decode())
                     msg_type = data.get("type", "")
                     if msg_type == "person_detected":
-                        content = (
-                            f"Person detected: score={data.get('score', 0):.2f} "
-                            f"at ({data.get('x', 0)}, {data.get('y', 0)})"
-                        )
+                        score = data.get("score", 0)
+                        x = data.get("x", 0)
+                        y = data.get("y", 0)
+                        content = f"Person detected: score={score:.2f} at ({x}, {y})"
                         metadata = {
                             "timestamp": str(data.get("timestamp", "")),
                             "class_id": str(data.get("class_id", "")),
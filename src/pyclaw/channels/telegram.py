@@ -5,109 +5,35 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-import re
 import tempfile
 from typing import Any
 
 from pyclaw.bus.message_bus import MessageBus
 from pyclaw.channels.base import BaseChannel
+from pyclaw.channels.telegram_markdown import MAX_MESSAGE_LENGTH, markdown_to_telegram_html
 from pyclaw.config.models import Config, TelegramConfig
 from pyclaw.models import OutboundMessage
 
 logger = logging.getLogger(__name__)
 
-MAX_MESSAGE_LENGTH = 4096
+# Prefer a tmpfs-backed directory for short-lived media downloads so voice
+# notes and photos never hit the disk; fall back to the system default.
+_MEDIA_TMP_DIR: str | None = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
 
 
 # ---------------------------------------------------------------------------
-# Markdown -> Telegram HTML conversion
+# Media helpers
 # ---------------------------------------------------------------------------
 
 
-def _escape_html(text: str) -> str:
-    """Escape HTML entities in *text*."""
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    return text
-
-
-def markdown_to_telegram_html(text: str) -> str:
-    """Convert a Markdown string to Telegram-compatible HTML.
-
-    The conversion mirrors the Go ``markdownToTelegramHTML`` function:
-
-    1. Extract fenced code blocks and inline code so they are not mangled.
-    2. Strip markdown headers and blockquotes.
-    3. Escape HTML entities in the remaining text.
-    4. Convert links, bold, italic, strikethrough, and list markers.
-    5. Re-insert code blocks / inline codes wrapped in the appropriate tags.
-    """
-    if not text:
-        return ""
-
-    # -- extract fenced code blocks ----------------------------------------
-    code_blocks: list[str] = []
-    _re_code_block = re.compile(r"```[\w]*\n?([\s\S]*?)```")
-
-    def _replace_code_block(m: re.Match) -> str:
-        code_blocks.append(m.group(1))
-        return f"\x00CB{len(code_blocks) - 1}\x00"
-
-    text = _re_code_block.sub(_replace_code_block, text)
-
-    # -- extract inline codes ----------------------------------------------
-    inline_codes: list[str] = []
-    _re_inline = re.compile(r"`([^`]+)`")
-
-    def _replace_inline(m: re.Match) -> str:
-        inline_codes.append(m.group(1))
-        return f"\x00IC{len(inline_codes) - 1}\x00"
-
-    text = _re_inline.sub(_replace_inline, text)
-
-    # -- strip markdown headers --------------------------------------------
-    text = re.sub(r"^#{1,6}\s+(.+)$", r"\1", text, flags=re.MULTILINE)
-
-    # -- strip blockquotes -------------------------------------------------
-    text = re.sub(r"^>\s*(.*)$", r"\1", text, flags=re.MULTILINE)
-
-    # -- escape HTML entities in the remaining text -------------------------
-    text = _escape_html(text)
-
-    # -- markdown links -> HTML anchors ------------------------------------
-    text = re.sub(
-        r"\[([^\]]+)\]\(([^)]+)\)",
-        r'<a href="\2">\1</a>',
-        text,
-    )
-
-    # -- bold (**text** and __text__) -> <b> --------------------------------
-    text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
-    text = re.sub(r"__(.+?)__", r"<b>\1</b>", text)
-
-    # -- italic (_text_) -> <i> --------------------------------------------
-    text = re.sub(r"_([^_]+)_", r"<i>\1</i>", text)
-
-    # -- strikethrough (~~text~~) -> <s> -----------------------------------
-    text = re.sub(r"~~(.+?)~~", r"<s>\1</s>", text)
-
-    # -- list markers (- item, * item) -> bullet ----------------------------
-    text = re.sub(r"^[-*]\s+", "• ", text, flags=re.MULTILINE)
-
-    # -- re-insert inline codes --------------------------------------------
-    for i, code in enumerate(inline_codes):
-        escaped = _escape_html(code)
-        text = text.replace(f"\x00IC{i}\x00", f"<code>{escaped}</code>")
-
-    # -- re-insert code blocks ---------------------------------------------
-    for i, code in enumerate(code_blocks):
-        escaped = _escape_html(code)
-        text = text.replace(
-            f"\x00CB{i}\x00", f"<pre><code>{escaped}</code></pre>"
-        )
-
-    return text
+async def _download_to_temp(tg_file: Any, suffix: str) -> str:
+    """Download a Telegram file to a temporary path and return it."""
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=_MEDIA_TMP_DIR)
+    os.close(fd)
+    await tg_file.download_to_drive(path)
+    return path
 
 
 # ---------------------------------------------------------------------------
@@ -333,13 +259,9 @@ class TelegramChannel(BaseChannel):
                 photo = msg.photo[-1]
                 try:
                     tg_file = await photo.get_file()
-                    tmp = tempfile.NamedTemporaryFile(
-                        suffix=".jpg", delete=False
-                    )
-                    tmp.close()
-                    await tg_file.download_to_drive(tmp.name)
-                    local_files.append(tmp.name)
-                    media_paths.append(tmp.name)
+                    path = await _download_to_temp(tg_file, ".jpg")
+                    local_files.append(path)
+                    media_paths.append(path)
                     if content:
                         content += "\n"
                     content += "[image: photo]"
@@ -350,13 +272,9 @@ class TelegramChannel(BaseChannel):
             if msg.voice:
                 try:
                     tg_file = await msg.voice.get_file()
-                    tmp = tempfile.NamedTemporaryFile(
-                        suffix=".ogg", delete=False
-                    )
-                    tmp.close()
-                    await tg_file.download_to_drive(tmp.name)
-                    local_files.append(tmp.name)
-                    media_paths.append(tmp.name)
+                    path = await _download_to_temp(tg_file, ".ogg")
+                    local_files.append(path)
+                    media_paths.append(path)
                     if content:
                         content += "\n"
                     content += "[voice]"
@@ -367,13 +285,9 @@ class TelegramChannel(BaseChannel):
             if msg.audio:
                 try:
                     tg_file = await msg.audio.get_file()
-                    tmp = tempfile.NamedTemporaryFile(
-                        suffix=".mp3", delete=False
-                    )
-                    tmp.close()
-                    await tg_file.download_to_drive(tmp.name)
-                    local_files.append(tmp.name)
-                    media_paths.append(tmp.name)
+                    path = await _download_to_temp(tg_file, ".mp3")
+                    local_files.append(path)
+                    media_paths.append(path)
                     if content:
                         content += "\n"
                     content += "[audio]"
@@ -384,13 +298,9 @@ class TelegramChannel(BaseChannel):
             if msg.document:
                 try:
                     tg_file = await msg.document.get_file()
-                    tmp = tempfile.NamedTemporaryFile(
-                        suffix="", delete=False
-                    )
-                    tmp.close()
-                    await tg_file.download_to_drive(tmp.name)
-                    local_files.append(tmp.name)
-                    media_paths.append(tmp.name)
+                    path = await _download_to_temp(tg_file, "")
+                    local_files.append(path)
+                    media_paths.append(path)
                     if content:
                         content += "\n"
                     content += "[file]"
@@ -0,0 +1,230 @@
+"""Markdown -> Telegram HTML conversion.
+
+Kept free of channel and third-party imports so it can be compiled with
+mypyc (see ``[tool.hatch.build.targets.wheel.hooks.mypyc]`` in
+pyproject.toml); the pure-Python module is used otherwise.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import re
+
+MAX_MESSAGE_LENGTH = 4096
+
+
+def _escape_html(text: str) -> str:
+    """Escape HTML entities in *text*."""
+    # Chained replace() beats str.translate here: translate with a str->str
+    # table goes through CPython's slow per-character mapping path and is an
+    # order of magnitude slower on code-heavy text.
+    text = text.replace("&", "&amp;")
+    text = text.replace("<", "&lt;")
+    text = text.replace(">", "&gt;")
+    return text
+
+
+# Characters the scanner has to stop at; everything else is copied in runs
+_MD_SPECIAL_RE = re.compile(r"[`*_~\[&<>\n]")
+_HTML_ENTITIES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+# Paired inline markers: (marker, tag, closing marker may be on a later line)
+_MD_EMPHASIS = (("**", "b", False), ("__", "b", False), ("~~", "s", False), ("_", "i", True))
+
+
+def _code_spans(text: str) -> tuple[list[int], list[int], list[str]]:
+    """Locate fenced blocks and inline code: parallel (starts, ends, html) lists."""
+    starts: list[int] = []
+    ends: list[int] = []
+    html: list[str] = []
+    i = text.find("`")
+    while i != -1:
+        if text.startswith("```", i):
+            close = text.find("```", i + 3)
+            if close != -1:
+                # Skip the language tag and the newline after the fence
+                k = i + 3
+                while k < close and (text[k].isalnum() or text[k] == "_"):
+                    k += 1
+                if k < close and text[k] == "\n":
+                    k += 1
+                starts.append(i)
+                ends.append(close + 3)
+                html.append(f"<pre><code>{_escape_html(text[k:close])}</code></pre>")
+                i = text.find("`", close + 3)
+                continue
+        close = text.find("`", i + 1)
+        if close == -1:
+            break
+        if close > i + 1:
+            starts.append(i)
+            ends.append(close + 1)
+            html.append(f"<code>{_escape_html(text[i + 1:close])}</code>")
+            i = text.find("`", close + 1)
+        else:
+            i = close
+    return starts, ends, html
+
+
+def markdown_to_telegram_html(text: str) -> str:
+    """Convert a Markdown string to Telegram-compatible HTML.
+
+    Results for messages up to one Telegram message long are memoized, since
+    canned replies and repeated notices convert to the same HTML every time;
+    longer texts are converted directly so they do not crowd the cache.
+    See :func:`_convert_markdown` for the conversion rules.
+    """
+    if len(text) > MAX_MESSAGE_LENGTH:
+        return _convert_markdown(text)
+    return _convert_markdown_cached(text)
+
+
+def _convert_markdown(text: str) -> str:
+    """Convert Markdown to Telegram HTML (uncached).
+
+    The conversion mirrors the Go ``markdownToTelegramHTML`` function, but is
+    done in one left-to-right scan instead of one regex pass per feature:
+
+    - Fenced code blocks and inline code are emitted escaped and verbatim.
+    - Markdown headers and blockquote markers are stripped at line start,
+      list markers (``- item``, ``* item``) become bullets.
+    - Links, bold, italic and strikethrough become ``<a>``, ``<b>``, ``<i>``
+      and ``<s>``; their contents are converted recursively, so the tags
+      always nest properly.
+    - Everything else is HTML-escaped.
+    """
+    if not text:
+        return ""
+
+    # Code spans are located up front so no closing marker is ever taken
+    # from inside one
+    span_starts, span_ends, span_html = _code_spans(text)
+    span_at = dict(zip(span_starts, zip(span_ends, span_html, strict=True), strict=True))
+
+    # Next occurrence of each marker. The scan only moves forward, so a cached
+    # position (or a cached miss) stays valid and lookups stay linear overall.
+    next_at: dict[str, int] = {}
+
+    def find(sub: str, start: int) -> int:
+        pos = next_at.get(sub)
+        if pos is None or (pos != -1 and pos < start):
+            pos = text.find(sub, start)
+            next_at[sub] = pos
+        return pos
+
+    def find_closer(sub: str, start: int, end: int) -> int:
+        """First *sub* at or after start and before end that is not inside code."""
+        pos = find(sub, start)
+        while pos != -1 and pos < end:
+            k = bisect.bisect_right(span_starts, pos) - 1
+            if k < 0 or span_ends[k] <= pos:
+                return pos
+            pos = find(sub, span_ends[k])
+        return -1
+
+    out: list[str] = []
+    emit = out.append
+
+    def line_start(i: int, end: int) -> int:
+        """Strip a header, then a blockquote, then turn a list marker into a bullet."""
+        j = i
+        while j < end and j - i < 6 and text[j] == "#":
+            j += 1
+        if j > i and j < end and text[j] in " \t":
+            k = j
+            while k < end and text[k] in " \t":
+                k += 1
+            if k < end and text[k] != "\n":
+                i = k
+        if i < end and text[i] == ">":
+            i += 1
+            while i < end and text[i] in " \t":
+                i += 1
+        if i + 1 < end and text[i] in "-*" and text[i + 1] in " \t":
+            i += 2
+            while i < end and text[i] in " \t":
+                i += 1
+            emit("• ")
+        return i
+
+    def render(i: int, end: int) -> None:
+        while i < end:
+            if i == 0 or text[i - 1] == "\n":
+                i = line_start(i, end)
+                if i >= end:
+                    break
+            m = _MD_SPECIAL_RE.search(text, i, end)
+            if m is None:
+                emit(text[i:end])
+                break
+            j = m.start()
+            if j > i:
+                emit(text[i:j])
+            i = j
+            c = text[i]
+
+            if c in _HTML_ENTITIES:
+                emit(_HTML_ENTITIES[c])
+                i += 1
+                continue
+            if c == "\n":
+                emit(c)
+                i += 1
+                continue
+
+            if c == "`":
+                span = span_at.get(i)
+                if span is not None and span[0] <= end:
+                    emit(span[1])
+                    i = span[0]
+                else:
+                    emit(c)
+                    i += 1
+                continue
+
+            if c == "[":
+                mid = find_closer("]", i + 1, end)
+                if mid > i + 1 and mid + 1 < end and text[mid + 1] == "(":
+                    close = find_closer(")", mid + 2, end)
+                    if close > mid + 2:
+                        href = _escape_html(text[mid + 2:close]).replace('"', "&quot;")
+                        emit(f'<a href="{href}">')
+                        render(i + 1, mid)
+                        emit("</a>")
+                        i = close + 1
+                        continue
+                emit(c)
+                i += 1
+                continue
+
+            # *, _ or ~: emphasis when a closing marker follows
+            for marker, tag, multiline in _MD_EMPHASIS:
+                if not text.startswith(marker, i):
+                    continue
+                inner = i + len(marker)
+                # "**x**" needs one character of content, which may be "*";
+                # "_x_" needs content without any "_"
+                if len(marker) == 2:
+                    close = find_closer(marker, inner + 1, end - 1)
+                else:
+                    close = find_closer(marker, inner, end)
+                if close <= inner:
+                    continue
+                if not multiline:
+                    newline = find("\n", inner)
+                    if newline != -1 and newline < close:
+                        continue
+                emit(f"<{tag}>")
+                render(inner, close)
+                emit(f"</{tag}>")
+                i = close + len(marker)
+                break
+            else:
+                emit(c)
+                i += 1
+
+    render(0, len(text))
+    return "".join(out)
+
+
+_convert_markdown_cached = functools.lru_cache(maxsize=1024)(_convert_markdown)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 from pyclaw.bus.message_bus import MessageBus
@@ -12,6 +13,13 @@ from pyclaw.models import OutboundMessage
 
 logger = logging.getLogger(__name__)
 
+# access_token refresh scheduling (WeCom tokens live for ``expires_in`` seconds)
+_TOKEN_DEFAULT_TTL = 7200
+_TOKEN_REFRESH_MARGIN = 300
+_TOKEN_MIN_DELAY = 60
+_TOKEN_REQUEST_TIMEOUT = 30
+_TOKEN_RETRY_DELAYS = (5, 10, 30, 60)
+
 
 class WeComBotChannel(BaseChannel):
     """WeCom bot channel via webhook."""
@@ -50,10 +58,15 @@ class WeComAppChannel(BaseChannel):
         self._corp_secret = getattr(config, "corp_secret", "")
         self._agent_id = getattr(config, "agent_id", "")
         self._access_token = ""
+        self._token_expiry = 0.0
         self._token_task: asyncio.Task | None = None
 
     async def start(self) -> None:
-        await self._refresh_token()
+        try:
+            await self._refresh_token()
+        except Exception:
+            # The token loop retries on its backoff schedule
+            logger.exception("WeCom token fetch failed at startup")
         self._token_task = asyncio.create_task(self._token_loop())
         self._running = True
         logger.info("WeCom app channel started (corp: %s)", self._corp_id[:8])
@@ -84,13 +97,36 @@ class WeComAppChannel(BaseChannel):
                 "corpid": self._corp_id,
                 "corpsecret": self._corp_secret,
             })
+            resp.raise_for_status()
             data = resp.json()
-            self._access_token = data.get("access_token", "")
+        # Errors come back as HTTP 200 with a non-zero errcode and no token;
+        # raising keeps the old token and sends _token_loop into its backoff
+        token = data.get("access_token")
+        if data.get("errcode", 0) != 0 or not token:
+            raise RuntimeError(
+                f"WeCom gettoken failed: errcode={data.get('errcode')} {data.get('errmsg', '')}"
+            )
+        self._access_token = token
+        expires_in = data.get("expires_in", _TOKEN_DEFAULT_TTL)
+        self._token_expiry = time.monotonic() + expires_in
 
     async def _token_loop(self) -> None:
+        """Refresh the token shortly before it expires, backing off on errors."""
+        # Start in backoff when the startup fetch did not produce a token
+        failures = 0 if self._access_token else 1
         while self._running:
-            await asyncio.sleep(300)  # Refresh every 5 minutes
+            delay: float
+            if failures:
+                delay = _TOKEN_RETRY_DELAYS[min(failures, len(_TOKEN_RETRY_DELAYS)) - 1]
+            else:
+                remaining = self._token_expiry - time.monotonic()
+                delay = max(_TOKEN_MIN_DELAY, remaining - _TOKEN_REFRESH_MARGIN)
+            await asyncio.sleep(delay)
             try:
-                await self._refresh_token()
+                await asyncio.wait_for(self._refresh_token(), timeout=_TOKEN_REQUEST_TIMEOUT)
+                failures = 0
+            except asyncio.CancelledError:
+                raise
             except Exception:
-                logger.exception("WeCom token refresh failed")
+                failures += 1
+                logger.exception("WeCom token refresh failed (attempt %d)", failures)
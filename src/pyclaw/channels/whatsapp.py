@@ -11,8 +11,23 @@ from pyclaw.bus.message_bus import MessageBus
 from pyclaw.channels.base import BaseChannel
 from pyclaw.models import OutboundMessage
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Fields shared by every outbound frame sent to the bridge.
+_SEND_TEMPLATE: dict[str, str] = {"type": "message"}
+
+
+def _encode_payload(data: dict[str, Any]) -> bytes:
+    """Serialise *data* straight to UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class WhatsAppConfig:
     def __init__(self, bridge_url: str = "", allow_from: list[str] | None = None):
@@ -78,12 +93,11 @@ class WhatsAppChannel(BaseChannel):
             if self._ws is None:
                 raise RuntimeError("whatsapp connection not established")
 
-            payload = json.dumps({
-                "type": "message",
-                "to": msg.chat_id,
-                "content": msg.content,
-            })
-            await self._ws.send(payload)
+            payload = _encode_payload(
+                {**_SEND_TEMPLATE, "to": msg.chat_id, "content": msg.content}
+            )
+            # the bridge expects text frames; bytes would go out as binary
+            await self._ws.send(payload.decode())
 
     async def _listen(self) -> None:
         while self._running:
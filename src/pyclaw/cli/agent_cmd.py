@@ -13,6 +13,7 @@ from pyclaw.agent.loop import AgentLoop
 from pyclaw.bus.message_bus import MessageBus
 from pyclaw.config import load_config
 from pyclaw.config.models import AgentConfig
+from pyclaw.http_client import close_shared_http_client
 from pyclaw.providers.factory import create_provider
 from pyclaw.tools.exec_tool import ExecTool
 from pyclaw.tools.file_tools import (
@@ -46,40 +47,44 @@ async def run_agent(
     agent = loop._registry.get_default_agent()
     _register_tools(agent, cfg)
 
-    if message:
-        # One-shot mode
-        response = await loop.process_direct(message)
-        console.print(response)
-        return
-
-    # Interactive mode
-    console.print(f"[bold]pyclaw[/bold] (model: {model_name})")
-    console.print("Type your message. Use Ctrl+D or 'exit' to quit.\n")
-
-    history_file = f"{cfg.config_dir}/cli_history"
-    session: PromptSession[str] = PromptSession(history=FileHistory(history_file))
-
-    while True:
-        try:
-            user_input = await session.prompt_async("you> ")
-        except (EOFError, KeyboardInterrupt):
-            console.print("\nGoodbye!")
-            break
-
-        user_input = user_input.strip()
-        if not user_input:
-            continue
-        if user_input.lower() in ("exit", "quit", "/quit"):
-            console.print("Goodbye!")
-            break
-
-        # Handle slash commands
-        if user_input.startswith("/"):
-            _handle_slash(user_input, agent)
-            continue
-
-        response = await loop.process_direct(user_input)
-        console.print(f"\n[green]{agent.name}>[/green] {response}\n")
+    try:
+        if message:
+            # One-shot mode
+            response = await loop.process_direct(message)
+            console.print(response)
+            return
+
+        # Interactive mode
+        console.print(f"[bold]pyclaw[/bold] (model: {model_name})")
+        console.print("Type your message. Use Ctrl+D or 'exit' to quit.\n")
+
+        history_file = f"{cfg.config_dir}/cli_history"
+        session: PromptSession[str] = PromptSession(history=FileHistory(history_file))
+
+        while True:
+            try:
+                user_input = await session.prompt_async("you> ")
+            except (EOFError, KeyboardInterrupt):
+                console.print("\nGoodbye!")
+                break
+
+            user_input = user_input.strip()
+            if not user_input:
+                continue
+            if user_input.lower() in ("exit", "quit", "/quit"):
+                console.print("Goodbye!")
+                break
+
+            # Handle slash commands
+            if user_input.startswith("/"):
+                _handle_slash(user_input, agent)
+                continue
+
+            response = await loop.process_direct(user_input)
+            console.print(f"\n[green]{agent.name}>[/green] {response}\n")
+    finally:
+        # Release the pooled connections of the SDK clients and web tools
+        await close_shared_http_client()
 
 
 def _register_tools(agent: AgentInstance, cfg: "Config") -> None:
@@ -22,6 +22,7 @@ async def run_gateway(config_path: str | None = None) -> None:
     from pyclaw.channels.base import ChannelManager
     from pyclaw.cli.agent_cmd import _register_tools
     from pyclaw.config import load_config
+    from pyclaw.http_client import close_shared_http_client
     from pyclaw.providers.factory import create_provider
     from pyclaw.services.cron_service import CronService
     from pyclaw.services.heartbeat import HeartbeatService
@@ -55,6 +56,7 @@ async def run_gateway(config_path: str | None = None) -> None:
         workspace=workspace,
         interval_minutes=cfg.heartbeat.interval,
         enabled=cfg.heartbeat.enabled,
+        skip_unchanged=cfg.heartbeat.skip_unchanged,
     )
 
     # 6. Start everything
@@ -99,10 +101,12 @@ async def run_gateway(config_path: str | None = None) -> None:
     console.print("\n[yellow]Shutting down...[/yellow]")
     heartbeat_svc.stop()
     cron_svc.stop()
+    bus.close()
     await channel_mgr.stop_all()
     health_task.cancel()
     dispatch_task.cancel()
     agent_task.cancel()
+    await close_shared_http_client()
     console.print("[green]Shutdown complete.[/green]")
 
 
@@ -124,10 +128,24 @@ def _init_channels(cfg: Any, bus: "MessageBus", mgr: "ChannelManager") -> None:
 async def _dispatch_outbound(bus: "MessageBus", mgr: "ChannelManager") -> None:
     """Route outbound messages to the correct channel."""
     while True:
-        msg = await bus.consume_outbound()
-        if msg is None:
+        batch = await bus.consume_outbound_batch()
+        if not batch:
+            if bus.closed:
+                break
             continue
-        await mgr.send_to_channel(msg.channel, msg.chat_id, msg.content)
+        # One send_many call per channel; order within a channel is kept
+        by_channel: dict[str, list[tuple[str, str]]] = {}
+        for msg in batch:
+            by_channel.setdefault(msg.channel, []).append((msg.chat_id, msg.content))
+        for channel, items in by_channel.items():
+            try:
+                await mgr.send_to_channel_batch(channel, items)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Failed to dispatch outbound message to %s", channel, exc_info=True
+                )
 
 
 async def _start_health_server(host: str, port: int) -> None:
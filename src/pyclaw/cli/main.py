@@ -3,17 +3,59 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import sys
+from collections.abc import Coroutine
+from typing import Any
 
 import typer
 from rich.console import Console
+from typer.core import TyperGroup
 
 from pyclaw import __version__
 
+# Sub-command groups, imported only when one of them is actually invoked
+# (or listed by --help) so plain commands skip loading their modules.
+_LAZY_SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "auth": ("pyclaw.cli.auth_cmd", "auth_app"),
+    "cron": ("pyclaw.cli.cron_cmd", "cron_app"),
+    "skills": ("pyclaw.cli.skills_cmd", "skills_app"),
+}
+
+
+class _LazyGroup(TyperGroup):
+    """Click group that resolves the sub-command groups on first use."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        base = super().list_commands(ctx)
+        # A group already resolved by get_command() is in base as well
+        return [*base, *(name for name in _LAZY_SUBCOMMANDS if name not in base)]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name in _LAZY_SUBCOMMANDS and cmd_name not in self.commands:
+            module_name, attr = _LAZY_SUBCOMMANDS[cmd_name]
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            self.add_command(typer.main.get_command(sub_app), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coro* on uvloop when it is installed, else the default loop."""
+    if sys.platform != "win32":
+        try:
+            import uvloop  # type: ignore[import-not-found, unused-ignore]
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 app = typer.Typer(
     name="pyclaw",
     help="Ultra-lightweight personal AI assistant",
     no_args_is_help=True,
+    cls=_LazyGroup,
 )
 console = Console()
 
@@ -27,7 +69,7 @@ def agent(
     """Interactive chat or one-shot message with the agent."""
     from pyclaw.cli.agent_cmd import run_agent
 
-    asyncio.run(run_agent(message=message, config_path=config, model_override=model))
+    _run(run_agent(message=message, config_path=config, model_override=model))
 
 
 @app.command()
@@ -67,17 +109,7 @@ def gateway(
     """Start multi-channel gateway server."""
     from pyclaw.cli.gateway_cmd import run_gateway
 
-    asyncio.run(run_gateway(config_path=config))
-
-
-# Register sub-command groups
-from pyclaw.cli.auth_cmd import auth_app
-from pyclaw.cli.cron_cmd import cron_app
-from pyclaw.cli.skills_cmd import skills_app
-
-app.add_typer(auth_app)
-app.add_typer(cron_app)
-app.add_typer(skills_app)
+    _run(run_gateway(config_path=config))
 
 
 def main() -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -175,9 +176,15 @@ def _default_model(provider: str) -> str:
     }.get(provider, "gpt-4o")
 
 
-def _write_if_missing(path: Path, content: str) -> None:
-    if not path.exists():
-        path.write_text(content, encoding="utf-8")
+def _write_if_missing(path: Path, content: str) -> bool:
+    """Create *path* with *content* unless it already exists (atomic check)."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
 
 
 def _build_identity(agent_name: str, use_case: str) -> str:
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
 import shutil
 from pathlib import Path
 
 import typer
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 console = Console()
 skills_app = typer.Typer(name="skills", help="Manage skill packages")
 
@@ -21,29 +28,32 @@ def list_skills() -> None:
     workspace = Path(cfg.agents.defaults.workspace).expanduser()
     skills_dir = workspace / "skills"
 
-    if not skills_dir.exists():
-        console.print("No skills installed.")
-        return
-
-    skills = [d for d in sorted(skills_dir.iterdir()) if d.is_dir()]
+    try:
+        with os.scandir(skills_dir) as it:
+            skills = sorted(
+                (e for e in it if e.is_dir()), key=lambda e: e.name
+            )
+    except FileNotFoundError:
+        skills = []
     if not skills:
         console.print("No skills installed.")
         return
 
     console.print(f"[bold]Installed skills ({len(skills)}):[/bold]")
-    for skill_dir in skills:
-        skill_file = skill_dir / "SKILL.md"
-        origin_file = skill_dir / ".skill-origin.json"
-
-        name = skill_dir.name
+    for entry in skills:
         source = ""
-        if origin_file.exists():
-            import json
-            origin = json.loads(origin_file.read_text())
+        try:
+            with open(os.path.join(entry.path, ".skill-origin.json"), "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            pass
+        else:
+            origin = orjson.loads(raw) if orjson is not None else json.loads(raw)
             source = f" (from {origin.get('registry', '?')})"
 
-        has_def = "[green]SKILL.md[/green]" if skill_file.exists() else "[dim]no SKILL.md[/dim]"
-        console.print(f"  {name}{source} — {has_def}")
+        has_skill_md = os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        has_def = "[green]SKILL.md[/green]" if has_skill_md else "[dim]no SKILL.md[/dim]"
+        console.print(f"  {entry.name}{source} — {has_def}")
 
 
 @skills_app.command("show")
@@ -103,12 +113,14 @@ def install_builtin() -> None:
     for name, content in builtins.items():
         target = skills_dir / name
         target.mkdir(exist_ok=True)
-        skill_file = target / "SKILL.md"
-        if not skill_file.exists():
-            skill_file.write_text(content)
-            console.print(f"  Installed: {name}")
-            installed += 1
-        else:
+        try:
+            fd = os.open(target / "SKILL.md", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
             console.print(f"  Skipped (exists): {name}")
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        console.print(f"  Installed: {name}")
+        installed += 1
 
     console.print(f"[green]{installed} built-in skill(s) installed.[/green]")
@@ -1,23 +1,66 @@
-"""Configuration system for pyclaw."""
-
-from pyclaw.config.models import (
-    AgentConfig,
-    AgentDefaults,
-    AgentsConfig,
-    ChannelsConfig,
-    Config,
-    CronToolsConfig,
-    DevicesConfig,
-    ExecConfig,
-    GatewayConfig,
-    HeartbeatConfig,
-    ModelConfig,
-    ProviderConfig,
-    ProvidersConfig,
-    ToolsConfig,
-    WebToolsConfig,
-)
-from pyclaw.config.loader import load_config
+"""Configuration system for pyclaw.
+
+Names are resolved lazily (PEP 562) so importing a submodule such as
+``pyclaw.config.models`` does not also import the loader and YAML stack.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyclaw.config.loader import load_config
+    from pyclaw.config.models import (
+        AgentConfig,
+        AgentDefaults,
+        AgentsConfig,
+        ChannelsConfig,
+        Config,
+        CronToolsConfig,
+        DevicesConfig,
+        ExecConfig,
+        GatewayConfig,
+        HeartbeatConfig,
+        ModelConfig,
+        ProviderConfig,
+        ProvidersConfig,
+        ToolsConfig,
+        WebToolsConfig,
+    )
+
+_LAZY: dict[str, str] = {
+    "AgentConfig": "pyclaw.config.models",
+    "AgentDefaults": "pyclaw.config.models",
+    "AgentsConfig": "pyclaw.config.models",
+    "ChannelsConfig": "pyclaw.config.models",
+    "Config": "pyclaw.config.models",
+    "CronToolsConfig": "pyclaw.config.models",
+    "DevicesConfig": "pyclaw.config.models",
+    "ExecConfig": "pyclaw.config.models",
+    "GatewayConfig": "pyclaw.config.models",
+    "HeartbeatConfig": "pyclaw.config.models",
+    "ModelConfig": "pyclaw.config.models",
+    "ProviderConfig": "pyclaw.config.models",
+    "ProvidersConfig": "pyclaw.config.models",
+    "ToolsConfig": "pyclaw.config.models",
+    "WebToolsConfig": "pyclaw.config.models",
+    "load_config": "pyclaw.config.loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
+
 
 __all__ = [
     "AgentConfig",
@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 
 import yaml
+from pydantic import TypeAdapter
 
 from pyclaw.config.models import Config
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_DIR = Path.home() / ".pyclaw"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "config.yaml"
 
+_CONFIG_ADAPTER: TypeAdapter[Config] = TypeAdapter(Config)
+# Pristine defaults, built once without validation and copied per call
+_DEFAULT_CONFIG = Config.model_construct()
+
 
 def load_config(path: Path | str | None = None) -> Config:
     """Load configuration from a YAML or JSON file.
@@ -24,45 +43,100 @@ def load_config(path: Path | str | None = None) -> Config:
     2. ~/.pyclaw/config.yaml
     3. ~/.pyclaw/config.json
     4. Default config
+
+    Parsed files are memoised by resolved path and mtime; each call returns
+    a private copy so callers may mutate it. Use ``load_config.cache_clear()``
+    to drop the cache.
     """
     if path is not None:
         config_path = Path(path)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
-        return _load_from_file(config_path)
-
-    # Try default locations
+    else:
+        found = _default_config_path()
+        if found is None:
+            logger.info("No config file found, using defaults")
+            return _DEFAULT_CONFIG.model_copy(deep=True)
+        config_path = found
+
+    resolved = config_path.resolve()
+    try:
+        mtime_ns = resolved.stat().st_mtime_ns
+    except FileNotFoundError:
+        if path is not None:
+            raise
+        # The default file was removed since it was found
+        logger.info("No config file found, using defaults")
+        return _DEFAULT_CONFIG.model_copy(deep=True)
+    cfg = _load_cached(str(resolved), mtime_ns)
+    return cfg.model_copy(deep=True)
+
+
+def _default_config_path() -> Path | None:
+    """Return the first existing default config file, if any.
+
+    Not cached: the files may be created or removed between calls, and the
+    lookup is at most three stat() calls.
+    """
     for candidate in [
         DEFAULT_CONFIG_DIR / "config.yaml",
         DEFAULT_CONFIG_DIR / "config.yml",
         DEFAULT_CONFIG_DIR / "config.json",
     ]:
         if candidate.exists():
-            logger.info("Loading config from %s", candidate)
-            return _load_from_file(candidate)
+            return candidate
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int) -> Config:
+    logger.info("Loading config from %s", path)
+    return _load_from_file(Path(path))
+
 
-    logger.info("No config file found, using defaults")
-    return Config()
+def _cache_clear() -> None:
+    _load_cached.cache_clear()
+
+
+load_config.cache_clear = _cache_clear  # type: ignore[attr-defined]
 
 
 def _load_from_file(path: Path) -> Config:
     """Load config from a specific file."""
-    raw = path.read_text(encoding="utf-8")
-
     if path.suffix in (".yaml", ".yml"):
-        data = yaml.safe_load(raw) or {}
+        data = yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
     elif path.suffix == ".json":
-        data = json.loads(raw)
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     else:
         raise ValueError(f"Unsupported config format: {path.suffix}")
 
-    return Config.model_validate(data)
+    return _CONFIG_ADAPTER.validate_python(data)
 
 
-def save_config(config: Config, path: Path | None = None) -> None:
-    """Save configuration to a YAML file."""
+def save_config(config: Config, path: Path | None = None, fmt: str | None = None) -> None:
+    """Save configuration to a YAML (default) or JSON file.
+
+    *fmt* is ``"yaml"`` or ``"json"``; when omitted it is inferred from
+    the target's suffix. The file is replaced atomically.
+    """
     target = path or DEFAULT_CONFIG_FILE
-    target.parent.mkdir(parents=True, exist_ok=True)
+    fmt = fmt or ("json" if target.suffix == ".json" else "yaml")
     data = config.model_dump(exclude_defaults=True)
-    target.write_text(yaml.dump(data, default_flow_style=False), encoding="utf-8")
+
+    if fmt == "yaml":
+        payload = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False).encode("utf-8")
+    elif fmt == "json":
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+    else:
+        raise ValueError(f"Unsupported config format: {fmt}")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, target)
+    _cache_clear()
     logger.info("Config saved to %s", target)
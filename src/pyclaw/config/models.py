@@ -180,6 +180,7 @@ class GatewayConfig(BaseModel):
 class HeartbeatConfig(BaseModel):
     enabled: bool = False
     interval: int = 30  # minutes
+    skip_unchanged: bool = False  # don't re-run tasks until HEARTBEAT.md changes
 
 
 class DevicesConfig(BaseModel):
@@ -0,0 +1,38 @@
+"""Process-wide HTTP connection pool.
+
+The OpenAI/Anthropic SDK clients built by the provider factory and the web
+tools all send requests through one client, so there is a single pool to
+create lazily and a single close_shared_http_client() to call on shutdown.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+from openai import DefaultAsyncHttpxClient
+
+_http_client: DefaultAsyncHttpxClient | None = None
+
+
+def shared_http_client() -> DefaultAsyncHttpxClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Sharing one pool lets fallback candidates on the same host reuse warm
+    keep-alive connections instead of paying a TLS handshake each. The SDK's
+    own default client class is used so its connection limits, timeouts and
+    httpx flavour match what both SDKs accept; the web tools pass their own
+    per-request timeouts. HTTP/2 is enabled when the optional ``h2`` package
+    is installed.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = DefaultAsyncHttpxClient(http2=importlib.util.find_spec("h2") is not None)
+    return _http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client (call once on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import math
+import operator
 import os
+import re
 import time
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_SNAPSHOT_RE = re.compile(r"vectors\.(\d+)\.(npy|meta\.json|json|log)$")
+
+# Appended entries are folded into the snapshot once the log outgrows it
+# (but never before it reaches this size).
+_MIN_COMPACT_BYTES = 64 * 1024
+
 
 class SemanticMemory:
     """In-process vector store using cosine similarity.
 
     Stores text chunks with their embeddings for semantic search.
-    Uses a simple JSON file for persistence and supports pluggable
-    embedding backends (OpenAI, local sentence-transformers).
+    Embeddings persist as a float32 ``vectors.<gen>.npy`` with a JSON
+    metadata sidecar when numpy is available (plain JSON otherwise) and supports
+    pluggable embedding backends (OpenAI, local sentence-transformers).
+    New entries are appended to ``vectors.<gen>.log`` (JSON lines) and
+    folded into the next snapshot when the log grows larger than it. A store
+    whose newest snapshot needs numpy is read-only in a process without it.
     """
 
     def __init__(
@@ -25,62 +52,293 @@ class SemanticMemory:
         workspace: str,
         embed_fn: EmbedFunction | None = None,
         dimensions: int = 384,
+        embed_batch_fn: EmbedBatchFunction | None = None,
+        save_delay: float = 0.0,
     ) -> None:
         self._workspace = workspace
-        self._store_path = os.path.join(workspace, "memory", "vectors.json")
+        self._dir = os.path.join(workspace, "memory")
+        # Snapshots are numbered: vectors.<gen>.npy + vectors.<gen>.meta.json
+        # (meta written last, so it commits the pair) or vectors.<gen>.json.
+        # Entries added after snapshot <gen> go to vectors.<gen>.log, so a
+        # snapshot never replays a log it already contains. The newest
+        # complete generation wins; older ones (and their logs) are removed
+        # only after a newer one is committed.
+        self._generation = 0
+        # Set (to the reason) when a newer snapshot could not be read. Saving
+        # would then delete it, so the store refuses writes.
+        self._read_only: str | None = None
+        # O_APPEND descriptor for vectors.<gen>.log, opened on first append;
+        # readable so a torn tail can be detected
+        self._log_fd: int | None = None
+        self._log_bytes = 0
+        self._snapshot_bytes = 0
         self._embed_fn = embed_fn
+        self._embed_batch_fn = embed_batch_fn
         self._dimensions = dimensions
         self._entries: list[VectorEntry] = []
+        # Row-normalised float32 copy of all embeddings, built lazily for search
+        # and then grown in place: rows [0, _matrix_rows) of a buffer with
+        # spare capacity, so adds do not force a full rebuild.
+        self._matrix: Any = None
+        self._matrix_rows = 0
+        # save_delay > 0 coalesces writes: adds mark the store dirty and a
+        # timer flushes it once; call flush() before shutdown.
+        self._save_delay = save_delay
+        self._dirty = False
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._load()
 
     def _load(self) -> None:
-        if os.path.isfile(self._store_path):
+        snapshots = self._scan_snapshots()
+        for gen in sorted(snapshots, reverse=True):
+            kinds = snapshots[gen]
+            if kinds == {"log"}:
+                continue  # entries appended before any snapshot existed
+            if "npy" in kinds and "meta.json" in kinds:
+                if np is None:
+                    self._read_only = (
+                        f"semantic memory snapshot {gen} needs numpy; "
+                        "the store is read-only until numpy is installed"
+                    )
+                    logger.warning("%s", self._read_only)
+                    continue
+                if self._load_npy(gen):
+                    self._generation = gen
+                    break
+            elif kinds & {"json", "legacy"} and self._load_json(gen):
+                self._generation = gen
+                break
+            # Torn or corrupt generation (e.g. a crash mid-save): try the previous one
+            logger.warning("Semantic memory snapshot %d is incomplete; using an older one", gen)
+            self._entries = []
+        self._snapshot_bytes = self._snapshot_size()
+        self._replay_log()
+        self._matrix = None
+
+    def _scan_snapshots(self) -> dict[int, set[str]]:
+        """Map each snapshot generation on disk to the file kinds it has."""
+        snapshots: dict[int, set[str]] = {}
+        try:
+            names = os.listdir(self._dir)
+        except FileNotFoundError:
+            return snapshots
+        for name in names:
+            m = _SNAPSHOT_RE.match(name)
+            if m:
+                snapshots.setdefault(int(m.group(1)), set()).add(m.group(2))
+            elif name == "vectors.json":
+                # Unnumbered JSON store from before snapshots were versioned
+                snapshots.setdefault(0, set()).add("legacy")
+        return snapshots
+
+    def _snapshot_file(self, gen: int, kind: str) -> str:
+        if kind == "legacy":
+            return os.path.join(self._dir, "vectors.json")
+        return os.path.join(self._dir, f"vectors.{gen}.{kind}")
+
+    def _log_path(self) -> str:
+        return self._snapshot_file(self._generation, "log")
+
+    def _replay_log(self) -> None:
+        try:
+            with open(self._log_path(), "rb") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            self._log_bytes += len(line) + 1
             try:
-                with open(self._store_path) as f:
-                    data = json.load(f)
-                self._entries = [
+                e = json.loads(line)
+                self._entries.append(
                     VectorEntry(
                         text=e["text"],
                         embedding=e["embedding"],
                         metadata=e.get("metadata", {}),
                         timestamp=e.get("timestamp", 0),
                     )
-                    for e in data
-                ]
-            except (json.JSONDecodeError, KeyError):
-                logger.warning("Failed to load semantic memory, starting fresh")
-                self._entries = []
+                )
+            except (ValueError, KeyError):
+                # A torn final write is expected after a crash; skip it
+                logger.warning("Skipping malformed semantic memory log record")
+
+    def _load_npy(self, gen: int) -> bool:
+        try:
+            # Memory-mapped: entry embeddings are row views into the file
+            vectors = np.load(self._snapshot_file(gen, "npy"), mmap_mode="r")
+            with open(self._snapshot_file(gen, "meta.json"), "rb") as f:
+                meta = json.load(f)
+            if vectors.ndim != 2 or len(meta) != vectors.shape[0]:
+                raise ValueError("vector/metadata length mismatch")
+            self._entries = [
+                VectorEntry(
+                    text=m["text"],
+                    embedding=vectors[i],
+                    metadata=m.get("metadata", {}),
+                    timestamp=m.get("timestamp", 0),
+                )
+                for i, m in enumerate(meta)
+            ]
+        except (OSError, ValueError, KeyError):
+            return False
+        return True
+
+    def _load_json(self, gen: int) -> bool:
+        kind = "json" if os.path.isfile(self._snapshot_file(gen, "json")) else "legacy"
+        try:
+            with open(self._snapshot_file(gen, kind), "rb") as f:
+                data = json.load(f)
+            self._entries = [
+                VectorEntry(
+                    text=e["text"],
+                    embedding=e["embedding"],
+                    metadata=e.get("metadata", {}),
+                    timestamp=e.get("timestamp", 0),
+                )
+                for e in data
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return True
+
+    def _check_writable(self) -> None:
+        if self._read_only is not None:
+            raise RuntimeError(self._read_only)
 
     def _save(self) -> None:
-        os.makedirs(os.path.dirname(self._store_path), exist_ok=True)
+        self._check_writable()
+        os.makedirs(self._dir, exist_ok=True)
+        self._close_log()
+        existing = self._scan_snapshots()
+        gen = max(existing, default=0) + 1
+        saved = False
+        if np is not None:
+            try:
+                vectors = self._stack_embeddings()
+            except ValueError:
+                vectors = None  # mixed dimensions cannot share one matrix
+            if vectors is not None:
+                self._save_npy(gen, vectors)
+                saved = True
+        if not saved:
+            self._save_json(gen)
+        self._generation = gen
+        # Only now that the new generation is complete can older ones go
+        for old in existing:
+            for kind in existing[old]:
+                _remove_if_exists(self._snapshot_file(old, kind))
+        # The snapshot holds everything the old log did; appends start a new one
+        self._log_bytes = 0
+        self._snapshot_bytes = self._snapshot_size()
+
+    def _snapshot_size(self) -> int:
+        return sum(
+            os.path.getsize(p)
+            for p in (
+                self._snapshot_file(self._generation, kind)
+                for kind in ("npy", "meta.json", "json", "legacy")
+            )
+            if os.path.isfile(p)
+        )
+
+    def _append_log(self, entries: list[VectorEntry]) -> None:
+        payload = b"".join(
+            _dump_json(
+                {
+                    "text": e.text,
+                    "embedding": _as_list(e.embedding),
+                    "metadata": e.metadata,
+                    "timestamp": e.timestamp,
+                }
+            )
+            + b"\n"
+            for e in entries
+        )
+        if self._log_fd is None:
+            os.makedirs(self._dir, exist_ok=True)
+            flags = os.O_RDWR | os.O_APPEND | os.O_CREAT
+            self._log_fd = os.open(self._log_path(), flags, 0o644)
+            # A crash can leave a torn last line; start ours on a fresh one
+            if _ends_mid_line(self._log_fd):
+                payload = b"\n" + payload
+        os.write(self._log_fd, payload)
+        self._log_bytes += len(payload)
+        if self._log_bytes > max(self._snapshot_bytes, _MIN_COMPACT_BYTES):
+            self._save()
+
+    def _close_log(self) -> None:
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def _save_npy(self, gen: int, vectors: Any) -> None:
+        tmp = self._snapshot_file(gen, "npy") + ".tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, vectors)
+        os.replace(tmp, self._snapshot_file(gen, "npy"))
+
+        # Written last: until this file exists the generation is incomplete
+        meta = [
+            {"text": e.text, "metadata": e.metadata, "timestamp": e.timestamp}
+            for e in self._entries
+        ]
+        _write_atomic(self._snapshot_file(gen, "meta.json"), _dump_json(meta))
+
+    def _save_json(self, gen: int) -> None:
         data = [
             {
                 "text": e.text,
-                "embedding": e.embedding,
+                "embedding": _as_list(e.embedding),
                 "metadata": e.metadata,
                 "timestamp": e.timestamp,
             }
             for e in self._entries
         ]
-        tmp = self._store_path + ".tmp"
-        with open(tmp, "w") as f:
-            json.dump(data, f)
-        os.replace(tmp, self._store_path)
+        _write_atomic(self._snapshot_file(gen, "json"), _dump_json(data))
+
+    def _stack_embeddings(self) -> Any:
+        """Stack all embeddings into a new (N, D) float32 array.
+
+        Raises ValueError when the embeddings do not share one dimension.
+        """
+        if not self._entries:
+            return np.zeros((0, self._dimensions), dtype=np.float32)
+        matrix = np.asarray([e.embedding for e in self._entries], dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("embeddings have mixed dimensions")
+        return matrix
 
     async def add(self, text: str, metadata: dict[str, Any] | None = None) -> None:
         """Add a text chunk to semantic memory."""
+        self._check_writable()
         embedding = await self._get_embedding(text)
         if embedding is None:
             return
-        self._entries.append(
-            VectorEntry(
-                text=text,
-                embedding=embedding,
-                metadata=metadata or {},
-                timestamp=int(time.time()),
-            )
+        entry = VectorEntry(
+            text=text,
+            embedding=embedding,
+            metadata=metadata or {},
+            timestamp=int(time.time()),
         )
-        self._save()
+        self._entries.append(entry)
+        self._extend_matrix([entry])
+        self._schedule_save([entry])
+
+    async def add_many(self, items: list[tuple[str, dict[str, Any] | None]]) -> None:
+        """Add several text chunks, embedding them in one batch and saving once."""
+        if not items:
+            return
+        self._check_writable()
+        embeddings = await self._get_embeddings_batch([text for text, _ in items])
+        now = int(time.time())
+        added = [
+            VectorEntry(text=text, embedding=embedding, metadata=metadata or {}, timestamp=now)
+            for (text, metadata), embedding in zip(items, embeddings, strict=True)
+            if embedding is not None
+        ]
+        if added:
+            self._entries.extend(added)
+            self._extend_matrix(added)
+            self._schedule_save(added)
 
     async def search(self, query: str, top_k: int = 5, threshold: float = 0.3) -> list[SearchResult]:
         """Search for semantically similar entries."""
@@ -88,6 +346,11 @@ class SemanticMemory:
         if query_emb is None:
             return []
 
+        if np is not None:
+            matrix = self._normalized_matrix()
+            if matrix is not None and matrix.shape[1] == len(query_emb):
+                return self._search_matrix(matrix, query_emb, top_k, threshold)
+
         results = []
         for entry in self._entries:
             score = _cosine_similarity(query_emb, entry.embedding)
@@ -97,19 +360,117 @@ class SemanticMemory:
         results.sort(key=lambda r: r.score, reverse=True)
         return results[:top_k]
 
+    def _normalized_matrix(self) -> Any:
+        """Return the (N, D) matrix of unit-length embeddings, or None."""
+        if self._matrix is None and self._entries:
+            try:
+                matrix = self._stack_embeddings()
+            except ValueError:
+                # Ragged embeddings (mixed dimensions) — use the scalar path
+                return None
+            self._matrix = _normalize_rows(matrix)
+            self._matrix_rows = matrix.shape[0]
+        if self._matrix is None:
+            return None
+        return self._matrix[: self._matrix_rows]
+
+    def _extend_matrix(self, added: list[VectorEntry]) -> None:
+        """Append rows for new entries to the search matrix, if one is built."""
+        if self._matrix is None or np is None:
+            self._matrix = None
+            return
+        rows = np.asarray([e.embedding for e in added], dtype=np.float32)
+        if rows.ndim != 2 or rows.shape[1] != self._matrix.shape[1]:
+            # Different dimension: rebuild (or fall back) on the next search
+            self._matrix = None
+            return
+        n = self._matrix_rows
+        needed = n + rows.shape[0]
+        if needed > self._matrix.shape[0]:
+            grown = np.empty((max(needed, 2 * self._matrix.shape[0]), rows.shape[1]), np.float32)
+            grown[:n] = self._matrix[:n]
+            self._matrix = grown
+        self._matrix[n:needed] = _normalize_rows(rows)
+        self._matrix_rows = needed
+
+    def _search_matrix(
+        self, matrix: Any, query_emb: list[float], top_k: int, threshold: float
+    ) -> list[SearchResult]:
+        query = np.asarray(query_emb, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or top_k <= 0:
+            return []
+        scores = matrix @ (query / norm)
+
+        k = min(top_k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k] if k < scores.shape[0] else np.arange(k)
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for i in top:
+            score = float(scores[i])
+            if score < threshold:
+                break
+            entry = self._entries[i]
+            results.append(SearchResult(text=entry.text, score=score, metadata=entry.metadata))
+        return results
+
     def count(self) -> int:
         return len(self._entries)
 
     def clear(self) -> None:
+        self._check_writable()
         self._entries = []
+        self._matrix = None
+        self._cancel_flush()
+        self._dirty = False
         self._save()
 
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        self._cancel_flush()
+        if self._dirty:
+            self._dirty = False
+            self._save()
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with all entries and drop the append log."""
+        self._cancel_flush()
+        self._dirty = False
+        self._save()
+
+    def close(self) -> None:
+        """Flush pending changes and release the log file handle."""
+        self.flush()
+        self._close_log()
+
+    def _schedule_save(self, new_entries: list[VectorEntry]) -> None:
+        if self._save_delay <= 0:
+            self._append_log(new_entries)
+            return
+        self._dirty = True
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self._save_delay, self.flush)
+
+    def _cancel_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
     async def _get_embedding(self, text: str) -> list[float] | None:
         if self._embed_fn is not None:
             return await self._embed_fn(text)
         # Fallback: simple bag-of-words hash embedding (for testing without API)
         return _hash_embedding(text, self._dimensions)
 
+    async def _get_embeddings_batch(self, texts: list[str]) -> list[list[float] | None]:
+        if self._embed_batch_fn is not None:
+            return list(await self._embed_batch_fn(texts))
+        if self._embed_fn is not None:
+            return list(await asyncio.gather(*(self._embed_fn(t) for t in texts)))
+        return [_hash_embedding(t, self._dimensions) for t in texts]
+
 
 class VectorEntry:
     __slots__ = ("text", "embedding", "metadata", "timestamp")
@@ -133,15 +494,60 @@ class SearchResult:
 # Type alias for embedding functions
 from typing import Callable, Coroutine
 EmbedFunction = Callable[[str], Coroutine[Any, Any, list[float]]]
+EmbedBatchFunction = Callable[[list[str]], Coroutine[Any, Any, list[list[float]]]]
+
+
+def _dump_json(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode("utf-8")
+
+
+def _normalize_rows(matrix: Any) -> Any:
+    """Scale each row of a float32 matrix to unit length, in place."""
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+    return matrix
+
+
+def _as_list(embedding: Any) -> list[float]:
+    values: list[float] = embedding.tolist() if hasattr(embedding, "tolist") else embedding
+    return values
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _remove_if_exists(path: str) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _ends_mid_line(fd: int) -> bool:
+    """True when the file behind *fd* is non-empty and lacks a final newline."""
+    size = os.fstat(fd).st_size
+    return size > 0 and os.pread(fd, 1, size - 1) != b"\n"
 
 
 def _cosine_similarity(a: list[float], b: list[float]) -> float:
     """Compute cosine similarity between two vectors."""
     if len(a) != len(b):
         return 0.0
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = math.sqrt(sum(x * x for x in a))
-    norm_b = math.sqrt(sum(x * x for x in b))
+    # Rows loaded from vectors.npy are arrays: reduce them in numpy rather than
+    # iterating numpy scalars. For plain lists the conversion costs more than
+    # the builtin reductions below.
+    if np is not None and (isinstance(a, np.ndarray) or isinstance(b, np.ndarray)):
+        va = np.asarray(a, dtype=np.float64)
+        vb = np.asarray(b, dtype=np.float64)
+        norm = float(np.linalg.norm(va)) * float(np.linalg.norm(vb))
+        return float(va @ vb) / norm if norm else 0.0
+    # C-level reductions instead of per-element generator expressions
+    dot: float = sum(map(operator.mul, a, b))
+    norm_a = math.hypot(*a)
+    norm_b = math.hypot(*b)
     if norm_a == 0 or norm_b == 0:
         return 0.0
     return dot / (norm_a * norm_b)
@@ -151,15 +557,28 @@ def _hash_embedding(text: str, dimensions: int) -> list[float]:
     """Simple deterministic hash-based embedding for testing.
 
     Not suitable for real semantic search — use OpenAI or sentence-transformers
-    embeddings for production.
+    embeddings for production. These vectors are persisted, so the bucket
+    hash (md5) must stay the same whatever extras are installed.
     """
-    import hashlib
     words = text.lower().split()
+    if np is not None:
+        if not words:
+            return [0.0] * dimensions
+        idxs = np.fromiter(
+            map(_word_bucket, words, itertools.repeat(dimensions)),
+            dtype=np.int64,
+            count=len(words),
+        )
+        arr = np.bincount(idxs, minlength=dimensions).astype(np.float64)
+        norm = np.linalg.norm(arr)
+        if norm > 0:
+            arr /= norm
+        values: list[float] = arr.tolist()
+        return values
+
     vec = [0.0] * dimensions
     for word in words:
-        h = int(hashlib.md5(word.encode()).hexdigest(), 16)
-        idx = h % dimensions
-        vec[idx] += 1.0
+        vec[_word_bucket(word, dimensions)] += 1.0
     # Normalize
     norm = math.sqrt(sum(x * x for x in vec))
     if norm > 0:
@@ -167,6 +586,13 @@ def _hash_embedding(text: str, dimensions: int) -> list[float]:
     return vec
 
 
+@functools.lru_cache(maxsize=65536)
+def _word_bucket(word: str, dimensions: int) -> int:
+    # Same bucket as int(md5(word).hexdigest(), 16) % dimensions
+    digest = hashlib.md5(word.encode(), usedforsecurity=False).digest()
+    return int.from_bytes(digest, "big") % dimensions
+
+
 async def create_openai_embed_fn(api_key: str, model: str = "text-embedding-3-small") -> EmbedFunction:
     """Create an embedding function using the OpenAI API."""
     import openai
@@ -177,3 +603,17 @@ async def create_openai_embed_fn(api_key: str, model: str = "text-embedding-3-sm
         return response.data[0].embedding
 
     return embed
+
+
+async def create_openai_embed_batch_fn(
+    api_key: str, model: str = "text-embedding-3-small"
+) -> EmbedBatchFunction:
+    """Create a batch embedding function using the OpenAI API (one request per batch)."""
+    import openai
+    client = openai.AsyncOpenAI(api_key=api_key)
+
+    async def embed_batch(texts: list[str]) -> list[list[float]]:
+        response = await client.embeddings.create(input=texts, model=model)
+        return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+    return embed_batch
@@ -2,27 +2,52 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
+
+# Internal hot-path containers (provider responses, routing, failover) are
+# slotted dataclasses; BaseModel is kept for types that cross a JSON or
+# config boundary (bus messages, sessions, tool definitions).
+
+
+class _Dumpable:
+    """``model_dump()``/``model_construct()`` for the dataclass models, mirroring BaseModel."""
+
+    __slots__ = ()
+
+    def model_dump(self) -> dict[str, Any]:
+        data: dict[str, Any] = asdict(self)  # type: ignore[call-overload]
+        return data
+
+    @classmethod
+    def model_construct(cls, **values: Any) -> Any:
+        # Dataclasses never validate, so this is plain construction
+        return cls(**values)
 
 
 # ── LLM Messages & Tool Calls ──────────────────────────────────────────────
 
 
-class FunctionCall(BaseModel):
+@dataclass(slots=True)
+class FunctionCall(_Dumpable):
     name: str
     arguments: str  # JSON string
 
 
-class ToolCall(BaseModel):
+# Providers fill in only the argument form their API returns: the JSON string
+# in ``function`` (OpenAI-style) or ``name``/``arguments`` as a parsed dict
+# (Anthropic-style). Consumers accept either and convert on demand.
+@dataclass(slots=True)
+class ToolCall(_Dumpable):
     id: str = ""
     type: str = "function"
     function: FunctionCall | None = None
     name: str = ""
-    arguments: dict[str, Any] = Field(default_factory=dict)
+    arguments: dict[str, Any] = field(default_factory=dict)
 
 
 class Message(BaseModel):
@@ -31,16 +56,22 @@ class Message(BaseModel):
     tool_calls: list[ToolCall] = Field(default_factory=list)
     tool_call_id: str = ""
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Message:
+        return _MESSAGE_ADAPTER.validate_python(data)
+
 
-class UsageInfo(BaseModel):
+@dataclass(slots=True)
+class UsageInfo(_Dumpable):
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
 
 
-class LLMResponse(BaseModel):
+@dataclass(slots=True)
+class LLMResponse(_Dumpable):
     content: str = ""
-    tool_calls: list[ToolCall] = Field(default_factory=list)
+    tool_calls: list[ToolCall] = field(default_factory=list)
     finish_reason: str = ""
     usage: UsageInfo | None = None
 
@@ -57,9 +88,16 @@ class ToolFunctionDefinition(BaseModel):
 class ToolDefinition(BaseModel):
     type: str = "function"
     function: ToolFunctionDefinition
+    # Provider wire-format dicts, built once per definition (see providers)
+    _wire_cache: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ToolDefinition:
+        return _TOOL_DEFINITION_ADAPTER.validate_python(data)
 
-class ToolResult(BaseModel):
+
+@dataclass(slots=True)
+class ToolResult(_Dumpable):
     for_llm: str = ""
     for_user: str = ""
     silent: bool = False
@@ -99,12 +137,20 @@ class InboundMessage(BaseModel):
     session_key: str = ""
     metadata: dict[str, str] = Field(default_factory=dict)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InboundMessage:
+        return _INBOUND_ADAPTER.validate_python(data)
+
 
 class OutboundMessage(BaseModel):
     channel: str = ""
     chat_id: str = ""
     content: str = ""
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OutboundMessage:
+        return _OUTBOUND_ADAPTER.validate_python(data)
+
 
 # ── Session ────────────────────────────────────────────────────────────────
 
@@ -116,6 +162,10 @@ class Session(BaseModel):
     created: datetime = Field(default_factory=datetime.now)
     updated: datetime = Field(default_factory=datetime.now)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Session:
+        return _SESSION_ADAPTER.validate_python(data)
+
 
 # ── Routing ────────────────────────────────────────────────────────────────
 
@@ -127,12 +177,14 @@ class DMScope(str, Enum):
     PER_ACCOUNT_CHANNEL_PEER = "per-account-channel-peer"
 
 
-class RoutePeer(BaseModel):
+@dataclass(slots=True)
+class RoutePeer(_Dumpable):
     kind: str = ""  # "direct", "group", "channel"
     id: str = ""
 
 
-class RouteInput(BaseModel):
+@dataclass(slots=True)
+class RouteInput(_Dumpable):
     channel: str = ""
     account_id: str = ""
     peer: RoutePeer | None = None
@@ -141,7 +193,8 @@ class RouteInput(BaseModel):
     team_id: str = ""
 
 
-class ResolvedRoute(BaseModel):
+@dataclass(slots=True)
+class ResolvedRoute(_Dumpable):
     agent_id: str = ""
     channel: str = ""
     account_id: str = ""
@@ -163,15 +216,28 @@ class FailoverReason(str, Enum):
     UNKNOWN = "unknown"
 
 
-class FallbackCandidate(BaseModel):
+@dataclass(slots=True)
+class FallbackCandidate(_Dumpable):
     provider: str = ""
     model: str = ""
 
 
-class FallbackAttempt(BaseModel):
+@dataclass(slots=True)
+class FallbackAttempt(_Dumpable):
     provider: str = ""
     model: str = ""
     error: str | None = None
     reason: FailoverReason = FailoverReason.UNKNOWN
     duration_ms: float = 0.0
     skipped: bool = False
+
+
+# ── Validation adapters ────────────────────────────────────────────────────
+# One shared validator per boundary model, used by the from_dict() helpers
+# when building models from decoded JSON payloads.
+
+_MESSAGE_ADAPTER: TypeAdapter[Message] = TypeAdapter(Message)
+_TOOL_DEFINITION_ADAPTER: TypeAdapter[ToolDefinition] = TypeAdapter(ToolDefinition)
+_INBOUND_ADAPTER: TypeAdapter[InboundMessage] = TypeAdapter(InboundMessage)
+_OUTBOUND_ADAPTER: TypeAdapter[OutboundMessage] = TypeAdapter(OutboundMessage)
+_SESSION_ADAPTER: TypeAdapter[Session] = TypeAdapter(Session)
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Generic, Protocol, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
 
 from pyclaw.models import (
     InboundMessage,
@@ -41,6 +43,10 @@ class LLMProvider(ABC):
 class Tool(ABC):
     """Base tool interface."""
 
+    # Idempotent tools set this so the registry may answer a repeated call
+    # (same name and arguments) from its result cache instead of re-running it
+    cacheable: bool = False
+
     @abstractmethod
     def name(self) -> str:
         ...
@@ -77,6 +83,56 @@ class AsyncTool(Tool):
         ...
 
 
+class BatchTool(Tool):
+    """Tool that can serve several calls in one go (e.g. one request upstream).
+
+    Concurrent calls to the same tool are coalesced by the registry into a
+    single batch_execute() call.
+    """
+
+    @abstractmethod
+    async def batch_execute(self, args_list: list[dict[str, Any]]) -> list[ToolResult]:
+        """Return one result per entry of *args_list*, in order."""
+        ...
+
+
+ArgsT = TypeVar("ArgsT")
+
+
+_args_adapters: dict[type[Any], TypeAdapter[Any]] = {}
+
+
+def args_adapter(model: type[Any]) -> TypeAdapter[Any]:
+    """TypeAdapter for a TypedTool's args_model, built once per model."""
+    adapter = _args_adapters.get(model)
+    if adapter is None:
+        adapter = _args_adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+class TypedTool(Tool, Generic[ArgsT]):
+    """Tool that reads its arguments from a typed object instead of a dict.
+
+    ``args_model`` is a dataclass or pydantic model. The registry validates
+    the raw argument dict into it and calls execute_typed(); execute() does
+    the same for direct callers. batch_execute() of a tool that is also a
+    BatchTool still receives the raw dicts.
+    """
+
+    args_model: type[ArgsT]
+
+    @abstractmethod
+    async def execute_typed(self, args: ArgsT) -> ToolResult:
+        ...
+
+    async def execute(self, args: dict[str, Any]) -> ToolResult:
+        try:
+            typed: ArgsT = args_adapter(self.args_model).validate_python(args)
+        except ValidationError as e:
+            return ToolResult.error(f"Invalid arguments for {self.name()}: {e}")
+        return await self.execute_typed(typed)
+
+
 # ── Channel ────────────────────────────────────────────────────────────────
 
 
@@ -2,21 +2,19 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 from anthropic import AsyncAnthropic
 
 from pyclaw.models import (
-    FunctionCall,
     LLMResponse,
     Message,
     ToolCall,
     ToolDefinition,
     UsageInfo,
 )
-from pyclaw.providers.base import BaseProvider
+from pyclaw.providers.base import BaseProvider, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +22,20 @@ logger = logging.getLogger(__name__)
 class AnthropicProvider(BaseProvider):
     """Provider for Anthropic Claude API."""
 
-    def __init__(self, model: str, api_key: str, api_base: str = "", **kwargs: Any):
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        api_base: str = "",
+        http_client: Any | None = None,
+        **kwargs: Any,
+    ):
         super().__init__(model, api_key, api_base, **kwargs)
         client_kwargs: dict[str, Any] = {"api_key": api_key}
         if api_base:
             client_kwargs["base_url"] = api_base
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
         self._client = AsyncAnthropic(**client_kwargs)
 
     async def chat(
@@ -66,7 +73,9 @@ class AnthropicProvider(BaseProvider):
 def _split_system(messages: list[Message]) -> tuple[str, list[dict[str, Any]]]:
     """Split system message from conversation messages for Anthropic."""
     system_prompt = ""
-    result = []
+    # At most one entry per message; sized up front and trimmed at the end
+    result: list[Any] = [None] * len(messages)
+    n = 0
 
     for msg in messages:
         if msg.role == "system":
@@ -74,7 +83,7 @@ def _split_system(messages: list[Message]) -> tuple[str, list[dict[str, Any]]]:
             continue
 
         if msg.role == "tool":
-            result.append({
+            result[n] = {
                 "role": "user",
                 "content": [
                     {
@@ -83,38 +92,46 @@ def _split_system(messages: list[Message]) -> tuple[str, list[dict[str, Any]]]:
                         "content": msg.content,
                     }
                 ],
-            })
+            }
         elif msg.role == "assistant" and msg.tool_calls:
             content: list[dict[str, Any]] = []
             if msg.content:
                 content.append({"type": "text", "text": msg.content})
             for tc in msg.tool_calls:
                 name = tc.function.name if tc.function else tc.name
-                args = (
-                    json.loads(tc.function.arguments)
-                    if tc.function
-                    else tc.arguments
-                )
+                # Prefer the already-parsed dict; only decode the JSON string
+                # when the call arrived without one (e.g. from streaming)
+                if tc.arguments:
+                    args = tc.arguments
+                elif tc.function and tc.function.arguments:
+                    args = json_loads(tc.function.arguments)
+                else:
+                    args = {}
                 content.append({
                     "type": "tool_use",
                     "id": tc.id,
                     "name": name,
                     "input": args,
                 })
-            result.append({"role": "assistant", "content": content})
+            result[n] = {"role": "assistant", "content": content}
         else:
-            result.append({"role": msg.role, "content": msg.content})
+            result[n] = {"role": msg.role, "content": msg.content}
+        n += 1
 
+    del result[n:]
     return system_prompt, result
 
 
 def _to_anthropic_tool(tool: ToolDefinition) -> dict[str, Any]:
-    """Convert ToolDefinition to Anthropic tool format."""
-    return {
-        "name": tool.function.name,
-        "description": tool.function.description,
-        "input_schema": tool.function.parameters,
-    }
+    """Convert ToolDefinition to Anthropic tool format (cached per definition)."""
+    cached = tool._wire_cache.get("anthropic")
+    if cached is None:
+        cached = tool._wire_cache["anthropic"] = {
+            "name": tool.function.name,
+            "description": tool.function.description,
+            "input_schema": tool.function.parameters,
+        }
+    return cached
 
 
 def _from_anthropic_response(response: Any) -> LLMResponse:
@@ -130,10 +147,6 @@ def _from_anthropic_response(response: Any) -> LLMResponse:
                 ToolCall(
                     id=block.id,
                     type="function",
-                    function=FunctionCall(
-                        name=block.name,
-                        arguments=json.dumps(block.input),
-                    ),
                     name=block.name,
                     arguments=block.input if isinstance(block.input, dict) else {},
                 )
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
 from pyclaw.models import LLMResponse, Message, ToolDefinition
 from pyclaw.protocols import LLMProvider
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def json_dumps(data: Any) -> str:
+    """Serialise tool-call arguments to compact JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text (orjson when available); raises ValueError when malformed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class BaseProvider(LLMProvider):
     """Base class for LLM providers with common functionality."""
 
@@ -311,15 +311,20 @@ def _convert_messages(messages: list[Message]) -> list[dict[str, Any]]:
                 for tc in msg.tool_calls:
                     fn = tc.function
                     if fn:
-                        fc_id = _ensure_fc_prefix(tc.id)
-                        id_map[tc.id] = fc_id
-                        result.append({
-                            "type": "function_call",
-                            "id": fc_id,
-                            "call_id": fc_id,
-                            "name": fn.name,
-                            "arguments": fn.arguments or "{}",
-                        })
+                        name, arguments = fn.name, fn.arguments or "{}"
+                    elif tc.name:
+                        name, arguments = tc.name, json.dumps(tc.arguments)
+                    else:
+                        continue
+                    fc_id = _ensure_fc_prefix(tc.id)
+                    id_map[tc.id] = fc_id
+                    result.append({
+                        "type": "function_call",
+                        "id": fc_id,
+                        "call_id": fc_id,
+                        "name": name,
+                        "arguments": arguments,
+                    })
 
         elif msg.role == "tool":
             original_id = msg.tool_call_id or ""
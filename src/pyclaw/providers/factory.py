@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from pyclaw.config.models import Config, ModelConfig, ProvidersConfig
+from pyclaw.http_client import shared_http_client
 from pyclaw.protocols import LLMProvider
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,6 @@ logger = logging.getLogger(__name__)
 ANTHROPIC_PREFIXES = ("anthropic/", "claude")
 COPILOT_PREFIXES = ("copilot/",)
 
-
 def create_provider(
     model_name: str,
     config: Config,
@@ -91,7 +91,12 @@ def _create_openai(
             api_key = providers.openai.api_key
             api_base = api_base or providers.openai.api_base or ""
 
-    return OpenAIProvider(model=actual_model, api_key=api_key, api_base=api_base)
+    return OpenAIProvider(
+        model=actual_model,
+        api_key=api_key,
+        api_base=api_base,
+        http_client=shared_http_client(),
+    )
 
 
 def _create_anthropic(
@@ -110,7 +115,12 @@ def _create_anthropic(
         api_key = providers.anthropic.api_key
         api_base = api_base or providers.anthropic.api_base or ""
 
-    return AnthropicProvider(model=actual_model, api_key=api_key, api_base=api_base)
+    return AnthropicProvider(
+        model=actual_model,
+        api_key=api_key,
+        api_base=api_base,
+        http_client=shared_http_client(),
+    )
 
 
 def _try_create_codex(model_id: str, config: Config) -> LLMProvider | None:
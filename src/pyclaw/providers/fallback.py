@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 import time
 from typing import Any
 
@@ -20,12 +22,20 @@ logger = logging.getLogger(__name__)
 
 
 class FallbackChain:
-    """Tries multiple provider/model candidates in sequence."""
+    """Tries multiple provider/model candidates in sequence.
 
-    def __init__(self, providers: dict[str, LLMProvider]):
+    With ``speculative > 1`` up to that many candidates are raced
+    concurrently and the first success wins; the rest are cancelled. This
+    hides a slow primary behind a fast backup at the cost of the tokens the
+    cancelled requests already spent, so it is off by default.
+    """
+
+    def __init__(self, providers: dict[str, LLMProvider], speculative: int = 1):
         self._providers = providers
-        self._cooldowns: dict[str, float] = {}
-        self._cooldown_seconds = 60.0
+        self._speculative = max(1, speculative)
+        # Failure timestamps in monotonic nanoseconds
+        self._cooldowns: dict[str, int] = {}
+        self._cooldown_ns = 60 * 1_000_000_000
 
     async def execute(
         self,
@@ -36,75 +46,179 @@ class FallbackChain:
     ) -> tuple[LLMResponse, list[FallbackAttempt]]:
         """Try candidates in order, returning first successful response."""
         attempts: list[FallbackAttempt] = []
+        providers_get = self._providers.get
+        clock = time.monotonic_ns
 
+        # Phase 1: drop unknown and cooled-down candidates without awaiting
+        now = clock()
+        cooled = {k for k, t in self._cooldowns.items() if now - t < self._cooldown_ns}
+        live: list[tuple[LLMProvider, str, str, str]] = []
         for candidate in candidates:
-            provider = self._providers.get(candidate.provider)
+            p_name, m_name = candidate.provider, candidate.model
+            provider = providers_get(p_name)
             if provider is None:
-                attempts.append(FallbackAttempt(
-                    provider=candidate.provider,
-                    model=candidate.model,
-                    error=f"Provider '{candidate.provider}' not found",
-                    reason=FailoverReason.UNKNOWN,
-                    skipped=True,
-                ))
+                attempts.append(_skipped(p_name, m_name, f"Provider '{p_name}' not found"))
+                continue
+            key = f"{p_name}:{m_name}"
+            if key in cooled:
+                attempts.append(_skipped(p_name, m_name, "In cooldown", FailoverReason.RATE_LIMIT))
                 continue
+            live.append((provider, p_name, m_name, key))
 
-            # Check cooldown
-            key = f"{candidate.provider}:{candidate.model}"
-            if key in self._cooldowns:
-                if time.time() - self._cooldowns[key] < self._cooldown_seconds:
-                    attempts.append(FallbackAttempt(
-                        provider=candidate.provider,
-                        model=candidate.model,
-                        error="In cooldown",
-                        reason=FailoverReason.RATE_LIMIT,
-                        skipped=True,
-                    ))
+        # Phase 2: try the remaining candidates
+        if self._speculative > 1:
+            response = await self._race(live, cooled, attempts, messages, tools, options)
+            if response is not None:
+                return response, attempts
+        else:
+            for provider, p_name, m_name, key in live:
+                if key in cooled:
+                    # Same provider/model listed twice and it already failed above
+                    attempts.append(
+                        _skipped(p_name, m_name, "In cooldown", FailoverReason.RATE_LIMIT)
+                    )
+                    continue
+                start = clock()
+                try:
+                    response = await provider.chat(messages, tools, m_name, options)
+                except Exception as e:
+                    self._record_failure(attempts, cooled, p_name, m_name, key, start, e)
                     continue
-
-            start = time.time()
-            try:
-                response = await provider.chat(messages, tools, candidate.model, options)
-                duration_ms = (time.time() - start) * 1000
                 attempts.append(FallbackAttempt(
-                    provider=candidate.provider,
-                    model=candidate.model,
-                    duration_ms=duration_ms,
+                    provider=p_name,
+                    model=m_name,
+                    duration_ms=(clock() - start) / 1e6,
                 ))
                 return response, attempts
-            except Exception as e:
-                duration_ms = (time.time() - start) * 1000
-                reason = _classify_error(e)
-                self._cooldowns[key] = time.time()
-                attempts.append(FallbackAttempt(
-                    provider=candidate.provider,
-                    model=candidate.model,
-                    error=str(e),
-                    reason=reason,
-                    duration_ms=duration_ms,
-                ))
-                logger.warning(
-                    "Provider %s/%s failed (%s): %s",
-                    candidate.provider, candidate.model, reason, e,
-                )
 
         raise RuntimeError(
             f"All {len(candidates)} provider candidates failed. "
             f"Attempts: {[a.model_dump() for a in attempts]}"
         )
 
+    async def _race(
+        self,
+        live: list[tuple[LLMProvider, str, str, str]],
+        cooled: set[str],
+        attempts: list[FallbackAttempt],
+        messages: list[Message],
+        tools: list[ToolDefinition],
+        options: dict[str, Any] | None,
+    ) -> LLMResponse | None:
+        """Keep up to ``speculative`` candidates in flight; return the first success."""
+        clock = time.monotonic_ns
+        pending_candidates = iter(live)
+        running: dict[asyncio.Task[LLMResponse], tuple[str, str, str, int]] = {}
+
+        def launch_next() -> None:
+            in_flight = {key for _, _, key, _ in running.values()}
+            for provider, p_name, m_name, key in pending_candidates:
+                if key in cooled:
+                    attempts.append(
+                        _skipped(p_name, m_name, "In cooldown", FailoverReason.RATE_LIMIT)
+                    )
+                    continue
+                if key in in_flight:
+                    # Same provider/model listed twice; it has not failed
+                    attempts.append(_skipped(p_name, m_name, "Duplicate already in flight"))
+                    continue
+                task = asyncio.ensure_future(provider.chat(messages, tools, m_name, options))
+                running[task] = (p_name, m_name, key, clock())
+                return
+
+        for _ in range(self._speculative):
+            launch_next()
+
+        won = False
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    p_name, m_name, key, start = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        attempts.append(FallbackAttempt(
+                            provider=p_name,
+                            model=m_name,
+                            duration_ms=(clock() - start) / 1e6,
+                        ))
+                        won = True
+                        return task.result()
+                    self._record_failure(attempts, cooled, p_name, m_name, key, start, error)
+                    launch_next()
+            return None
+        finally:
+            # Losers (or everything, if we were cancelled) are abandoned
+            note = "Cancelled: another candidate won" if won else "Cancelled"
+            for task, (p_name, m_name, _, _) in running.items():
+                task.cancel()
+                attempts.append(_skipped(p_name, m_name, note))
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def _record_failure(
+        self,
+        attempts: list[FallbackAttempt],
+        cooled: set[str],
+        p_name: str,
+        m_name: str,
+        key: str,
+        start: int,
+        error: BaseException,
+    ) -> None:
+        now = time.monotonic_ns()
+        reason = _classify_error(error)
+        self._cooldowns[key] = now
+        cooled.add(key)
+        attempts.append(FallbackAttempt(
+            provider=p_name,
+            model=m_name,
+            error=str(error),
+            reason=reason,
+            duration_ms=(now - start) / 1e6,
+        ))
+        logger.warning(
+            "Provider %s/%s failed (%s): %s",
+            p_name, m_name, reason, error,
+        )
+
+
+def _skipped(
+    provider: str,
+    model: str,
+    error: str,
+    reason: FailoverReason = FailoverReason.UNKNOWN,
+) -> FallbackAttempt:
+    return FallbackAttempt(
+        provider=provider, model=model, error=error, reason=reason, skipped=True
+    )
+
+
+# Group order is the classification priority (first group wins)
+_ERROR_RE = re.compile(
+    r"(?P<auth>401|403|auth)"
+    r"|(?P<rate_limit>429|rate)"
+    r"|(?P<billing>402|billing|quota)"
+    r"|(?P<timeout>timeout|timed out)"
+    r"|(?P<overloaded>overloaded|529|503)",
+    re.IGNORECASE,
+)
+_ERROR_PRIORITY = {name: i for i, name in enumerate(_ERROR_RE.groupindex)}
+# Group names are FailoverReason values; resolve members once, not per error
+_ERROR_REASONS = {name: FailoverReason(name) for name in _ERROR_RE.groupindex}
+
 
-def _classify_error(error: Exception) -> FailoverReason:
+def _classify_error(error: BaseException) -> FailoverReason:
     """Classify an error into a failover reason."""
-    msg = str(error).lower()
-    if "401" in msg or "403" in msg or "auth" in msg:
-        return FailoverReason.AUTH
-    if "429" in msg or "rate" in msg:
-        return FailoverReason.RATE_LIMIT
-    if "402" in msg or "billing" in msg or "quota" in msg:
-        return FailoverReason.BILLING
-    if "timeout" in msg or "timed out" in msg:
-        return FailoverReason.TIMEOUT
-    if "overloaded" in msg or "529" in msg or "503" in msg:
-        return FailoverReason.OVERLOADED
-    return FailoverReason.UNKNOWN
+    reason = FailoverReason.UNKNOWN
+    best_rank = len(_ERROR_PRIORITY)
+    for m in _ERROR_RE.finditer(str(error)):
+        group = m.lastgroup
+        assert group is not None  # every alternative is a named group
+        rank = _ERROR_PRIORITY[group]
+        if rank < best_rank:
+            best_rank = rank
+            reason = _ERROR_REASONS[group]
+            if reason is FailoverReason.AUTH:
+                break
+    return reason
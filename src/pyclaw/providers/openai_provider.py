@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
@@ -16,7 +15,7 @@ from pyclaw.models import (
     ToolDefinition,
     UsageInfo,
 )
-from pyclaw.providers.base import BaseProvider
+from pyclaw.providers.base import BaseProvider, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +23,20 @@ logger = logging.getLogger(__name__)
 class OpenAIProvider(BaseProvider):
     """Provider for OpenAI-compatible APIs."""
 
-    def __init__(self, model: str, api_key: str, api_base: str = "", **kwargs: Any):
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        api_base: str = "",
+        http_client: Any | None = None,
+        **kwargs: Any,
+    ):
         super().__init__(model, api_key, api_base, **kwargs)
         client_kwargs: dict[str, Any] = {"api_key": api_key}
         if api_base:
             client_kwargs["base_url"] = api_base
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
         self._client = AsyncOpenAI(**client_kwargs)
 
     async def chat(
@@ -63,41 +71,40 @@ class OpenAIProvider(BaseProvider):
 
 def _to_openai_messages(messages: list[Message]) -> list[dict[str, Any]]:
     """Convert pyclaw Messages to OpenAI API format."""
-    result = []
-    for msg in messages:
-        oai_msg: dict[str, Any] = {"role": msg.role, "content": msg.content}
-        if msg.tool_calls:
-            oai_msg["tool_calls"] = [
-                {
-                    "id": tc.id,
-                    "type": "function",
-                    "function": {
-                        "name": tc.function.name if tc.function else tc.name,
-                        "arguments": (
-                            tc.function.arguments
-                            if tc.function
-                            else json.dumps(tc.arguments)
-                        ),
-                    },
-                }
-                for tc in msg.tool_calls
-            ]
-        if msg.tool_call_id:
-            oai_msg["tool_call_id"] = msg.tool_call_id
-        result.append(oai_msg)
+    result: list[Any] = [None] * len(messages)
+    for i, msg in enumerate(messages):
+        # One literal per message; optional keys are merged in only when set
+        result[i] = {
+            "role": msg.role,
+            "content": msg.content,
+            **({"tool_calls": [_tc_to_oai(tc) for tc in msg.tool_calls]} if msg.tool_calls else {}),
+            **({"tool_call_id": msg.tool_call_id} if msg.tool_call_id else {}),
+        }
     return result
 
 
+def _tc_to_oai(tc: ToolCall) -> dict[str, Any]:
+    fn = tc.function
+    if fn is None:
+        function = {"name": tc.name, "arguments": json_dumps(tc.arguments)}
+    else:
+        function = {"name": fn.name, "arguments": fn.arguments}
+    return {"id": tc.id, "type": "function", "function": function}
+
+
 def _to_openai_tool(tool: ToolDefinition) -> dict[str, Any]:
-    """Convert ToolDefinition to OpenAI tool format."""
-    return {
-        "type": "function",
-        "function": {
-            "name": tool.function.name,
-            "description": tool.function.description,
-            "parameters": tool.function.parameters,
-        },
-    }
+    """Convert ToolDefinition to OpenAI tool format (cached per definition)."""
+    cached = tool._wire_cache.get("openai")
+    if cached is None:
+        cached = tool._wire_cache["openai"] = {
+            "type": "function",
+            "function": {
+                "name": tool.function.name,
+                "description": tool.function.description,
+                "parameters": tool.function.parameters,
+            },
+        }
+    return cached
 
 
 def _from_openai_response(response: Any) -> LLMResponse:
@@ -116,8 +123,6 @@ def _from_openai_response(response: Any) -> LLMResponse:
                         name=tc.function.name,
                         arguments=tc.function.arguments,
                     ),
-                    name=tc.function.name,
-                    arguments=json.loads(tc.function.arguments) if tc.function.arguments else {},
                 )
             )
 
@@ -3,16 +3,116 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import time
 from typing import Any, AsyncIterator, Callable
 
-from pyclaw.models import LLMResponse, Message, ToolCall, ToolDefinition, UsageInfo
+from pyclaw.models import (
+    FunctionCall,
+    LLMResponse,
+    Message,
+    ToolCall,
+    ToolDefinition,
+    UsageInfo,
+)
+from pyclaw.providers.base import json_loads
 
 logger = logging.getLogger(__name__)
 
-# Callback type for streaming chunks
+# Callback type for streaming chunks; may be a plain or an ``async def`` function
 StreamCallback = Callable[[str], Any]
 
+# Coalesce token deltas until either limit is hit before invoking on_chunk
+_CHUNK_MAX_CHARS = 64
+_CHUNK_MAX_DELAY = 0.008
+
+
+def _parse_arguments(text: str) -> dict[str, Any]:
+    """Decode accumulated tool-call arguments once the call is complete."""
+    if not text:
+        return {}
+    try:
+        args = json_loads(text)
+    except ValueError:
+        return {}
+    return args if isinstance(args, dict) else {}
+
+
+class _ChunkBatcher:
+    """Buffer streamed text deltas and hand them to on_chunk in batches.
+
+    Providers emit one delta per token, often a single character; forwarding
+    each one costs an await plus a downstream send. Deltas are joined and
+    flushed once ``max_chars`` accumulate or ``max_delay`` seconds have passed
+    since the last flush. A timer covers the time between deltas, so text is
+    not held back by a pause or by a run of tool-call events. Callback errors
+    are swallowed as before.
+    """
+
+    __slots__ = (
+        "_on_chunk", "_is_async", "_parts", "_size", "_deadline", "_max_chars", "_max_delay",
+        "_timer", "_lock", "_tasks",
+    )
+
+    def __init__(
+        self,
+        on_chunk: StreamCallback,
+        max_chars: int = _CHUNK_MAX_CHARS,
+        max_delay: float = _CHUNK_MAX_DELAY,
+    ):
+        self._on_chunk = on_chunk
+        # Classified once so flushes need no per-call coroutine check
+        # (an instance with an ``async def __call__`` counts as async too)
+        self._is_async = inspect.iscoroutinefunction(on_chunk) or (
+            inspect.iscoroutinefunction(type(on_chunk).__call__)
+        )
+        self._parts: list[str] = []
+        self._size = 0
+        self._max_chars = max_chars
+        self._max_delay = max_delay
+        self._deadline = time.monotonic() + max_delay
+        self._timer: asyncio.TimerHandle | None = None
+        # Serialises timer and in-line flushes so chunks arrive in order
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def add(self, text: str) -> None:
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._max_chars or time.monotonic() >= self._deadline:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self._flush_later
+            )
+
+    def _flush_later(self) -> None:
+        self._timer = None
+        if self._parts:
+            task = asyncio.ensure_future(self.flush())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        async with self._lock:
+            self._deadline = time.monotonic() + self._max_delay
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            self._parts.clear()
+            self._size = 0
+            try:
+                if self._is_async:
+                    await self._on_chunk(text)
+                else:
+                    self._on_chunk(text)
+            except Exception:
+                pass
+
 
 async def stream_openai_response(
     client: Any,
@@ -35,7 +135,9 @@ async def stream_openai_response(
         kwargs["tools"] = tools
 
     content_parts: list[str] = []
-    tool_calls_by_idx: dict[int, dict[str, str]] = {}
+    # Argument fragments are collected per call and joined once at the end
+    tool_calls_by_idx: dict[int, dict[str, Any]] = {}
+    batcher = _ChunkBatcher(on_chunk) if on_chunk else None
 
     stream = await client.chat.completions.create(**kwargs)
 
@@ -47,36 +149,35 @@ async def stream_openai_response(
         # Content streaming
         if delta.content:
             content_parts.append(delta.content)
-            if on_chunk:
-                try:
-                    result = on_chunk(delta.content)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception:
-                    pass
+            if batcher:
+                await batcher.add(delta.content)
 
         # Tool call streaming
         if delta.tool_calls:
             for tc in delta.tool_calls:
                 idx = tc.index
                 if idx not in tool_calls_by_idx:
-                    tool_calls_by_idx[idx] = {"id": "", "name": "", "arguments": ""}
+                    tool_calls_by_idx[idx] = {"id": "", "name": "", "arg_parts": []}
                 if tc.id:
                     tool_calls_by_idx[idx]["id"] = tc.id
                 if tc.function and tc.function.name:
                     tool_calls_by_idx[idx]["name"] = tc.function.name
                 if tc.function and tc.function.arguments:
-                    tool_calls_by_idx[idx]["arguments"] += tc.function.arguments
+                    tool_calls_by_idx[idx]["arg_parts"].append(tc.function.arguments)
+
+    if batcher:
+        await batcher.flush()
 
     # Build response
     content = "".join(content_parts)
     tool_calls = []
     for idx in sorted(tool_calls_by_idx):
         tc_data = tool_calls_by_idx[idx]
+        arguments = "".join(tc_data["arg_parts"])
         tool_calls.append(
             ToolCall(
                 id=tc_data["id"],
-                function={"name": tc_data["name"], "arguments": tc_data["arguments"]},
+                function=FunctionCall(name=tc_data["name"], arguments=arguments),
             )
         )
 
@@ -111,44 +212,53 @@ async def stream_anthropic_response(
     content_parts: list[str] = []
     tool_calls: list[ToolCall] = []
     current_tool: dict[str, str] | None = None
+    input_parts: list[str] = []
+    batcher = _ChunkBatcher(on_chunk) if on_chunk else None
     input_tokens = 0
     output_tokens = 0
 
     async with client.messages.stream(**kwargs) as stream:
         async for event in stream:
-            if event.type == "content_block_start":
-                block = event.content_block
-                if hasattr(block, "type"):
-                    if block.type == "tool_use":
-                        current_tool = {"id": block.id, "name": block.name, "input": ""}
-            elif event.type == "content_block_delta":
+            etype = event.type
+            # Deltas dominate the stream, so they are tested first
+            if etype == "content_block_delta":
                 delta = event.delta
-                if hasattr(delta, "text"):
-                    content_parts.append(delta.text)
-                    if on_chunk:
-                        try:
-                            result = on_chunk(delta.text)
-                            if asyncio.iscoroutine(result):
-                                await result
-                        except Exception:
-                            pass
-                elif hasattr(delta, "partial_json") and current_tool is not None:
-                    current_tool["input"] += delta.partial_json
-            elif event.type == "content_block_stop":
+                # getattr with a default is cheaper than a hasattr probe
+                text: str | None = getattr(delta, "text", None)
+                if text is not None:
+                    content_parts.append(text)
+                    if batcher:
+                        await batcher.add(text)
+                elif current_tool is not None:
+                    partial: str | None = getattr(delta, "partial_json", None)
+                    if partial is not None:
+                        input_parts.append(partial)
+            elif etype == "content_block_start":
+                block = event.content_block
+                if getattr(block, "type", None) == "tool_use":
+                    current_tool = {"id": block.id, "name": block.name}
+                    input_parts.clear()
+            elif etype == "content_block_stop":
                 if current_tool is not None:
                     tool_calls.append(
                         ToolCall(
                             id=current_tool["id"],
-                            function={"name": current_tool["name"], "arguments": current_tool["input"]},
+                            name=current_tool["name"],
+                            arguments=_parse_arguments("".join(input_parts)),
                         )
                     )
                     current_tool = None
-            elif event.type == "message_delta":
-                if hasattr(event, "usage"):
-                    output_tokens = getattr(event.usage, "output_tokens", 0)
-            elif event.type == "message_start":
-                if hasattr(event, "message") and hasattr(event.message, "usage"):
-                    input_tokens = getattr(event.message.usage, "input_tokens", 0)
+            elif etype == "message_delta":
+                usage_info = getattr(event, "usage", None)
+                if usage_info is not None:
+                    output_tokens = getattr(usage_info, "output_tokens", 0)
+            elif etype == "message_start":
+                usage_info = getattr(getattr(event, "message", None), "usage", None)
+                if usage_info is not None:
+                    input_tokens = getattr(usage_info, "input_tokens", 0)
+
+    if batcher:
+        await batcher.flush()
 
     content = "".join(content_parts)
     usage = UsageInfo(prompt_tokens=input_tokens, completion_tokens=output_tokens)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 
 from pyclaw.config.models import Config
 from pyclaw.models import ResolvedRoute, RouteInput
@@ -15,6 +16,29 @@ class RouteResolver:
 
     def __init__(self, config: Config):
         self._config = config
+        self._agent_ids: list[str] = []
+        # match key -> index of the first binding using it
+        self._by_peer: dict[tuple[str, str, str], int] = {}
+        self._by_guild: dict[str, int] = {}
+        self._by_team: dict[str, int] = {}
+        self._by_account: dict[str, int] = {}
+        self._by_channel: dict[str, int] = {}
+        self._index_bindings()
+
+    def _index_bindings(self) -> None:
+        for i, binding in enumerate(self._config.bindings):
+            self._agent_ids.append(binding.agent_id)
+            match = binding.match
+            if match.peer:
+                self._by_peer.setdefault((match.peer.kind, match.peer.id, match.channel), i)
+            if match.guild_id:
+                self._by_guild.setdefault(match.guild_id, i)
+            if match.team_id:
+                self._by_team.setdefault(match.team_id, i)
+            if match.account_id:
+                self._by_account.setdefault(match.account_id, i)
+            if match.channel and not match.peer and not match.account_id:
+                self._by_channel.setdefault(match.channel, i)
 
     def resolve(self, route_input: RouteInput) -> ResolvedRoute:
         """Resolve which agent should handle a message.
@@ -26,46 +50,53 @@ class RouteResolver:
         4. Account ID match
         5. Channel wildcard match
         6. Default agent
-        """
-        for binding in self._config.bindings:
-            match = binding.match
-
-            # Peer-level match
-            if match.peer and route_input.peer:
-                if (
-                    match.peer.kind == route_input.peer.kind
-                    and match.peer.id == route_input.peer.id
-                    and (not match.channel or match.channel == route_input.channel)
-                ):
-                    return self._build_route(binding.agent_id, route_input, "peer")
-
-            # Guild match
-            if match.guild_id and match.guild_id == route_input.guild_id:
-                return self._build_route(binding.agent_id, route_input, "guild")
-
-            # Team match
-            if match.team_id and match.team_id == route_input.team_id:
-                return self._build_route(binding.agent_id, route_input, "team")
 
-            # Account match
-            if match.account_id and match.account_id == route_input.account_id:
-                return self._build_route(binding.agent_id, route_input, "account")
-
-            # Channel wildcard
-            if match.channel and match.channel == route_input.channel and not match.peer and not match.account_id:
-                return self._build_route(binding.agent_id, route_input, "channel")
+        Bindings are checked in config order and the first one matching on
+        any of 1-5 wins; the indexes built at construction time find that
+        binding with a handful of dict lookups instead of a scan.
+        """
+        # (binding index, cascade rank, matched_by) for every index hit
+        hits: list[tuple[int, int, str]] = []
+        peer = route_input.peer
+        if peer:
+            for channel in (route_input.channel, ""):
+                i = self._by_peer.get((peer.kind, peer.id, channel))
+                if i is not None:
+                    hits.append((i, 0, "peer"))
+        for rank, index, value, matched_by in (
+            (1, self._by_guild, route_input.guild_id, "guild"),
+            (2, self._by_team, route_input.team_id, "team"),
+            (3, self._by_account, route_input.account_id, "account"),
+            (4, self._by_channel, route_input.channel, "channel"),
+        ):
+            i = index.get(value)
+            if i is not None:
+                hits.append((i, rank, matched_by))
+
+        if hits:
+            i, _, matched_by = min(hits)
+            return self._build_route(self._agent_ids[i], route_input, matched_by)
 
         # Default
         return self._build_route("", route_input, "default")
 
     @staticmethod
     def _build_route(agent_id: str, route_input: RouteInput, matched_by: str) -> ResolvedRoute:
-        session_key = f"agent:{agent_id or 'default'}:{route_input.channel}:{route_input.account_id}"
+        agent_id = agent_id or "default"
+        session_key, main_session_key = _session_keys(
+            agent_id, route_input.channel, route_input.account_id
+        )
         return ResolvedRoute(
-            agent_id=agent_id or "default",
+            agent_id=agent_id,
             channel=route_input.channel,
             account_id=route_input.account_id,
             session_key=session_key,
-            main_session_key=f"agent:{agent_id or 'default'}:main",
+            main_session_key=main_session_key,
             matched_by=matched_by,
         )
+
+
+@lru_cache(maxsize=4096)
+def _session_keys(agent_id: str, channel: str, account_id: str) -> tuple[str, str]:
+    """Session keys for a route; the same few combinations repeat per message."""
+    return f"agent:{agent_id}:{channel}:{account_id}", f"agent:{agent_id}:main"
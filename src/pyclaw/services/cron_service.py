@@ -12,6 +12,11 @@ from typing import Any, Callable, Coroutine
 
 from croniter import croniter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 JobHandler = Callable[[dict[str, Any]], Coroutine[Any, Any, str | None]]
@@ -178,7 +183,8 @@ class CronService:
     def _load_jobs(self) -> None:
         if self._jobs_file.exists():
             try:
-                data = json.loads(self._jobs_file.read_text(encoding="utf-8"))
+                raw = self._jobs_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 self._jobs = data if isinstance(data, list) else []
             except Exception:
                 logger.warning("Failed to load cron jobs")
@@ -187,5 +193,11 @@ class CronService:
     def _save_jobs(self) -> None:
         self._store_path.mkdir(parents=True, exist_ok=True)
         tmp = self._jobs_file.with_suffix(".tmp")
-        tmp.write_text(json.dumps(self._jobs, indent=2, default=str), encoding="utf-8")
+        if orjson is not None:
+            payload = orjson.dumps(
+                self._jobs, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(self._jobs, indent=2, default=str).encode("utf-8")
+        tmp.write_bytes(payload)
         tmp.rename(self._jobs_file)
@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import logging
-from datetime import datetime
+import os
+import re
+import time
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
@@ -22,6 +26,14 @@ DEFAULT_HEARTBEAT = """# Heartbeat Tasks
 """
 
 
+# Start of a line that is neither blank, a heading nor a comment
+_ACTIVE_LINE_RE = re.compile(r"^(?![^\S\n]*(?:#|<!--|$))", re.MULTILINE)
+
+
+def _has_active(content: str) -> bool:
+    return _ACTIVE_LINE_RE.search(content) is not None
+
+
 class HeartbeatService:
     """Periodically reads HEARTBEAT.md and executes tasks."""
 
@@ -30,6 +42,7 @@ class HeartbeatService:
         workspace: str,
         interval_minutes: int = 30,
         enabled: bool = False,
+        skip_unchanged: bool = False,
     ):
         self._workspace = Path(workspace).expanduser().resolve()
         self._heartbeat_file = self._workspace / "HEARTBEAT.md"
@@ -41,6 +54,15 @@ class HeartbeatService:
         self._last_chat_id = ""
         self._task: asyncio.Task[None] | None = None
         self._running = False
+        # Last read of HEARTBEAT.md, keyed on (mtime_ns, size)
+        self._cached_key: tuple[int, int] | None = None
+        self._cached_content = ""
+        self._cached_active = False
+        # When set, ticks whose content matches the last executed run are skipped
+        self._skip_unchanged = skip_unchanged
+        self._last_executed_digest: bytes | None = None
+        # O_APPEND descriptor opened in start(): each entry is one write() call
+        self._log_fd: int | None = None
 
     def set_handler(self, handler: HeartbeatHandler) -> None:
         self._handler = handler
@@ -54,55 +76,82 @@ class HeartbeatService:
             return
         self._running = True
         self._ensure_heartbeat_file()
-        self._task = asyncio.ensure_future(self._run_loop())
+        try:
+            self._log_fd = os.open(self._log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError:
+            logger.warning("Cannot open heartbeat log %s", self._log_file)
+        self._task = asyncio.get_running_loop().create_task(self._run_loop(), name="heartbeat")
         logger.info("Heartbeat service started (interval: %ds)", self._interval)
 
     def stop(self) -> None:
         self._running = False
         if self._task:
             self._task.cancel()
+        if self._log_fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._log_fd)
+            self._log_fd = None
 
     def is_running(self) -> bool:
         return self._running
 
     async def _run_loop(self) -> None:
+        # Ticks are scheduled against absolute deadlines so the time spent in
+        # _execute_heartbeat does not push every later tick back.
+        loop = asyncio.get_running_loop()
+        interval = self._interval
+        deadline = loop.time() + interval
         while self._running:
-            await asyncio.sleep(self._interval)
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
             if not self._running:
                 break
             try:
                 await self._execute_heartbeat()
             except Exception:
                 logger.exception("Heartbeat execution failed")
-
-    async def _execute_heartbeat(self) -> None:
-        content = self._read_heartbeat()
-        if not content or not content.strip():
-            return
-
-        # Skip if all lines are comments
-        active_lines = [
-            line for line in content.splitlines()
-            if line.strip() and not line.strip().startswith("#") and not line.strip().startswith("<!--")
-        ]
-        if not active_lines:
+            deadline += interval
+            now = loop.time()
+            if deadline <= now:
+                # Fell behind by whole intervals: skip them instead of catching up
+                deadline += ((now - deadline) // interval + 1) * interval
+
+    async def _execute_heartbeat(self, force: bool = False) -> None:
+        content, active = self._read_heartbeat()
+        # Skip if empty or all lines are comments
+        if not active:
             return
 
         if self._handler is None:
             logger.warning("No heartbeat handler configured")
             return
 
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        if self._skip_unchanged and not force and digest == self._last_executed_digest:
+            return
+
         prompt = f"Execute these heartbeat tasks:\n{content}"
         self._log("INFO", "Executing heartbeat tasks")
 
         result = await self._handler(prompt, self._last_channel, self._last_chat_id)
+        # Only a completed run counts: a failed or cancelled one is retried
+        self._last_executed_digest = digest
         if result:
             self._log("INFO", f"Heartbeat result: {result[:200]}")
 
-    def _read_heartbeat(self) -> str:
-        if self._heartbeat_file.exists():
-            return self._heartbeat_file.read_text(encoding="utf-8")
-        return ""
+    def _read_heartbeat(self) -> tuple[str, bool]:
+        """Return (content, has_active_lines), re-reading only when the file changed."""
+        try:
+            st = self._heartbeat_file.stat()
+        except FileNotFoundError:
+            self._cached_key = None
+            return "", False
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._cached_key:
+            content = self._heartbeat_file.read_text(encoding="utf-8")
+            self._cached_key = key
+            self._cached_content = content
+            self._cached_active = _has_active(content)
+        return self._cached_content, self._cached_active
 
     def _ensure_heartbeat_file(self) -> None:
         if not self._heartbeat_file.exists():
@@ -110,10 +159,17 @@ class HeartbeatService:
             self._heartbeat_file.write_text(DEFAULT_HEARTBEAT, encoding="utf-8")
 
     def _log(self, level: str, message: str) -> None:
-        timestamp = datetime.now().isoformat()
+        now = time.time()
+        # Same layout as datetime.isoformat() (local time, microseconds)
+        seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+        timestamp = f"{seconds}.{int(now % 1 * 1e6):06d}"
         entry = f"{timestamp} [{level}] {message}\n"
         try:
-            with open(self._log_file, "a", encoding="utf-8") as f:
-                f.write(entry)
+            if self._log_fd is not None:
+                os.write(self._log_fd, entry.encode("utf-8"))
+            else:
+                # Not started (e.g. a direct call): fall back to a one-off append
+                with open(self._log_file, "a", encoding="utf-8") as f:
+                    f.write(entry)
         except Exception:
             pass
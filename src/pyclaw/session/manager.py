@@ -10,6 +10,11 @@ from pathlib import Path
 
 from pyclaw.models import Message, Session
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,7 +82,13 @@ class SessionManager:
         data = session.model_dump(mode="json")
         # Atomic write
         tmp = path.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+        if orjson is not None:
+            payload = orjson.dumps(
+                data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+        tmp.write_bytes(payload)
         tmp.rename(path)
 
     def save_all(self) -> None:
@@ -89,8 +100,9 @@ class SessionManager:
             return
         for path in self._storage.glob("*.json"):
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
-                session = Session.model_validate(data)
+                raw = path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                session = Session.from_dict(data)
                 self._sessions[session.key] = session
             except Exception as e:
                 logger.warning("Failed to load session %s: %s", path, e)
@@ -4,17 +4,83 @@ from __future__ import annotations
 
 import ast
 import os
+import re
+import stat
+import weakref
+from collections import deque
+from functools import lru_cache
 from typing import Any
 
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
+# Per-tree results for the query-independent actions; entries disappear
+# together with the tree once _load_tree evicts it.
+_REPORTS: weakref.WeakKeyDictionary[ast.Module, dict[str, str]] = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=128)
+def _load_tree(full_path: str, mtime_ns: int, size: int, filename: str) -> ast.Module:
+    """Parse a source file; the stat fields in the key invalidate stale entries."""
+    with open(full_path) as f:
+        source = f.read()
+    return ast.parse(source, filename=filename)
+
+
+_ACTIONS = ["outline", "imports", "complexity", "search"]
+
+_FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+# Nodes whose children can include statements
+_BLOCK_TYPES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+_COMPLEXITY_KEYS = ("functions", "classes", "branches", "loops", "try_except", "lines")
+
+
+class _ComplexityVisitor(ast.NodeVisitor):
+    """Count structural nodes in one traversal (indexes into _COMPLEXITY_KEYS)."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * len(_COMPLEXITY_KEYS)
+
+    def _count(self, node: ast.AST, slot: int) -> None:
+        self.counts[slot] += 1
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._count(node, 0)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._count(node, 0)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._count(node, 1)
+
+    def visit_If(self, node: ast.If) -> None:
+        self._count(node, 2)
+
+    def visit_For(self, node: ast.For) -> None:
+        self._count(node, 3)
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        self._count(node, 3)
+
+    def visit_While(self, node: ast.While) -> None:
+        self._count(node, 3)
+
+    def visit_Try(self, node: ast.Try) -> None:
+        self._count(node, 4)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        self._count(node, 4)
+
 
 class ASTAnalyzeTool(Tool):
     """Analyze Python source files using AST parsing."""
 
     def __init__(self, workspace: str) -> None:
         self._workspace = workspace
+        self._root = os.path.normpath(workspace)
+        self._root_sep = self._root.rstrip(os.sep) + os.sep
 
     def name(self) -> str:
         return "ast_analyze"
@@ -23,7 +89,8 @@ class ASTAnalyzeTool(Tool):
         return (
             "Analyze Python source code structure. "
             "Actions: outline (list classes/functions), imports (list imports), "
-            "complexity (count branches/loops), search (find definitions by name)."
+            "complexity (count branches/loops), search (find definitions by name). "
+            "Pass several in 'actions' to run them on one parse of the file."
         )
 
     def parameters(self) -> dict[str, Any]:
@@ -33,53 +100,66 @@ class ASTAnalyzeTool(Tool):
                 "path": {"type": "string", "description": "File path relative to workspace"},
                 "action": {
                     "type": "string",
-                    "enum": ["outline", "imports", "complexity", "search"],
+                    "enum": _ACTIONS,
                     "description": "Analysis action to perform",
                 },
+                "actions": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": _ACTIONS},
+                    "description": "Several actions to run together (instead of 'action')",
+                },
                 "query": {
                     "type": "string",
                     "description": "Search query (for 'search' action)",
                 },
             },
-            "required": ["path", "action"],
+            "required": ["path"],
         }
 
     def _resolve(self, path: str) -> str:
         full = os.path.normpath(os.path.join(self._workspace, path))
-        if not full.startswith(os.path.normpath(self._workspace)):
+        if full != self._root and not full.startswith(self._root_sep):
             raise PermissionError("Path outside workspace")
         return full
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         path = args.get("path", "")
-        action = args.get("action", "outline")
+        actions = args.get("actions") or [args.get("action", "outline")]
+        for action in actions:
+            if action not in _ACTIONS:
+                return ToolResult.error(f"Unknown action: {action}")
 
         try:
             full_path = self._resolve(path)
         except PermissionError as e:
             return ToolResult.error(str(e))
 
-        if not os.path.isfile(full_path):
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             return ToolResult.error(f"File not found: {path}")
 
         try:
-            with open(full_path) as f:
-                source = f.read()
-            tree = ast.parse(source, filename=path)
+            tree = _load_tree(full_path, st.st_mtime_ns, st.st_size, path)
         except SyntaxError as e:
             return ToolResult.error(f"Syntax error: {e}")
 
-        if action == "outline":
-            return ToolResult.success(self._outline(tree))
-        elif action == "imports":
-            return ToolResult.success(self._imports(tree))
-        elif action == "complexity":
-            return ToolResult.success(self._complexity(tree))
-        elif action == "search":
-            query = args.get("query", "")
-            return ToolResult.success(self._search(tree, query))
-        else:
-            return ToolResult.error(f"Unknown action: {action}")
+        if len(actions) == 1:
+            return ToolResult.success(self._run(tree, actions[0], args))
+        return ToolResult.success(
+            "\n\n".join(f"## {action}\n{self._run(tree, action, args)}" for action in actions)
+        )
+
+    def _run(self, tree: ast.Module, action: str, args: dict[str, Any]) -> str:
+        if action == "search":
+            return self._search(tree, args.get("query", ""))
+        reports = _REPORTS.setdefault(tree, {})
+        report = reports.get(action)
+        if report is None:
+            report = reports[action] = getattr(self, f"_{action}")(tree)
+        return report
 
     def _outline(self, tree: ast.AST) -> str:
         lines = []
@@ -87,12 +167,12 @@ class ASTAnalyzeTool(Tool):
             if isinstance(node, ast.ClassDef):
                 lines.append(f"class {node.name} (line {node.lineno})")
                 for item in node.body:
-                    if isinstance(item, ast.FunctionDef | ast.AsyncFunctionDef):
+                    if isinstance(item, _FUNC_TYPES):
                         args = [a.arg for a in item.args.args if a.arg != "self"]
                         sig = ", ".join(args)
                         prefix = "async " if isinstance(item, ast.AsyncFunctionDef) else ""
                         lines.append(f"  {prefix}def {item.name}({sig}) (line {item.lineno})")
-            elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            elif isinstance(node, _FUNC_TYPES):
                 args = [a.arg for a in node.args.args]
                 sig = ", ".join(args)
                 prefix = "async " if isinstance(node, ast.AsyncFunctionDef) else ""
@@ -101,45 +181,43 @@ class ASTAnalyzeTool(Tool):
 
     def _imports(self, tree: ast.AST) -> str:
         lines = []
-        for node in ast.walk(tree):
+        # Imports are statements, so expression subtrees (most of the nodes)
+        # are never queued; the queue keeps ast.walk's breadth-first order.
+        queue: deque[ast.AST] = deque([tree])
+        while queue:
+            node = queue.popleft()
             if isinstance(node, ast.Import):
                 for alias in node.names:
-                    name = alias.asname or alias.name
                     lines.append(f"import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""))
             elif isinstance(node, ast.ImportFrom):
                 module = node.module or ""
                 for alias in node.names:
                     lines.append(f"from {module} import {alias.name}" + (f" as {alias.asname}" if alias.asname else ""))
+            else:
+                queue.extend(c for c in ast.iter_child_nodes(node) if isinstance(c, _BLOCK_TYPES))
         return "\n".join(lines) if lines else "No imports found."
 
     def _complexity(self, tree: ast.AST) -> str:
-        stats = {"functions": 0, "classes": 0, "branches": 0, "loops": 0, "try_except": 0, "lines": 0}
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                stats["functions"] += 1
-            elif isinstance(node, ast.ClassDef):
-                stats["classes"] += 1
-            elif isinstance(node, ast.If):
-                stats["branches"] += 1
-            elif isinstance(node, ast.For | ast.While | ast.AsyncFor):
-                stats["loops"] += 1
-            elif isinstance(node, ast.Try | ast.ExceptHandler):
-                stats["try_except"] += 1
-        # Count non-empty lines
-        if hasattr(tree, 'body') and tree.body:
-            last = max((getattr(n, 'end_lineno', getattr(n, 'lineno', 0)) for n in ast.walk(tree) if hasattr(n, 'lineno')), default=0)
-            stats["lines"] = last
+        visitor = _ComplexityVisitor()
+        visitor.visit(tree)
+        stats = dict(zip(_COMPLEXITY_KEYS, visitor.counts, strict=True))
+        # The last top-level statement ends on the module's last line
+        body = getattr(tree, "body", None)
+        if body:
+            last = body[-1]
+            stats["lines"] = getattr(last, "end_lineno", None) or last.lineno
         parts = [f"{k}: {v}" for k, v in stats.items()]
         return "\n".join(parts)
 
     def _search(self, tree: ast.AST, query: str) -> str:
         if not query:
             return "No query provided."
-        query_lower = query.lower()
+        # One case-insensitive scan per name instead of lowering every name
+        search = re.compile(re.escape(query), re.IGNORECASE).search
         results = []
         for node in ast.walk(tree):
             name = getattr(node, "name", None)
-            if name and query_lower in name.lower():
+            if name and search(name):
                 kind = type(node).__name__
                 line = getattr(node, "lineno", "?")
                 results.append(f"{kind} '{name}' at line {line}")
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import time
 from typing import Any
@@ -108,7 +107,7 @@ class CronTool(ContextualTool):
 
         schedule: dict[str, Any] = {}
         if at_seconds:
-            schedule = {"kind": "at", "at_ms": int((time.time() + at_seconds) * 1000)}
+            schedule = {"kind": "at", "at_ms": time.time_ns() // 1_000_000 + int(at_seconds * 1000)}
         elif every_seconds:
             schedule = {"kind": "every", "every_ms": every_seconds * 1000}
         elif cron_expr:
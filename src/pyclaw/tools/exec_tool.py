@@ -56,6 +56,7 @@ class ExecTool(Tool):
         self._enable_deny = enable_deny_patterns
         patterns = DEFAULT_DENY_PATTERNS + (custom_deny_patterns or [])
         self._deny_patterns = [re.compile(p, re.IGNORECASE) for p in patterns] if enable_deny_patterns else []
+        self._deny_regex, self._separate_patterns = _combine_patterns(self._deny_patterns)
 
     def name(self) -> str:
         return "exec"
@@ -100,7 +101,8 @@ class ExecTool(Tool):
                 stderr=asyncio.subprocess.PIPE,
                 cwd=cwd,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+            async with asyncio.timeout(timeout):
+                stdout, stderr = await proc.communicate()
 
             output_parts = []
             if stdout:
@@ -125,7 +127,34 @@ class ExecTool(Tool):
 
     def _check_denied(self, command: str) -> str | None:
         """Check if command matches any deny pattern."""
-        for pattern in self._deny_patterns:
+        if self._deny_regex is not None:
+            m = self._deny_regex.search(command)
+            if m is not None and m.lastgroup is not None:
+                return self._deny_patterns[int(m.lastgroup[1:])].pattern
+        for pattern in self._separate_patterns:
             if pattern.search(command):
                 return pattern.pattern
         return None
+
+
+def _combine_patterns(
+    patterns: list[re.Pattern[str]],
+) -> tuple[re.Pattern[str] | None, list[re.Pattern[str]]]:
+    """Union *patterns* into one alternation so a command is scanned once.
+
+    Each alternative is wrapped in a named group ``_<index>`` so the matching
+    pattern can still be reported. Patterns with groups of their own are left
+    out, since wrapping renumbers their backreferences; they are returned
+    separately for callers to check one by one, as are all patterns if the
+    union does not compile (e.g. a custom pattern uses inline global flags).
+    """
+    merged = [i for i, p in enumerate(patterns) if p.groups == 0]
+    if not merged:
+        return None, patterns
+    try:
+        combined = re.compile(
+            "|".join(f"(?P<_{i}>{patterns[i].pattern})" for i in merged), re.IGNORECASE
+        )
+    except re.error:
+        return None, patterns
+    return combined, [p for p in patterns if p.groups]
@@ -3,17 +3,70 @@
 from __future__ import annotations
 
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
+# Files up to this size are kept decoded in _read_cached (64 entries, so at
+# most ~16 MiB); larger ones are always read straight from disk.
+_READ_CACHE_MAX_BYTES = 256 * 1024
+
+
+def _decode(data: bytes) -> str:
+    """Decode like read_text(errors="replace"), including its newline translation."""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_text(path: str) -> str:
+    with open(path, "rb", buffering=0) as f:
+        return _decode(f.readall())
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int, ctime_ns: int, size: int) -> str:
+    """Decoded file text; the stat fields in the key invalidate stale entries."""
+    return _read_text(path)
+
+
+def _invalidate_read_cache() -> None:
+    # mtime granularity can be coarser than back-to-back tool calls, so the
+    # writers below drop cached text explicitly
+    _read_cached.cache_clear()
+
+
+class _Resolver:
+    """Maps tool path arguments into the workspace; shared by the file tools."""
+
+    def __init__(self, workspace: str, restrict: bool) -> None:
+        self._root = str(Path(workspace).expanduser().resolve())
+        self._root_sep = self._root.rstrip(os.sep) + os.sep
+        self._restrict = restrict
+
+    def resolve(self, raw: str) -> Path | None:
+        if raw.startswith("~"):
+            raw = os.path.expanduser(raw)
+        # An absolute raw path replaces the root in the join
+        joined = os.path.join(self._root, raw)
+        if not self._restrict and ".." not in Path(raw).parts:
+            # Nothing to contain, so the per-component lstat walk can be skipped
+            return Path(os.path.normpath(joined))
+        # Symlinks have to be followed before the containment check
+        full = os.path.realpath(joined)
+        if self._restrict and full != self._root and not full.startswith(self._root_sep):
+            return None
+        return Path(full)
+
 
 class ReadFileTool(Tool):
     def __init__(self, workspace: str, restrict: bool = True):
-        self._workspace = Path(workspace).expanduser().resolve()
-        self._restrict = restrict
+        self._resolver = _Resolver(workspace, restrict)
 
     def name(self) -> str:
         return "read_file"
@@ -26,38 +79,51 @@ class ReadFileTool(Tool):
             "type": "object",
             "properties": {
                 "path": {"type": "string", "description": "Path to the file to read"},
+                "max_bytes": {
+                    "type": "integer",
+                    "description": "Only read this many bytes from the start of the file",
+                },
             },
             "required": ["path"],
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        path = self._resolve(args.get("path", ""))
+        path = self._resolver.resolve(args.get("path", ""))
         if path is None:
             return ToolResult.error("Path is outside workspace")
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return ToolResult.error(f"File not found: {path}")
-        if not path.is_file():
+        except OSError as e:
+            return ToolResult.error(f"Error reading file: {e}")
+        if not stat.S_ISREG(st.st_mode):
             return ToolResult.error(f"Not a file: {path}")
+        max_bytes = args.get("max_bytes")
         try:
-            content = path.read_text(encoding="utf-8", errors="replace")
+            if max_bytes and 0 < max_bytes < st.st_size:
+                # Never touch the tail of a large file when only a preview is wanted
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    data = os.read(fd, max_bytes)
+                finally:
+                    os.close(fd)
+                content = _decode(data)
+                return ToolResult.success(
+                    f"{content}\n... [truncated at {len(data)} of {st.st_size} bytes]"
+                )
+            if st.st_size <= _READ_CACHE_MAX_BYTES:
+                content = _read_cached(str(path), st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+            else:
+                content = _read_text(str(path))
             return ToolResult.success(content)
         except Exception as e:
             return ToolResult.error(f"Error reading file: {e}")
 
-    def _resolve(self, raw: str) -> Path | None:
-        p = Path(raw).expanduser()
-        if not p.is_absolute():
-            p = self._workspace / p
-        p = p.resolve()
-        if self._restrict and not str(p).startswith(str(self._workspace)):
-            return None
-        return p
-
 
 class WriteFileTool(Tool):
     def __init__(self, workspace: str, restrict: bool = True):
-        self._workspace = Path(workspace).expanduser().resolve()
-        self._restrict = restrict
+        self._resolver = _Resolver(workspace, restrict)
 
     def name(self) -> str:
         return "write_file"
@@ -76,31 +142,22 @@ class WriteFileTool(Tool):
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        path = self._resolve(args.get("path", ""))
+        path = self._resolver.resolve(args.get("path", ""))
         if path is None:
             return ToolResult.error("Path is outside workspace")
         content = args.get("content", "")
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text(content, encoding="utf-8")
+            _invalidate_read_cache()
             return ToolResult.success(f"Written {len(content)} bytes to {path}")
         except Exception as e:
             return ToolResult.error(f"Error writing file: {e}")
 
-    def _resolve(self, raw: str) -> Path | None:
-        p = Path(raw).expanduser()
-        if not p.is_absolute():
-            p = self._workspace / p
-        p = p.resolve()
-        if self._restrict and not str(p).startswith(str(self._workspace)):
-            return None
-        return p
-
 
 class EditFileTool(Tool):
     def __init__(self, workspace: str, restrict: bool = True):
-        self._workspace = Path(workspace).expanduser().resolve()
-        self._restrict = restrict
+        self._resolver = _Resolver(workspace, restrict)
 
     def name(self) -> str:
         return "edit_file"
@@ -120,42 +177,47 @@ class EditFileTool(Tool):
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        path = self._resolve(args.get("path", ""))
+        path = self._resolver.resolve(args.get("path", ""))
         if path is None:
             return ToolResult.error("Path is outside workspace")
-        if not path.exists():
-            return ToolResult.error(f"File not found: {path}")
         old = args.get("old_string", "")
         new = args.get("new_string", "")
         try:
-            content = path.read_text(encoding="utf-8")
-            if old not in content:
+            # Matching on the raw bytes is exact for UTF-8 and skips decoding and
+            # re-encoding the whole file; the open doubles as the existence check
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return ToolResult.error(f"File not found: {path}")
+        except IsADirectoryError:
+            return ToolResult.error(f"Not a file: {path}")
+        except Exception as e:
+            return ToolResult.error(f"Error editing file: {e}")
+        try:
+            if b"\r\n" in data:
+                # The text-mode read used to translate CRLF for matching
+                old = old.replace("\r\n", "\n").replace("\n", "\r\n")
+                new = new.replace("\r\n", "\n").replace("\n", "\r\n")
+            old_b = old.encode("utf-8")
+            idx = data.find(old_b)
+            if idx < 0:
                 return ToolResult.error("old_string not found in file")
-            count = content.count(old)
-            if count > 1:
+            end = idx + len(old_b)
+            if data.find(old_b, end) >= 0:
+                # Only the error path pays for a full count
+                count = data.count(old_b)
                 return ToolResult.error(
                     f"old_string appears {count} times. Provide more context to make it unique."
                 )
-            content = content.replace(old, new, 1)
-            path.write_text(content, encoding="utf-8")
+            path.write_bytes(data[:idx] + new.encode("utf-8") + data[end:])
+            _invalidate_read_cache()
             return ToolResult.success("File edited successfully")
         except Exception as e:
             return ToolResult.error(f"Error editing file: {e}")
 
-    def _resolve(self, raw: str) -> Path | None:
-        p = Path(raw).expanduser()
-        if not p.is_absolute():
-            p = self._workspace / p
-        p = p.resolve()
-        if self._restrict and not str(p).startswith(str(self._workspace)):
-            return None
-        return p
-
 
 class AppendFileTool(Tool):
     def __init__(self, workspace: str, restrict: bool = True):
-        self._workspace = Path(workspace).expanduser().resolve()
-        self._restrict = restrict
+        self._resolver = _Resolver(workspace, restrict)
 
     def name(self) -> str:
         return "append_file"
@@ -174,7 +236,7 @@ class AppendFileTool(Tool):
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        path = self._resolve(args.get("path", ""))
+        path = self._resolver.resolve(args.get("path", ""))
         if path is None:
             return ToolResult.error("Path is outside workspace")
         content = args.get("content", "")
@@ -182,24 +244,15 @@ class AppendFileTool(Tool):
             path.parent.mkdir(parents=True, exist_ok=True)
             with open(path, "a", encoding="utf-8") as f:
                 f.write(content)
+            _invalidate_read_cache()
             return ToolResult.success(f"Appended {len(content)} bytes to {path}")
         except Exception as e:
             return ToolResult.error(f"Error appending to file: {e}")
 
-    def _resolve(self, raw: str) -> Path | None:
-        p = Path(raw).expanduser()
-        if not p.is_absolute():
-            p = self._workspace / p
-        p = p.resolve()
-        if self._restrict and not str(p).startswith(str(self._workspace)):
-            return None
-        return p
-
 
 class ListDirTool(Tool):
     def __init__(self, workspace: str, restrict: bool = True):
-        self._workspace = Path(workspace).expanduser().resolve()
-        self._restrict = restrict
+        self._resolver = _Resolver(workspace, restrict)
 
     def name(self) -> str:
         return "list_dir"
@@ -221,28 +274,24 @@ class ListDirTool(Tool):
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         raw = args.get("path", ".")
-        path = self._resolve(raw)
+        path = self._resolver.resolve(raw)
         if path is None:
             return ToolResult.error("Path is outside workspace")
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return ToolResult.error(f"Directory not found: {path}")
-        if not path.is_dir():
+        except OSError as e:
+            return ToolResult.error(f"Error listing directory: {e}")
+        if not stat.S_ISDIR(st.st_mode):
             return ToolResult.error(f"Not a directory: {path}")
         try:
-            entries = sorted(path.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
-            lines = []
-            for entry in entries:
-                suffix = "/" if entry.is_dir() else ""
-                lines.append(f"{entry.name}{suffix}")
+            # DirEntry.is_dir() answers from the readdir type, so only symlinks
+            # cost a stat (they are still followed, as Path.is_dir() did)
+            with os.scandir(path) as it:
+                entries = [(e.name, e.is_dir()) for e in it]
+            entries.sort(key=lambda t: (not t[1], t[0].lower()))
+            lines = [f"{name}/" if is_dir else name for name, is_dir in entries]
             return ToolResult.success("\n".join(lines) if lines else "(empty directory)")
         except Exception as e:
             return ToolResult.error(f"Error listing directory: {e}")
-
-    def _resolve(self, raw: str) -> Path | None:
-        p = Path(raw).expanduser()
-        if not p.is_absolute():
-            p = self._workspace / p
-        p = p.resolve()
-        if self._restrict and not str(p).startswith(str(self._workspace)):
-            return None
-        return p
@@ -66,7 +66,8 @@ class GitTool(Tool):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            async with asyncio.timeout(30):
+                stdout, stderr = await proc.communicate()
             output = stdout.decode(errors="replace")
             err_out = stderr.decode(errors="replace")
 
@@ -2,22 +2,203 @@
 
 from __future__ import annotations
 
+import contextlib
+import ctypes
+import functools
 import logging
 import os
 import struct
 import sys
-from glob import glob
+import time
+import weakref
 from typing import Any
 
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_IS_LINUX = sys.platform == "linux"
+
+# linux/i2c-dev.h and linux/i2c.h
+_I2C_SLAVE = 0x0703
+_I2C_RDWR = 0x0707
+_I2C_M_RD = 0x0001
+
+
+class _I2CMsg(ctypes.Structure):
+    _fields_ = [
+        ("addr", ctypes.c_uint16),
+        ("flags", ctypes.c_uint16),
+        ("len", ctypes.c_uint16),
+        ("buf", ctypes.POINTER(ctypes.c_uint8)),
+    ]
+
+
+class _I2CRdwrData(ctypes.Structure):
+    _fields_ = [
+        ("msgs", ctypes.POINTER(_I2CMsg)),
+        ("nmsgs", ctypes.c_uint32),
+    ]
+
+
+# linux/spi/spidev.h
+_SPI_IOC_WR_MODE = 0x40016B01
+_SPI_IOC_WR_BITS_PER_WORD = 0x40016B03
+_SPI_IOC_WR_MAX_SPEED_HZ = 0x40046B04
+
+
+class _SpiIocTransfer(ctypes.Structure):
+    _fields_ = [
+        ("tx_buf", ctypes.c_uint64),
+        ("rx_buf", ctypes.c_uint64),
+        ("len", ctypes.c_uint32),
+        ("speed_hz", ctypes.c_uint32),
+        ("delay_usecs", ctypes.c_uint16),
+        ("bits_per_word", ctypes.c_uint8),
+        ("cs_change", ctypes.c_uint8),
+        ("tx_nbits", ctypes.c_uint8),
+        ("rx_nbits", ctypes.c_uint8),
+        ("word_delay_usecs", ctypes.c_uint8),
+        ("pad", ctypes.c_uint8),
+    ]
+
+
+def _spi_ioc_message(n: int) -> int:
+    """SPI_IOC_MESSAGE(n): _IOW('k', 0, char[SPI_MSGSIZE(n)])."""
+    size = n * ctypes.sizeof(_SpiIocTransfer)
+    if size >= 1 << 14:
+        size = 0
+    return 0x40000000 | (size << 16) | (ord("k") << 8)
+
+
+def _read_spi_bufsiz() -> int:
+    try:
+        with open("/sys/module/spidev/parameters/bufsiz") as f:
+            return int(f.read()) or 4096
+    except (OSError, ValueError):
+        return 4096
+
+
+# spidev rejects messages whose total tx or rx length exceeds this
+_SPI_BUFSIZ = _read_spi_bufsiz()
+
+# TX source for reads: every chunk points at the same zeros (the kernel only
+# reads from it), so a read allocates nothing for the outgoing side
+_SPI_ZEROS = (ctypes.c_uint8 * _SPI_BUFSIZ)()
+
+
+def _spi_full_duplex(fd: int, tx: bytes | int, speed: int = 0, bits: int = 0) -> bytes:
+    """Clock tx out (an int: that many zeros) while capturing as many bytes from MISO."""
+    if isinstance(tx, int):
+        n = tx
+        tx_buf = None
+        tx_addr = ctypes.addressof(_SPI_ZEROS)
+    else:
+        n = len(tx)
+        tx_buf = (ctypes.c_uint8 * n).from_buffer_copy(tx)
+        tx_addr = ctypes.addressof(tx_buf)
+    rx_buf = (ctypes.c_uint8 * n)()
+    rx_addr = ctypes.addressof(rx_buf)
+    request = _spi_ioc_message(1)
+    # spidev caps a whole message (not each transfer) at bufsiz, so larger
+    # payloads go out as consecutive messages over the same pinned buffers;
+    # cs_change on all but the last asks the controller to keep CS asserted.
+    for offset in range(0, n, _SPI_BUFSIZ) or (0,):
+        size = min(_SPI_BUFSIZ, n - offset)
+        xfer = _SpiIocTransfer(
+            tx_buf=tx_addr if tx_buf is None else tx_addr + offset,
+            rx_buf=rx_addr + offset,
+            len=size,
+            speed_hz=speed,
+            bits_per_word=bits,
+            cs_change=offset + size < n,
+        )
+        fcntl.ioctl(fd, request, xfer)
+    return bytes(rx_buf)
+
+
+def _hex_dump(data: bytes) -> str:
+    """'0x01 0xab ...' built by bytes.hex instead of formatting byte by byte."""
+    # hex() only takes a one-character separator, so the 0x prefixes go in after
+    return "0x" + data.hex(" ").replace(" ", " 0x") if data else ""
+
+
+def _dev_nodes(prefix: str) -> list[str]:
+    """Sorted /dev paths whose names start with prefix (one readdir, no pattern matching)."""
+    try:
+        with os.scandir("/dev") as it:
+            return sorted(e.path for e in it if e.name.startswith(prefix))
+    except FileNotFoundError:
+        return []
+
+
+@functools.lru_cache(maxsize=32)
+def _exists_cached(path: str, bucket: int) -> bool:
+    return os.path.exists(path)
+
+
+def _dev_exists(path: str) -> bool:
+    """os.path.exists for device nodes, memoized within 5-second buckets."""
+    # Boards do not gain or lose buses between polls; the bucket argument keeps
+    # a removed device from being reported present for more than a few seconds
+    return _exists_cached(path, int(time.monotonic() // 5))
+
+
+def _close_fds(fds: dict[str, int]) -> None:
+    for fd in fds.values():
+        with contextlib.suppress(OSError):
+            os.close(fd)
+    fds.clear()
+
+
+class _DeviceFds:
+    """Device nodes kept open across tool calls, plus the last setup applied to each."""
+
+    def __init__(self) -> None:
+        self._fds: dict[str, int] = {}
+        self.applied: dict[int, Any] = {}
+        weakref.finalize(self, _close_fds, self._fds)
+
+    def get(self, path: str) -> int:
+        fd = self._fds.get(path)
+        if fd is None:
+            fd = self._fds[path] = os.open(path, os.O_RDWR)
+        return fd
+
+    def discard(self, path: str) -> None:
+        """Close a descriptor after an error so the next call reopens the device."""
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            self.applied.pop(fd, None)
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def close(self) -> None:
+        self.applied.clear()
+        _close_fds(self._fds)
+
+
+def _check_i2c_target(bus: str, address: int) -> str | None:
+    """Shared argument check for I2C read/write; the bounds mirror the schema."""
+    if not bus or not address:
+        return "Bus and address are required"
+    if not (0x03 <= address <= 0x77):
+        return "Address must be between 0x03 and 0x77"
+    return None
+
 
 class I2CTool(Tool):
     """Interact with I2C devices on Linux."""
 
+    def __init__(self) -> None:
+        self._fds = _DeviceFds()
+
     def name(self) -> str:
         return "i2c"
 
@@ -40,19 +221,25 @@ class I2CTool(Tool):
                 "bus": {"type": "string", "description": "I2C bus number (e.g., '1')"},
                 "address": {
                     "type": "integer",
+                    "minimum": 0x03,
+                    "maximum": 0x77,
                     "description": "7-bit I2C device address (0x03-0x77)",
                 },
                 "register": {
                     "type": "integer",
+                    "minimum": 0,
+                    "maximum": 0xFF,
                     "description": "Register address to read from or write to",
                 },
                 "data": {
                     "type": "array",
-                    "items": {"type": "integer"},
+                    "items": {"type": "integer", "minimum": 0, "maximum": 0xFF},
                     "description": "Bytes to write",
                 },
                 "length": {
                     "type": "integer",
+                    "minimum": 1,
+                    "maximum": 256,
                     "description": "Number of bytes to read (1-256, default 1)",
                     "default": 1,
                 },
@@ -65,7 +252,7 @@ class I2CTool(Tool):
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        if sys.platform != "linux":
+        if not _IS_LINUX:
             return ToolResult.error("I2C is only supported on Linux")
 
         action = args.get("action", "")
@@ -82,7 +269,7 @@ class I2CTool(Tool):
             return ToolResult.error(f"Unknown action: {action}")
 
     def _detect(self) -> ToolResult:
-        buses = sorted(glob("/dev/i2c-*"))
+        buses = _dev_nodes("i2c-")
         if not buses:
             return ToolResult.success("No I2C buses found.")
         return ToolResult.success("Available I2C buses:\n" + "\n".join(buses))
@@ -93,25 +280,25 @@ class I2CTool(Tool):
             return ToolResult.error("Bus number is required")
 
         dev_path = f"/dev/i2c-{bus}"
-        if not os.path.exists(dev_path):
+        if not _dev_exists(dev_path):
             return ToolResult.error(f"Bus {dev_path} not found")
 
         try:
-            import fcntl
-
             found = []
-            fd = os.open(dev_path, os.O_RDWR)
-            try:
-                for addr in range(0x03, 0x78):
-                    try:
-                        fcntl.ioctl(fd, 0x0703, addr)  # I2C_SLAVE
-                        # Try reading one byte
-                        os.read(fd, 1)
-                        found.append(f"0x{addr:02x}")
-                    except OSError:
-                        pass
-            finally:
-                os.close(fd)
+            # One combined-transfer ioctl per address (instead of I2C_SLAVE plus
+            # read); a batch of probes cannot be submitted at once because the
+            # adapter aborts the whole I2C_RDWR transfer at the first NACK.
+            rx = (ctypes.c_uint8 * 1)()
+            msg = _I2CMsg(0, _I2C_M_RD, 1, ctypes.cast(rx, ctypes.POINTER(ctypes.c_uint8)))
+            request = _I2CRdwrData(ctypes.pointer(msg), 1)
+            fd = self._fds.get(dev_path)
+            for addr in range(0x03, 0x78):
+                msg.addr = addr
+                try:
+                    fcntl.ioctl(fd, _I2C_RDWR, request)
+                    found.append(f"0x{addr:02x}")
+                except OSError:
+                    pass
 
             if found:
                 return ToolResult.success(
@@ -127,25 +314,22 @@ class I2CTool(Tool):
         register = args.get("register")
         length = min(args.get("length", 1), 256)
 
-        if not bus or not address:
-            return ToolResult.error("Bus and address are required")
-        if not (0x03 <= address <= 0x77):
-            return ToolResult.error("Address must be between 0x03 and 0x77")
+        if problem := _check_i2c_target(bus, address):
+            return ToolResult.error(problem)
 
         try:
-            import fcntl
-
             dev_path = f"/dev/i2c-{bus}"
-            fd = os.open(dev_path, os.O_RDWR)
+            fd = self._fds.get(dev_path)
             try:
-                fcntl.ioctl(fd, 0x0703, address)
+                self._select(fd, address)
                 if register is not None:
                     os.write(fd, bytes([register]))
                 data = os.read(fd, length)
-                hex_str = " ".join(f"0x{b:02x}" for b in data)
-                return ToolResult.success(f"Read {len(data)} bytes: [{hex_str}]")
-            finally:
-                os.close(fd)
+            except OSError:
+                self._fds.discard(dev_path)
+                raise
+            hex_str = _hex_dump(data)
+            return ToolResult.success(f"Read {len(data)} bytes: [{hex_str}]")
         except Exception as e:
             return ToolResult.error(f"Error reading I2C: {e}")
 
@@ -158,34 +342,46 @@ class I2CTool(Tool):
         register = args.get("register")
         data = args.get("data", [])
 
-        if not bus or not address:
-            return ToolResult.error("Bus and address are required")
-        if not (0x03 <= address <= 0x77):
-            return ToolResult.error("Address must be between 0x03 and 0x77")
+        if problem := _check_i2c_target(bus, address):
+            return ToolResult.error(problem)
         if not data:
             return ToolResult.error("Data is required for write")
 
         try:
-            import fcntl
-
             dev_path = f"/dev/i2c-{bus}"
-            fd = os.open(dev_path, os.O_RDWR)
+            fd = self._fds.get(dev_path)
             try:
-                fcntl.ioctl(fd, 0x0703, address)
-                payload = bytes(data)
-                if register is not None:
-                    payload = bytes([register]) + payload
+                self._select(fd, address)
+                # Register prefix and data in a single buffer, filled in place.
+                # Not os.writev: i2c-dev has no write_iter, so the kernel would
+                # issue each iovec as its own bus transaction.
+                if register is None:
+                    payload = bytearray(data)
+                else:
+                    payload = bytearray(1 + len(data))
+                    payload[0] = register
+                    payload[1:] = data
                 os.write(fd, payload)
-                return ToolResult.success(f"Wrote {len(data)} bytes to 0x{address:02x}")
-            finally:
-                os.close(fd)
+            except OSError:
+                self._fds.discard(dev_path)
+                raise
+            return ToolResult.success(f"Wrote {len(data)} bytes to 0x{address:02x}")
         except Exception as e:
             return ToolResult.error(f"Error writing I2C: {e}")
 
+    def _select(self, fd: int, address: int) -> None:
+        """Point the bus fd at a slave address unless it already is."""
+        if self._fds.applied.get(fd) != address:
+            fcntl.ioctl(fd, _I2C_SLAVE, address)
+            self._fds.applied[fd] = address
+
 
 class SPITool(Tool):
     """Interact with SPI devices on Linux."""
 
+    def __init__(self) -> None:
+        self._fds = _DeviceFds()
+
     def name(self) -> str:
         return "spi"
 
@@ -211,11 +407,15 @@ class SPITool(Tool):
                 },
                 "speed": {
                     "type": "integer",
+                    "minimum": 1,
+                    "maximum": 125000000,
                     "description": "Speed in Hz (default 1000000)",
                     "default": 1000000,
                 },
                 "mode": {
                     "type": "integer",
+                    "minimum": 0,
+                    "maximum": 3,
                     "description": "SPI mode 0-3 (default 0)",
                     "default": 0,
                 },
@@ -226,7 +426,7 @@ class SPITool(Tool):
                 },
                 "data": {
                     "type": "array",
-                    "items": {"type": "integer"},
+                    "items": {"type": "integer", "minimum": 0, "maximum": 0xFF},
                     "description": "Bytes to send (transfer only)",
                 },
                 "length": {
@@ -242,13 +442,13 @@ class SPITool(Tool):
         }
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
-        if sys.platform != "linux":
+        if not _IS_LINUX:
             return ToolResult.error("SPI is only supported on Linux")
 
         action = args.get("action", "")
 
         if action == "list":
-            devices = sorted(glob("/dev/spidev*"))
+            devices = _dev_nodes("spidev")
             if not devices:
                 return ToolResult.success("No SPI devices found.")
             return ToolResult.success("Available SPI devices:\n" + "\n".join(devices))
@@ -273,46 +473,29 @@ class SPITool(Tool):
         bits = args.get("bits", 8)
 
         dev_path = f"/dev/spidev{device}"
-        if not os.path.exists(dev_path):
+        if not _dev_exists(dev_path):
             return ToolResult.error(f"Device {dev_path} not found")
 
         try:
-            import fcntl
-            import ctypes
-
-            fd = os.open(dev_path, os.O_RDWR)
+            fd = self._fds.get(dev_path)
             try:
-                # Set SPI mode, bits, speed
-                fcntl.ioctl(fd, 0x6B01, struct.pack("B", mode))  # SPI_IOC_WR_MODE
-                fcntl.ioctl(fd, 0x6B03, struct.pack("B", bits))  # SPI_IOC_WR_BITS_PER_WORD
-                fcntl.ioctl(fd, 0x40046B04, struct.pack("I", speed))  # SPI_IOC_WR_MAX_SPEED_HZ
+                # Set SPI mode, bits, speed (only when they differ from the last call)
+                if self._fds.applied.get(fd) != (mode, bits, speed):
+                    fcntl.ioctl(fd, _SPI_IOC_WR_MODE, struct.pack("B", mode))
+                    fcntl.ioctl(fd, _SPI_IOC_WR_BITS_PER_WORD, struct.pack("B", bits))
+                    fcntl.ioctl(fd, _SPI_IOC_WR_MAX_SPEED_HZ, struct.pack("I", speed))
+                    self._fds.applied[fd] = (mode, bits, speed)
 
                 tx = bytes(data)
-                rx = bytearray(len(tx))
-
-                # SPI_IOC_MESSAGE ioctl
-                spi_ioc_transfer = struct.pack(
-                    "QQIIHBBBBH",
-                    id(tx),  # tx_buf
-                    id(rx),  # rx_buf
-                    len(tx),  # len
-                    speed,  # speed_hz
-                    0,  # delay_usecs
-                    bits,  # bits_per_word
-                    0,  # cs_change
-                    0,  # tx_nbits
-                    0,  # rx_nbits
-                    0,  # pad
-                )
-                os.write(fd, tx)
-                rx_data = os.read(fd, len(tx))
-
-                hex_str = " ".join(f"0x{b:02x}" for b in rx_data)
-                return ToolResult.success(
-                    f"Transferred {len(tx)} bytes. Received: [{hex_str}]"
-                )
-            finally:
-                os.close(fd)
+                rx_data = _spi_full_duplex(fd, tx, speed, bits)
+            except OSError:
+                self._fds.discard(dev_path)
+                raise
+
+            hex_str = _hex_dump(rx_data)
+            return ToolResult.success(
+                f"Transferred {len(tx)} bytes. Received: [{hex_str}]"
+            )
         except Exception as e:
             return ToolResult.error(f"SPI transfer error: {e}")
 
@@ -323,18 +506,18 @@ class SPITool(Tool):
             return ToolResult.error("Device is required")
 
         dev_path = f"/dev/spidev{device}"
-        if not os.path.exists(dev_path):
+        if not _dev_exists(dev_path):
             return ToolResult.error(f"Device {dev_path} not found")
 
         try:
-            fd = os.open(dev_path, os.O_RDWR)
+            fd = self._fds.get(dev_path)
             try:
-                # Send zeros to clock out data
-                os.write(fd, bytes(length))
-                data = os.read(fd, length)
-                hex_str = " ".join(f"0x{b:02x}" for b in data)
-                return ToolResult.success(f"Read {len(data)} bytes: [{hex_str}]")
-            finally:
-                os.close(fd)
+                # Clock out zeros and keep what the device sends back
+                data = _spi_full_duplex(fd, length)
+            except OSError:
+                self._fds.discard(dev_path)
+                raise
+            hex_str = _hex_dump(data)
+            return ToolResult.success(f"Read {len(data)} bytes: [{hex_str}]")
         except Exception as e:
             return ToolResult.error(f"SPI read error: {e}")
@@ -5,11 +5,20 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import re
 from typing import Any
 
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
+_SUMMARY_RE = re.compile(r"(\d+)\s+(passed|failed|error|skipped)")
+_SUMMARY_KEYS = {"passed": "passed", "failed": "failed", "error": "errors", "skipped": "skipped"}
+# Trailing lines of output searched for the summary
+_SUMMARY_LINES = 20
+
+# Output kept for the summary and the result (which shows the last 3000 chars)
+_TAIL_BYTES = 16 * 1024
+
 
 class PytestTool(Tool):
     """Run pytest with structured JSON output."""
@@ -50,29 +59,34 @@ class PytestTool(Tool):
         test_filter = args.get("filter", "")
         verbose = args.get("verbose", False)
 
-        # Build command
-        cmd_parts = ["python", "-m", "pytest", path, "--tb=short", "-q"]
+        # Always a fresh interpreter rather than pytest.main() in-process: the
+        # agent edits code between runs, and an in-process run would keep
+        # serving the previously imported modules (and pytest's fd-level
+        # capture would swallow the host's own output while it runs).
+        # Arguments go straight to exec, so the filter needs no shell escaping
+        argv = ["python", "-m", "pytest", path, "--tb=short", "-q"]
         if test_filter:
-            safe_filter = test_filter.replace(";", "").replace("&&", "")
-            cmd_parts.extend(["-k", safe_filter])
+            argv.extend(["-k", test_filter])
         if verbose:
-            cmd_parts.append("-v")
-
-        cmd = " ".join(cmd_parts)
+            argv.append("-v")
 
         try:
-            proc = await asyncio.create_subprocess_shell(
-                cmd,
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
                 cwd=self._workspace,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
             )
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
-            output = stdout.decode(errors="replace")
-            err_output = stderr.decode(errors="replace")
-
-            # Parse summary line
-            full_output = output + err_output
+            try:
+                async with asyncio.timeout(120):
+                    tail = await self._read_tail(proc)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            # The summary line is the last thing pytest prints, so the tail has it
+            full_output = tail.decode(errors="replace")
             summary = self._parse_summary(full_output)
             summary["exit_code"] = proc.returncode
             summary["output"] = full_output[-3000:] if len(full_output) > 3000 else full_output
@@ -92,23 +106,24 @@ class PytestTool(Tool):
         except Exception as e:
             return ToolResult.error(f"Pytest error: {e}")
 
+    @staticmethod
+    async def _read_tail(proc: asyncio.subprocess.Process) -> bytes:
+        """Drain combined stdout/stderr, keeping only the last _TAIL_BYTES."""
+        assert proc.stdout is not None
+        tail = bytearray()
+        while chunk := await proc.stdout.read(65536):
+            tail += chunk
+            if len(tail) > _TAIL_BYTES:
+                del tail[:-_TAIL_BYTES]
+        await proc.wait()
+        return bytes(tail)
+
     def _parse_summary(self, output: str) -> dict[str, Any]:
         """Extract pass/fail counts from pytest output."""
         summary: dict[str, Any] = {"passed": 0, "failed": 0, "errors": 0, "skipped": 0}
-        for line in output.splitlines():
-            line = line.strip()
-            # Match lines like "5 passed", "2 failed, 3 passed"
-            if "passed" in line or "failed" in line or "error" in line:
-                import re
-                for match in re.finditer(r"(\d+)\s+(passed|failed|error|skipped|warning)", line):
-                    count = int(match.group(1))
-                    kind = match.group(2)
-                    if kind == "passed":
-                        summary["passed"] = count
-                    elif kind == "failed":
-                        summary["failed"] = count
-                    elif kind == "error":
-                        summary["errors"] = count
-                    elif kind == "skipped":
-                        summary["skipped"] = count
+        # Counts like "5 passed", "2 failed, 3 passed"; the final summary line wins.
+        # pytest prints it last, so only the closing lines are scanned.
+        for line in output.rsplit("\n", _SUMMARY_LINES)[-_SUMMARY_LINES:]:
+            for match in _SUMMARY_RE.finditer(line):
+                summary[_SUMMARY_KEYS[match.group(2)]] = int(match.group(1))
         return summary
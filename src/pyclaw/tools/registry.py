@@ -2,26 +2,190 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import functools
+import json
 import logging
-from typing import Any, Callable
+import sys
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, KeysView
+from typing import Any
+
+from pydantic import ValidationError
 
 from pyclaw.models import ToolDefinition, ToolFunctionDefinition, ToolResult
-from pyclaw.protocols import AsyncCallback, AsyncTool, ContextualTool, Tool
+from pyclaw.protocols import (
+    AsyncCallback,
+    AsyncTool,
+    BatchTool,
+    ContextualTool,
+    Tool,
+    TypedTool,
+    args_adapter,
+)
+
+try:
+    import jsonschema
+except ImportError:  # pragma: no cover - optional argument validation
+    jsonschema = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Results kept for Tool.cacheable tools, least recently used evicted first
+_RESULT_CACHE_SIZE = 256
+
+
+def _canonical_args(value: Any) -> bytes:
+    """Hashable, order-independent form of a JSON-like argument value.
+
+    Serialised as compact sorted-key UTF-8 JSON, so 1 and True or a dict and
+    a list of pairs stay distinct; both paths give the same bytes for the
+    same arguments. Raises TypeError or ValueError for values that cannot be
+    part of a cache key.
+    """
+    if orjson is not None:
+        # Built in C, about 10x faster than json.dumps
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+    ).encode()
+
+
+def _fail_pending(
+    items: list[tuple[dict[str, Any], asyncio.Future[ToolResult]]], reason: str
+) -> None:
+    """Resolve every still-waiting call of a batch with an error result."""
+    for _, fut in items:
+        if not fut.done():
+            fut.set_result(ToolResult.error(f"Tool execution error: {reason}"))
+
+
+class _Entry:
+    """Everything the dispatch path needs for one registered tool."""
+
+    __slots__ = (
+        "tool",
+        "execute",
+        "batch_execute",
+        "set_context",
+        "set_callback",
+        "validate",
+        "convert_args",
+        "cacheable",
+        "index",
+    )
+
+    def __init__(
+        self,
+        tool: Tool,
+        index: int,
+        validate: Callable[[dict[str, Any]], None] | None = None,
+    ) -> None:
+        self.tool = tool
+        # Bound methods captured once, so dispatch is a dict get plus a call.
+        # A TypedTool is called through execute_typed() with convert_args'
+        # result, so its arguments are validated once per call.
+        self.execute: Callable[[Any], Awaitable[ToolResult]]
+        self.convert_args: Callable[[dict[str, Any]], Any] | None
+        if isinstance(tool, TypedTool):
+            self.execute = tool.execute_typed
+            self.convert_args = args_adapter(tool.args_model).validate_python
+        else:
+            self.execute = tool.execute
+            self.convert_args = None
+        # Tools that take per-call context or callbacks are never coalesced:
+        # the setters run per call, but a batch runs once with the last values
+        self.batch_execute: Callable[[list[dict[str, Any]]], Awaitable[list[ToolResult]]] | None = (
+            tool.batch_execute
+            if isinstance(tool, BatchTool) and not isinstance(tool, (ContextualTool, AsyncTool))
+            else None
+        )
+        # Resolved here instead of an ABC isinstance check per call
+        self.set_context: Callable[[str, str], None] | None = (
+            tool.set_context if isinstance(tool, ContextualTool) else None
+        )
+        self.set_callback: Callable[[AsyncCallback], None] | None = (
+            tool.set_callback if isinstance(tool, AsyncTool) else None
+        )
+        self.cacheable = bool(tool.cacheable)
+        # Compiled parameters() validator, when argument validation is on
+        self.validate = validate
+        # Slot of the tool's definition in ToolRegistry._definitions
+        self.index = index
+
 
 class ToolRegistry:
     """Registry of available tools."""
 
-    def __init__(self) -> None:
-        self._tools: dict[str, Tool] = {}
+    def __init__(self, validate_args: bool = False) -> None:
+        self._entries: dict[str, _Entry] = {}
+        # Check arguments against each tool's parameters() schema before
+        # dispatch (needs the optional jsonschema package)
+        if validate_args and jsonschema is None:
+            logger.warning("jsonschema is not installed; tool arguments will not be validated")
+        self._validate_args = validate_args and jsonschema is not None
+        self._result_cache: OrderedDict[tuple[str, Any, bytes], ToolResult] = OrderedDict()
+        # Each tool's definition, built once at register() and kept in
+        # registration order (a re-registered name keeps its slot)
+        self._definitions: list[ToolDefinition] = []
+        # Calls queued for the next batch_execute() of each BatchTool
+        self._pending: dict[str, list[tuple[dict[str, Any], asyncio.Future[ToolResult]]]] = {}
+        self._batch_tasks: set[asyncio.Task[None]] = set()
 
     def register(self, tool: Tool) -> None:
-        self._tools[tool.name()] = tool
+        # description() and parameters() are read here once and never again,
+        # so tools can build their schema inline without a per-turn cost
+        name = sys.intern(tool.name())
+        definition = ToolDefinition(
+            function=ToolFunctionDefinition(
+                name=name,
+                description=tool.description(),
+                parameters=tool.parameters(),
+            )
+        )
+        previous = self._entries.get(name)
+        if previous is None:
+            index = len(self._definitions)
+            self._definitions.append(definition)
+        else:
+            index = previous.index
+            self._definitions[index] = definition
+        validate = None
+        if self._validate_args:
+            # Compiled once here; the schema is fixed for the tool's lifetime
+            schema = definition.function.parameters
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            validate = cls(schema).validate
+        self._entries[name] = _Entry(tool, index, validate)
+        if previous is not None and previous.cacheable:
+            # Results of the replaced tool must not be served for the new one
+            for key in [k for k in self._result_cache if k[0] == name]:
+                del self._result_cache[key]
+
+    def reset(self) -> None:
+        """Unregister every tool and drop all derived state and cached results.
+
+        Outstanding batches are cancelled and their callers get error results.
+        """
+        for task in self._batch_tasks:
+            task.cancel()
+        for items in self._pending.values():
+            _fail_pending(items, "registry was reset")
+        self._pending.clear()
+        self._entries.clear()
+        self._definitions.clear()
+        self._result_cache.clear()
 
     def get(self, name: str) -> Tool | None:
-        return self._tools.get(name)
+        entry = self._entries.get(name)
+        return entry.tool if entry else None
 
     async def execute(
         self,
@@ -32,41 +196,153 @@ class ToolRegistry:
         async_callback: AsyncCallback | None = None,
     ) -> ToolResult:
         """Execute a tool by name with arguments."""
-        tool = self._tools.get(name)
-        if tool is None:
+        # Nearly every call names a registered tool, so the hit path skips the
+        # None check and only an unknown name pays for the KeyError
+        try:
+            entry = self._entries[name]
+        except KeyError:
             return ToolResult.error(f"Unknown tool: {name}")
 
+        if entry.validate is not None:
+            try:
+                entry.validate(args)
+            except jsonschema.ValidationError as e:
+                return ToolResult.error(f"Invalid arguments for {name}: {e.message}")
+
+        cache_key = None
+        if entry.cacheable:
+            context = (channel, chat_id) if entry.set_context is not None else ()
+            try:
+                cache_key = (name, context, _canonical_args(args))
+            except (TypeError, ValueError):  # not JSON-serialisable
+                pass
+            else:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    # Callers may mutate their result; never hand out the cached one
+                    return dataclasses.replace(cached)
+
+        # A batch is served from the raw dicts, as BatchTool.batch_execute() takes
+        if entry.convert_args is not None and entry.batch_execute is None:
+            try:
+                args = entry.convert_args(args)
+            except ValidationError as e:
+                return ToolResult.error(f"Invalid arguments for {name}: {e}")
+
         # Inject context if tool supports it
-        if isinstance(tool, ContextualTool):
-            tool.set_context(channel, chat_id)
+        if entry.set_context is not None:
+            entry.set_context(channel, chat_id)
 
         # Set async callback if tool supports it
-        if isinstance(tool, AsyncTool) and async_callback:
-            tool.set_callback(async_callback)
+        if async_callback and entry.set_callback is not None:
+            entry.set_callback(async_callback)
 
         try:
-            return await tool.execute(args)
+            if entry.batch_execute is not None:
+                result = await self._execute_batched(name, entry, args)
+            else:
+                result = await entry.execute(args)
         except Exception as e:
             logger.exception("Tool '%s' failed", name)
             return ToolResult.error(f"Tool execution error: {e}")
 
-    def get_definitions(self) -> list[ToolDefinition]:
-        """Get tool definitions for LLM consumption."""
-        defs = []
-        for tool in self._tools.values():
-            defs.append(
-                ToolDefinition(
-                    function=ToolFunctionDefinition(
-                        name=tool.name(),
-                        description=tool.description(),
-                        parameters=tool.parameters(),
+        if cache_key is not None and not result.is_error:
+            self._result_cache[cache_key] = dataclasses.replace(result)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _execute_batched(
+        self, name: str, entry: _Entry, args: dict[str, Any]
+    ) -> asyncio.Future[ToolResult]:
+        """Queue a call for the tool's next batch, starting one if none is pending."""
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[ToolResult] = loop.create_future()
+        items = self._pending.get(name)
+        if items is None:
+            items = self._pending[name] = []
+            # Runs after the calls already scheduled in this loop iteration have queued
+            task = loop.create_task(self._run_batch(name, entry, items), name=f"tool-batch-{name}")
+            self._batch_tasks.add(task)
+            # Also covers a task cancelled before its first step, which never
+            # reaches _run_batch's own cleanup
+            task.add_done_callback(functools.partial(self._batch_done, name, items))
+        items.append((args, fut))
+        return fut
+
+    async def _run_batch(
+        self,
+        name: str,
+        entry: _Entry,
+        items: list[tuple[dict[str, Any], asyncio.Future[ToolResult]]],
+    ) -> None:
+        # Later calls start a new batch from here on
+        self._release_pending(name, items)
+        assert entry.batch_execute is not None
+        try:
+            try:
+                results = await entry.batch_execute([args for args, _ in items])
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"batch returned {len(results)} results for {len(items)} calls"
                     )
-                )
+            except Exception as e:
+                logger.exception("Tool '%s' failed", name)
+                results = [ToolResult.error(f"Tool execution error: {e}")] * len(items)
+            for (_, fut), result in zip(items, results, strict=True):
+                if not fut.done():
+                    fut.set_result(result)
+        finally:
+            # Cancelled or interrupted: no caller may be left waiting
+            _fail_pending(items, "batch was cancelled")
+
+    def _batch_done(
+        self,
+        name: str,
+        items: list[tuple[dict[str, Any], asyncio.Future[ToolResult]]],
+        task: asyncio.Task[None],
+    ) -> None:
+        self._batch_tasks.discard(task)
+        self._release_pending(name, items)
+        _fail_pending(items, "batch was cancelled")
+
+    def _release_pending(
+        self, name: str, items: list[tuple[dict[str, Any], asyncio.Future[ToolResult]]]
+    ) -> None:
+        if self._pending.get(name) is items:
+            del self._pending[name]
+
+    async def execute_many(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        channel: str = "",
+        chat_id: str = "",
+        async_callback: AsyncCallback | None = None,
+    ) -> list[ToolResult]:
+        """Execute independent (name, args) calls concurrently, results in call order.
+
+        Failures come back as error results (see execute()), so one failing
+        call never cancels its siblings.
+        """
+        return await asyncio.gather(
+            *(
+                self.execute(name, args, channel, chat_id, async_callback)
+                for name, args in calls
             )
-        return defs
+        )
+
+    def get_definitions(self) -> list[ToolDefinition]:
+        """Get tool definitions for LLM consumption.
+
+        Returns the registry's own list, built up by register(); callers must
+        not mutate it.
+        """
+        return self._definitions
 
-    def list_names(self) -> list[str]:
-        return list(self._tools.keys())
+    def list_names(self) -> KeysView[str]:
+        """Live, read-only view of the registered names (no copy per call)."""
+        return self._entries.keys()
 
     def count(self) -> int:
-        return len(self._tools)
+        return len(self._entries)
@@ -2,20 +2,61 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, Protocol
 
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
 logger = logging.getLogger(__name__)
 
+# Per-registry budget when registries are searched concurrently
+_REGISTRY_SEARCH_TIMEOUT = 3.0
+
+
+class SkillRegistry(Protocol):
+    """One skill registry, as used by the skills tools."""
+
+    async def search(self, query: str, limit: int) -> list[dict[str, Any]]:
+        ...
+
+    async def get_skill_meta(self, slug: str) -> dict[str, Any] | None:
+        ...
+
+    async def download_and_install(
+        self, slug: str, version: str, target_dir: str
+    ) -> dict[str, Any]:
+        ...
+
+
+class SkillRegistryManager(Protocol):
+    """The configured skill registries."""
+
+    def registries(self) -> Iterable[SkillRegistry]:
+        ...
+
+    def get_registry(self, name: str) -> SkillRegistry | None:
+        ...
+
+
+def _format_skill(r: dict[str, Any]) -> str:
+    slug = r["slug"]
+    registry = r["registry"]
+    return (
+        f"- {r['display_name']} ({slug})\n"
+        f"  {r['summary']}\n"
+        f"  Version: {r['version']} | Registry: {registry}\n"
+        f"  Install: install_skill(slug=\"{slug}\", registry=\"{registry}\")"
+    )
+
 
 class FindSkillsTool(Tool):
     """Search for skills across configured registries."""
 
     def __init__(self) -> None:
-        self._registry_manager: Any = None
+        self._registry_manager: SkillRegistryManager | None = None
 
     def name(self) -> str:
         return "find_skills"
@@ -37,7 +78,7 @@ class FindSkillsTool(Tool):
             "required": ["query"],
         }
 
-    def set_registry_manager(self, manager: Any) -> None:
+    def set_registry_manager(self, manager: SkillRegistryManager) -> None:
         self._registry_manager = manager
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
@@ -51,30 +92,41 @@ class FindSkillsTool(Tool):
             return ToolResult.error("No skill registries configured")
 
         try:
-            results = await self._registry_manager.search_all(query, limit)
+            results = await self._search(self._registry_manager, query, limit)
             if not results:
                 return ToolResult.success(f"No skills found for '{query}'")
 
-            lines = []
-            for r in results:
-                lines.append(
-                    f"- {r['display_name']} ({r['slug']})\n"
-                    f"  {r['summary']}\n"
-                    f"  Version: {r['version']} | Registry: {r['registry']}\n"
-                    f"  Install: install_skill(slug=\"{r['slug']}\", "
-                    f"registry=\"{r['registry']}\")"
-                )
-            return ToolResult.success("\n\n".join(lines))
+            return ToolResult.success("\n\n".join([_format_skill(r) for r in results]))
         except Exception as e:
             return ToolResult.error(f"Search failed: {e}")
 
+    async def _search(
+        self, manager: SkillRegistryManager, query: str, limit: int
+    ) -> list[dict[str, Any]]:
+        """Query every registry at once; a slow or failing one only loses its own hits."""
+        batches = await asyncio.gather(
+            *(
+                asyncio.wait_for(reg.search(query, limit), timeout=_REGISTRY_SEARCH_TIMEOUT)
+                for reg in manager.registries()
+            ),
+            return_exceptions=True,
+        )
+        results: list[dict[str, Any]] = []
+        for batch in batches:
+            if isinstance(batch, BaseException):
+                logger.warning("Skill registry search failed: %s", batch)
+            else:
+                results.extend(batch)
+        results.sort(key=lambda r: r.get("score", 0), reverse=True)
+        return results[:limit]
+
 
 class InstallSkillTool(Tool):
     """Install a skill from a registry."""
 
     def __init__(self, workspace: str = ""):
         self._workspace = workspace
-        self._registry_manager: Any = None
+        self._registry_manager: SkillRegistryManager | None = None
 
     def name(self) -> str:
         return "install_skill"
@@ -101,7 +153,7 @@ class InstallSkillTool(Tool):
             "required": ["slug", "registry"],
         }
 
-    def set_registry_manager(self, manager: Any) -> None:
+    def set_registry_manager(self, manager: SkillRegistryManager) -> None:
         self._registry_manager = manager
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
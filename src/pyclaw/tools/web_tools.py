@@ -2,16 +2,81 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from html.parser import HTMLParser
 from typing import Any
+from urllib.parse import parse_qs, urlsplit
 
-import httpx
-
+from pyclaw.http_client import shared_http_client
 from pyclaw.models import ToolResult
 from pyclaw.protocols import Tool
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Search API bodies are parsed straight from the raw bytes
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# web_fetch returns at most this many characters of a page
+_FETCH_MAX_CHARS = 50000
+
+class _DuckDuckGoParser(HTMLParser):
+    """Collect title/url/snippet rows from DuckDuckGo's HTML results page."""
+
+    _FIELDS = {"result__a": "title", "result__snippet": "content"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rows: list[dict[str, str]] = []
+        self._field = ""
+        self._tag = ""
+        self._depth = 0
+        self._text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._field:
+            if tag == self._tag:
+                self._depth += 1
+            return
+        attr = dict(attrs)
+        classes = (attr.get("class") or "").split()
+        field = next((self._FIELDS[c] for c in classes if c in self._FIELDS), "")
+        if not field:
+            return
+        if field == "title":
+            url = _result_url(attr.get("href") or "")
+            self.rows.append({"title": "", "url": url, "content": ""})
+        elif not self.rows:
+            return
+        self._field, self._tag, self._depth = field, tag, 1
+        self._text = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._field and tag == self._tag:
+            self._depth -= 1
+            if self._depth == 0:
+                self.rows[-1][self._field] = " ".join("".join(self._text).split())
+                self._field = ""
+
+    def handle_data(self, data: str) -> None:
+        if self._field:
+            self._text.append(data)
+
+
+def _result_url(href: str) -> str:
+    """Unwrap DuckDuckGo's /l/?uddg=<target> redirect links."""
+    parts = urlsplit(href)
+    if parts.path.startswith("/l/"):
+        target = parse_qs(parts.query).get("uddg")
+        if target:
+            return target[0]
+    return href
+
 
 class WebFetchTool(Tool):
     """Fetch content from a URL."""
@@ -36,13 +101,23 @@ class WebFetchTool(Tool):
         if not url:
             return ToolResult.error("No URL provided")
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                resp = await client.get(url)
+            # Decode incrementally and stop reading once past the limit, so a
+            # huge page is never held in memory in full
+            parts: list[str] = []
+            size = 0
+            async with shared_http_client().stream(
+                "GET", url, follow_redirects=True, timeout=30.0
+            ) as resp:
                 resp.raise_for_status()
-                content = resp.text
-                if len(content) > 50000:
-                    content = content[:50000] + "\n... (content truncated)"
-                return ToolResult.success(content)
+                async for chunk in resp.aiter_text():
+                    parts.append(chunk)
+                    size += len(chunk)
+                    if size > _FETCH_MAX_CHARS:
+                        break
+            content = "".join(parts)
+            if size > _FETCH_MAX_CHARS:
+                content = content[:_FETCH_MAX_CHARS] + "\n... (content truncated)"
+            return ToolResult.success(content)
         except Exception as e:
             return ToolResult.error(f"Error fetching URL: {e}")
 
@@ -90,44 +165,48 @@ class WebSearchTool(Tool):
 
     async def _search_brave(self, query: str, num: int) -> ToolResult:
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={"q": query, "count": num},
-                    headers={"X-Subscription-Token": self._brave_key, "Accept": "application/json"},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                results = data.get("web", {}).get("results", [])
-                return self._format_results(results, "title", "url", "description")
+            resp = await shared_http_client().get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": query, "count": num},
+                headers={"X-Subscription-Token": self._brave_key, "Accept": "application/json"},
+                timeout=15.0,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            results = data.get("web", {}).get("results", [])
+            return self._format_results(results, "title", "url", "description")
         except Exception as e:
             return ToolResult.error(f"Brave search error: {e}")
 
     async def _search_tavily(self, query: str, num: int) -> ToolResult:
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                resp = await client.post(
-                    "https://api.tavily.com/search",
-                    json={"query": query, "max_results": num, "api_key": self._tavily_key},
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                results = data.get("results", [])
-                return self._format_results(results, "title", "url", "content")
+            resp = await shared_http_client().post(
+                "https://api.tavily.com/search",
+                json={"query": query, "max_results": num, "api_key": self._tavily_key},
+                timeout=15.0,
+            )
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+            results = data.get("results", [])
+            return self._format_results(results, "title", "url", "content")
         except Exception as e:
             return ToolResult.error(f"Tavily search error: {e}")
 
     async def _search_duckduckgo(self, query: str, num: int) -> ToolResult:
         try:
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                resp = await client.get(
-                    "https://html.duckduckgo.com/html/",
-                    params={"q": query},
-                    headers={"User-Agent": "pyclaw/0.1"},
-                )
-                # Simple parse — this is a fallback; for production use DDGS library
-                text = resp.text
-                return ToolResult.success(f"DuckDuckGo results for '{query}':\n{text[:5000]}")
+            resp = await shared_http_client().get(
+                "https://html.duckduckgo.com/html/",
+                params={"q": query},
+                headers={"User-Agent": "pyclaw/0.1"},
+                follow_redirects=True,
+                timeout=15.0,
+            )
+            resp.raise_for_status()
+            # Only the result titles, links and snippets, not the page markup
+            parser = _DuckDuckGoParser()
+            parser.feed(resp.text)
+            parser.close()
+            return self._format_results(parser.rows[:num], "title", "url", "content")
         except Exception as e:
             return ToolResult.error(f"DuckDuckGo search error: {e}")
 
@@ -138,10 +217,8 @@ class WebSearchTool(Tool):
         url_key: str,
         snippet_key: str,
     ) -> ToolResult:
-        lines = []
-        for i, r in enumerate(results, 1):
-            title = r.get(title_key, "")
-            url = r.get(url_key, "")
-            snippet = r.get(snippet_key, "")
-            lines.append(f"{i}. {title}\n   {url}\n   {snippet}")
+        lines = [
+            f"{i}. {r.get(title_key, '')}\n   {r.get(url_key, '')}\n   {r.get(snippet_key, '')}"
+            for i, r in enumerate(results, 1)
+        ]
         return ToolResult.success("\n\n".join(lines) if lines else "No results found")
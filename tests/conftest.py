@@ -0,0 +1,27 @@
+"""Shared test fixtures."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_SHM = Path("/dev/shm")
+
+
+@pytest.fixture
+def fast_tmp_path(tmp_path):
+    """A temporary directory on tmpfs when available, else ``tmp_path``.
+
+    For persistence tests that write and re-read small stores many times:
+    tmpfs keeps those round trips off the disk.
+    """
+    if not (_SHM.is_dir() and os.access(_SHM, os.W_OK)):
+        yield tmp_path
+        return
+    path = Path(tempfile.mkdtemp(prefix="pyclaw-test-", dir=_SHM))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
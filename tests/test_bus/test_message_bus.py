@@ -26,6 +26,29 @@ async def test_outbound_pub_sub():
     assert received.content == "response"
 
 
+@pytest.mark.asyncio
+async def test_batch_publish_and_consume():
+    bus = MessageBus(maxsize=4)
+    msgs = [OutboundMessage(channel="test", content=str(i)) for i in range(3)]
+    await bus.publish_outbound_many(msgs)
+    batch = await bus.consume_outbound_batch(max_n=2)
+    assert [m.content for m in batch] == ["0", "1"]
+    assert [m.content for m in await bus.consume_outbound_batch()] == ["2"]
+
+    await bus.publish_inbound_many([InboundMessage(channel="test", content="in")])
+    assert [m.content for m in await bus.consume_inbound_batch()] == ["in"]
+    bus.close()
+    assert await bus.consume_inbound_batch() == []
+
+
+@pytest.mark.asyncio
+async def test_try_consume_does_not_wait():
+    bus = MessageBus()
+    assert bus.try_consume_inbound() is None
+    await bus.publish_inbound(InboundMessage(channel="test", content="queued"))
+    assert bus.try_consume_inbound().content == "queued"
+
+
 @pytest.mark.asyncio
 async def test_consume_timeout():
     bus = MessageBus()
@@ -39,3 +62,10 @@ async def test_close():
     bus.close()
     received = await bus.consume_inbound()
     assert received is None
+
+
+def test_closed_property():
+    bus = MessageBus()
+    assert not bus.closed
+    bus.close()
+    assert bus.closed
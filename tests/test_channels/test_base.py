@@ -7,6 +7,8 @@ from pyclaw.channels.base import BaseChannel, ChannelManager
 from pyclaw.models import OutboundMessage
 
 
+# Function-scoped on purpose: tests share one event loop, but messages a test
+# leaves on the bus queues must not be consumed by the next one.
 @pytest.fixture
 def bus():
     return MessageBus()
@@ -26,6 +28,9 @@ class DummyChannel(BaseChannel):
     async def send(self, msg):
         self.sent.append(msg)
 
+    async def send_many(self, msgs):
+        self.sent.extend(msgs)
+
 
 def test_allow_list_empty(bus):
     ch = DummyChannel("test", bus, [])
@@ -63,8 +68,8 @@ async def test_handle_message_publishes(bus):
 async def test_handle_message_rejected(bus):
     ch = DummyChannel("test", bus, ["allowed_only"])
     await ch.handle_message("not_allowed", "chat1", "hello")
-    msg = await bus.consume_inbound()
-    assert msg is None
+    # handle_message publishes before returning, so nothing to wait for
+    assert bus.try_consume_inbound() is None
 
 
 @pytest.mark.asyncio
@@ -84,5 +89,23 @@ async def test_channel_manager(bus):
     assert len(ch1.sent) == 1
     assert ch1.sent[0].content == "hello"
 
+    await mgr.send_to_channel_batch("ch2", [("c1", "one"), ("c2", "two")])
+    assert [(m.chat_id, m.content) for m in ch2.sent] == [("c1", "one"), ("c2", "two")]
+
     await mgr.stop_all()
     assert not ch1.is_running()
+
+
+@pytest.mark.asyncio
+async def test_default_send_many_attempts_all_then_raises(bus):
+    class Flaky(DummyChannel):
+        async def send(self, msg):
+            if msg.content == "bad":
+                raise RuntimeError("boom")
+            self.sent.append(msg)
+
+    ch = Flaky("flaky", bus)
+    msgs = [OutboundMessage(channel="flaky", content=c) for c in ("a", "bad", "b")]
+    with pytest.raises(RuntimeError):
+        await BaseChannel.send_many(ch, msgs)
+    assert [m.content for m in ch.sent] == ["a", "b"]
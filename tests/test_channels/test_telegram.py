@@ -2,6 +2,7 @@
 
 import pytest
 
+from pyclaw.channels import telegram_markdown
 from pyclaw.channels.telegram import markdown_to_telegram_html
 
 
@@ -87,3 +88,28 @@ class TestMarkdownToTelegramHTML:
         assert "<b>" not in result
         assert "<i>" not in result
         assert "**not bold**" in result or "not bold" in result
+
+    def test_link_url_left_untouched(self):
+        result = markdown_to_telegram_html("[docs](https://x.io/a_b_c?q=1&r=**2**)")
+        assert result == '<a href="https://x.io/a_b_c?q=1&amp;r=**2**">docs</a>'
+
+    def test_markers_inside_code_not_paired(self):
+        result = markdown_to_telegram_html("the_var and `x_y`")
+        assert result == "the_var and <code>x_y</code>"
+
+    def test_overlapping_markers_nest_properly(self):
+        result = markdown_to_telegram_html("**a _b** c_")
+        assert result == "<b>a _b</b> c_"
+
+    def test_formatting_inside_list_and_quote(self):
+        result = markdown_to_telegram_html("> - **item** [x](u)")
+        assert result == '• <b>item</b> <a href="u">x</a>'
+
+    def test_short_results_memoized_long_ones_not(self):
+        cache = telegram_markdown._convert_markdown_cached
+        cache.cache_clear()
+        assert markdown_to_telegram_html("**hi**") == markdown_to_telegram_html("**hi**")
+        assert cache.cache_info().hits == 1
+        long_text = "x" * (telegram_markdown.MAX_MESSAGE_LENGTH + 1)
+        assert markdown_to_telegram_html(long_text) == long_text
+        assert cache.cache_info().currsize == 1
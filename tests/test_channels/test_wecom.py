@@ -0,0 +1,49 @@
+"""Tests for the WeCom app channel token handling."""
+
+import httpx
+import pytest
+
+from pyclaw.bus.message_bus import MessageBus
+from pyclaw.channels.wecom import WeComAppChannel
+
+
+class _Config:
+    corp_id = "corp"
+    corp_secret = "secret"
+    agent_id = "1"
+    allow_from: list[str] = []
+
+
+def _fake_client(payload):
+    class FakeClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def get(self, url, params=None):
+            return httpx.Response(200, json=payload, request=httpx.Request("GET", url))
+
+    return FakeClient
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_rejects_error_response(monkeypatch):
+    ch = WeComAppChannel(_Config(), MessageBus())
+    ch._access_token = "old"
+    monkeypatch.setattr(
+        httpx, "AsyncClient", _fake_client({"errcode": 40001, "errmsg": "invalid credential"})
+    )
+    with pytest.raises(RuntimeError, match="40001"):
+        await ch._refresh_token()
+    assert ch._access_token == "old"
+
+    monkeypatch.setattr(
+        httpx, "AsyncClient", _fake_client({"errcode": 0, "access_token": "new", "expires_in": 60})
+    )
+    await ch._refresh_token()
+    assert ch._access_token == "new"
@@ -1,21 +1,25 @@
 """Tests for WhatsApp channel features."""
 
-import asyncio
 import json
 
 import pytest
 
 from pyclaw.bus.message_bus import MessageBus
 from pyclaw.channels.whatsapp import WhatsAppChannel, WhatsAppConfig
+from pyclaw.models import OutboundMessage
 
 
+# Function-scoped on purpose: tests share one event loop, but messages a test
+# leaves on the bus queues must not be consumed by the next one.
 @pytest.fixture
 def bus():
     return MessageBus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config():
+    # Validated once and never mutated by the channel; a test that needs other
+    # settings should derive them with config.model_copy(update=...)
     return WhatsAppConfig(bridge_url="ws://localhost:9999")
 
 
@@ -80,8 +84,7 @@ class TestWhatsAppPeerDetection:
         ch._handle_incoming_message(
             {"type": "message", "from": "user1", "content": "hi"}
         )
-        # Give fire-and-forget task a chance to run
-        await asyncio.sleep(0.05)
+        # consume_inbound blocks until the fire-and-forget publish lands
         msg = await bus.consume_inbound()
         assert msg is not None
         assert msg.metadata["peer_kind"] == "direct"
@@ -100,7 +103,6 @@ class TestWhatsAppPeerDetection:
                 "content": "hi",
             }
         )
-        await asyncio.sleep(0.05)
         msg = await bus.consume_inbound()
         assert msg is not None
         assert msg.metadata["peer_kind"] == "group"
@@ -126,7 +128,6 @@ class TestWhatsAppMetadata:
                 "content": "hi",
             }
         )
-        await asyncio.sleep(0.05)
         msg = await bus.consume_inbound()
         assert msg is not None
         assert msg.metadata["user_name"] == "Alice"
@@ -144,7 +145,6 @@ class TestWhatsAppMetadata:
                 "content": "hi",
             }
         )
-        await asyncio.sleep(0.05)
         msg = await bus.consume_inbound()
         assert msg is not None
         assert msg.metadata["message_id"] == "msg-42"
@@ -161,8 +161,19 @@ class TestWhatsAppSend:
         """send() should raise RuntimeError when not connected."""
         ch = WhatsAppChannel(config, bus)
         with pytest.raises(RuntimeError, match="not established"):
-            await ch.send(
-                __import__("pyclaw.models", fromlist=["OutboundMessage"]).OutboundMessage(
-                    channel="whatsapp", chat_id="user1", content="hello"
-                )
-            )
+            await ch.send(OutboundMessage(channel="whatsapp", chat_id="user1", content="hello"))
+
+    @pytest.mark.asyncio
+    async def test_send_uses_text_frame(self, bus, config):
+        """send() should write the JSON payload as a text frame."""
+        sent: list = []
+
+        class FakeWS:
+            async def send(self, data):
+                sent.append(data)
+
+        ch = WhatsAppChannel(config, bus)
+        ch._ws = FakeWS()
+        await ch.send(OutboundMessage(channel="whatsapp", chat_id="user1", content="héllo"))
+        assert isinstance(sent[0], str)
+        assert json.loads(sent[0]) == {"type": "message", "to": "user1", "content": "héllo"}
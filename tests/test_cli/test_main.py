@@ -0,0 +1,23 @@
+"""Tests for the CLI entry point."""
+
+import typer
+
+from pyclaw.cli.main import app
+
+
+def test_subcommand_groups_registered():
+    group = typer.main.get_command(app)
+    ctx = group.make_context("pyclaw", ["version"])
+    names = group.list_commands(ctx)
+    for name in ("auth", "cron", "skills"):
+        assert name in names
+        assert group.get_command(ctx, name) is not None
+
+
+def test_resolved_subcommand_group_listed_once():
+    group = typer.main.get_command(app)
+    ctx = group.make_context("pyclaw", ["version"])
+    assert group.get_command(ctx, "cron") is not None
+    names = group.list_commands(ctx)
+    assert len(names) == len(set(names))
+    assert "cron" in names
@@ -14,7 +14,7 @@ def test_load_yaml_config():
         "agents": {"defaults": {"model": "test-model"}},
     }
     with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-        yaml.dump(data, f)
+        yaml.dump(data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
         f.flush()
         cfg = load_config(f.name)
     assert cfg.agents.defaults.model == "test-model"
@@ -35,3 +35,56 @@ def test_load_nonexistent_config():
     import pytest
     with pytest.raises(FileNotFoundError):
         load_config("/nonexistent/config.yaml")
+
+
+def test_load_config_cached_copy(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({"agents": {"defaults": {"model": "cached"}}}))
+
+    cfg1 = load_config(path)
+    cfg1.agents.defaults.model = "mutated"
+    cfg2 = load_config(path)
+    assert cfg2.agents.defaults.model == "cached"
+
+    load_config.cache_clear()
+    assert load_config(path).agents.defaults.model == "cached"
+
+
+def test_default_config_path_follows_the_filesystem(tmp_path, monkeypatch):
+    from pyclaw.config import loader
+
+    monkeypatch.setattr(loader, "DEFAULT_CONFIG_DIR", tmp_path)
+    default_model = load_config().agents.defaults.model
+
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump({"agents": {"defaults": {"model": "created"}}}))
+    assert load_config().agents.defaults.model == "created"
+
+    path.unlink()
+    assert load_config().agents.defaults.model == default_model
+
+
+def test_save_config_json_roundtrip(tmp_path):
+    from pyclaw.config.loader import save_config
+    from pyclaw.config.models import Config
+
+    cfg = Config()
+    cfg.agents.defaults.model = "saved-model"
+    target = tmp_path / "config.json"
+    save_config(cfg, target)
+
+    assert json.loads(target.read_text())["agents"]["defaults"]["model"] == "saved-model"
+    assert load_config(target).agents.defaults.model == "saved-model"
+
+
+def test_save_config_yaml_roundtrip(tmp_path):
+    from pyclaw.config.loader import save_config
+    from pyclaw.config.models import Config
+
+    cfg = Config()
+    cfg.agents.defaults.model = "yaml-model"
+    target = tmp_path / "config.yaml"
+    save_config(cfg, target)
+
+    assert "!!python" not in target.read_text()
+    assert load_config(target).agents.defaults.model == "yaml-model"
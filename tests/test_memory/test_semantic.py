@@ -1,5 +1,7 @@
 """Tests for semantic memory."""
 
+import hashlib
+
 import pytest
 
 from pyclaw.memory.semantic import SemanticMemory, _cosine_similarity, _hash_embedding
@@ -17,6 +19,16 @@ def test_hash_embedding_different():
     assert e1 != e2
 
 
+def test_hash_embedding_buckets_match_existing_stores():
+    # Stored vectors were bucketed with int(md5(word).hexdigest(), 16)
+    text = "stored vectors keep their buckets"
+    expected = [0.0] * 64
+    for word in text.split():
+        expected[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1.0
+    got = _hash_embedding(text, 64)
+    assert [i for i, x in enumerate(got) if x] == [i for i, x in enumerate(expected) if x]
+
+
 def test_cosine_self_similarity():
     vec = [1.0, 2.0, 3.0]
     assert abs(_cosine_similarity(vec, vec) - 1.0) < 0.001
@@ -28,9 +40,21 @@ def test_cosine_orthogonal():
     assert abs(_cosine_similarity(a, b)) < 0.001
 
 
+def test_cosine_numpy_matches_fallback(monkeypatch):
+    from pyclaw.memory import semantic
+
+    np = pytest.importorskip("numpy")
+    a = _hash_embedding("alpha beta gamma", 128)
+    b = _hash_embedding("beta gamma delta", 128)
+    fast = _cosine_similarity(np.asarray(a, dtype=np.float32), b)
+    monkeypatch.setattr(semantic, "np", None)
+    assert abs(fast - _cosine_similarity(a, b)) < 1e-6
+    assert _cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+
+
 @pytest.mark.asyncio
-async def test_add_and_search(tmp_path):
-    mem = SemanticMemory(str(tmp_path), dimensions=128)
+async def test_add_and_search(fast_tmp_path):
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=128)
     await mem.add("Python is a programming language")
     await mem.add("JavaScript runs in browsers")
     await mem.add("Cooking recipes need ingredients")
@@ -43,19 +67,211 @@ async def test_add_and_search(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_persistence(tmp_path):
-    mem1 = SemanticMemory(str(tmp_path), dimensions=64)
+async def test_persistence(fast_tmp_path):
+    mem1 = SemanticMemory(str(fast_tmp_path), dimensions=64)
     await mem1.add("test entry")
     assert mem1.count() == 1
 
-    mem2 = SemanticMemory(str(tmp_path), dimensions=64)
+    mem2 = SemanticMemory(str(fast_tmp_path), dimensions=64)
     assert mem2.count() == 1
 
 
 @pytest.mark.asyncio
-async def test_clear(tmp_path):
-    mem = SemanticMemory(str(tmp_path), dimensions=64)
+async def test_clear(fast_tmp_path):
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=64)
     await mem.add("entry")
     assert mem.count() == 1
     mem.clear()
     assert mem.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_search_matches_scalar_fallback(fast_tmp_path, monkeypatch):
+    from pyclaw.memory import semantic
+
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=64)
+    for text in ["alpha beta", "beta gamma", "gamma delta", "alpha alpha beta", "unrelated"]:
+        await mem.add(text)
+
+    fast = await mem.search("alpha beta", top_k=3, threshold=0.0)
+    monkeypatch.setattr(semantic, "np", None)
+    slow = await mem.search("alpha beta", top_k=3, threshold=0.0)
+
+    assert [r.text for r in fast] == [r.text for r in slow]
+    for a, b in zip(fast, slow, strict=True):
+        assert abs(a.score - b.score) < 1e-5
+
+
+@pytest.mark.asyncio
+async def test_search_matrix_grows_in_place(fast_tmp_path):
+    pytest.importorskip("numpy")
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=64)
+    await mem.add("alpha beta")
+    await mem.search("alpha", threshold=0.0)
+    await mem.add_many([("gamma delta", None), ("epsilon", None)])
+    await mem.add("zeta eta")
+    results = await mem.search("zeta eta", top_k=1)
+    assert results[0].text == "zeta eta"
+    assert mem._matrix_rows == 4
+    # Appended rows match a full rebuild of the normalised matrix
+    rebuilt = mem._stack_embeddings()
+    rebuilt /= (rebuilt**2).sum(axis=1, keepdims=True) ** 0.5
+    assert abs(mem._normalized_matrix() - rebuilt).max() < 1e-6
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_store_migrates(fast_tmp_path):
+    import json
+
+    pytest.importorskip("numpy")
+    mem_dir = fast_tmp_path / "memory"
+    mem_dir.mkdir()
+    legacy = [{"text": "old entry", "embedding": _hash_embedding("old entry", 64)}]
+    (mem_dir / "vectors.json").write_text(json.dumps(legacy))
+
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=64)
+    assert mem.count() == 1
+    await mem.add("new entry")
+    mem.compact()
+
+    assert [p.name for p in mem_dir.glob("vectors.*.npy")] == ["vectors.1.npy"]
+    assert not (mem_dir / "vectors.json").exists()
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=64)
+    results = await reloaded.search("old entry", top_k=1)
+    assert results[0].text == "old entry"
+
+
+@pytest.mark.asyncio
+async def test_add_many_batches_embeddings(fast_tmp_path):
+    calls = []
+
+    async def embed_batch(texts):
+        calls.append(list(texts))
+        return [_hash_embedding(t, 32) for t in texts]
+
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32, embed_batch_fn=embed_batch)
+    await mem.add_many([("first entry", None), ("second entry", {"k": "v"})])
+    assert calls == [["first entry", "second entry"]]
+    assert mem.count() == 2
+    assert SemanticMemory(str(fast_tmp_path), dimensions=32).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_save_delay_defers_writes(fast_tmp_path):
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32, save_delay=60.0)
+    await mem.add("one")
+    await mem.add("two")
+    assert SemanticMemory(str(fast_tmp_path), dimensions=32).count() == 0
+    mem.flush()
+    assert SemanticMemory(str(fast_tmp_path), dimensions=32).count() == 2
+
+
+def test_hash_embedding_numpy_matches_fallback(monkeypatch):
+    from pyclaw.memory import semantic
+
+    fast = _hash_embedding("the quick brown fox jumps over the lazy dog", 64)
+    monkeypatch.setattr(semantic, "np", None)
+    slow = _hash_embedding("the quick brown fox jumps over the lazy dog", 64)
+    assert all(abs(a - b) < 1e-9 for a, b in zip(fast, slow, strict=True))
+
+
+@pytest.mark.asyncio
+async def test_add_appends_to_log_and_compacts(fast_tmp_path):
+    mem_dir = fast_tmp_path / "memory"
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("first")
+    await mem.add("second")
+    assert (mem_dir / "vectors.0.log").read_bytes().count(b"\n") == 2
+    assert SemanticMemory(str(fast_tmp_path), dimensions=32).count() == 2
+
+    mem.compact()
+    assert not (mem_dir / "vectors.0.log").exists()
+    await mem.add("third")
+    mem.close()
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert [e.text for e in reloaded._entries] == ["first", "second", "third"]
+
+
+@pytest.mark.asyncio
+async def test_torn_snapshot_falls_back_to_previous_generation(fast_tmp_path):
+    pytest.importorskip("numpy")
+    mem_dir = fast_tmp_path / "memory"
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("first")
+    mem.compact()
+    await mem.add("second")
+    mem.compact()
+    assert sorted(p.name for p in mem_dir.iterdir()) == [
+        "vectors.2.meta.json",
+        "vectors.2.npy",
+    ]
+    # Crash after the next generation's vectors but before its metadata
+    (mem_dir / "vectors.3.npy").write_bytes((mem_dir / "vectors.2.npy").read_bytes()[:50])
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert [e.text for e in reloaded._entries] == ["first", "second"]
+
+    # The next save supersedes both the good and the torn generation
+    reloaded.compact()
+    assert sorted(p.name for p in mem_dir.iterdir()) == [
+        "vectors.4.meta.json",
+        "vectors.4.npy",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_npy_snapshot_survives_a_run_without_numpy(fast_tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    from pyclaw.memory import semantic
+
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("kept")
+    await mem.add("also kept")
+    mem.compact()
+    mem.close()
+
+    with monkeypatch.context() as m:
+        m.setattr(semantic, "np", None)
+        no_numpy = SemanticMemory(str(fast_tmp_path), dimensions=32)
+        # Writing would replace the snapshot this process cannot read
+        with pytest.raises(RuntimeError, match="needs numpy"):
+            await no_numpy.add("other")
+        with pytest.raises(RuntimeError, match="needs numpy"):
+            no_numpy.compact()
+        no_numpy.close()
+
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert sorted(e.text for e in reloaded._entries) == ["also kept", "kept"]
+    await reloaded.add("new")
+    reloaded.compact()
+    again = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert sorted(e.text for e in again._entries) == ["also kept", "kept", "new"]
+
+
+@pytest.mark.asyncio
+async def test_log_of_compacted_generation_not_replayed(fast_tmp_path):
+    mem_dir = fast_tmp_path / "memory"
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("first")
+    await mem.add("second")
+    old_log = (mem_dir / "vectors.0.log").read_bytes()
+    mem.compact()
+    # Crash after the snapshot was committed but before the old log was removed
+    (mem_dir / "vectors.0.log").write_bytes(old_log)
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert [e.text for e in reloaded._entries] == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_append_after_torn_log_line_starts_new_line(fast_tmp_path):
+    mem_dir = fast_tmp_path / "memory"
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("first")
+    mem.close()
+    with open(mem_dir / "vectors.0.log", "ab") as f:
+        f.write(b'{"text": "torn')
+
+    mem = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    await mem.add("second")
+    mem.close()
+    reloaded = SemanticMemory(str(fast_tmp_path), dimensions=32)
+    assert [e.text for e in reloaded._entries] == ["first", "second"]
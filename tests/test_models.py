@@ -31,12 +31,21 @@ def test_tool_result_constructors():
     assert ToolResult.error("bad").is_error is True
     assert ToolResult.silent_result("shhh").silent is True
     assert ToolResult.async_result("later").is_async is True
+    assert not hasattr(ToolResult.success("ok"), "__dict__")
+    assert ToolResult.user_result("hi").model_dump() == {
+        "for_llm": "",
+        "for_user": "hi",
+        "silent": False,
+        "is_error": False,
+        "is_async": False,
+    }
 
 
 def test_llm_response():
     resp = LLMResponse(content="Hello!", finish_reason="stop")
     assert resp.content == "Hello!"
     assert resp.tool_calls == []
+    assert LLMResponse.model_construct(content="Hi") == LLMResponse(content="Hi")
 
 
 def test_inbound_message():
@@ -48,3 +57,11 @@ def test_session_default():
     session = Session(key="test")
     assert session.messages == []
     assert session.summary == ""
+
+
+def test_from_dict_helpers():
+    msg = Message.from_dict({"role": "assistant", "tool_calls": [{"id": "c1"}]})
+    assert isinstance(msg.tool_calls[0], ToolCall)
+    assert InboundMessage.from_dict({"channel": "cli"}).channel == "cli"
+    session = Session.from_dict({"key": "s", "messages": [{"role": "user", "content": "hi"}]})
+    assert session.messages[0].content == "hi"
@@ -0,0 +1,30 @@
+"""Tests for the provider factory."""
+
+from pyclaw.config.models import Config, ModelConfig
+from pyclaw.http_client import close_shared_http_client, shared_http_client
+from pyclaw.providers.factory import create_provider
+
+
+async def test_providers_share_http_client():
+    cfg = Config(model_list=[
+        ModelConfig(model_name="gpt", model="openai/gpt-4o", api_key="k1"),
+        ModelConfig(model_name="claude", model="anthropic/claude-x", api_key="k2"),
+    ])
+    oai = create_provider("gpt", cfg)
+    claude = create_provider("claude", cfg)
+    try:
+        assert oai._client._client is claude._client._client
+    finally:
+        await close_shared_http_client()
+    assert oai._client._client.is_closed
+
+
+async def test_shared_http_client_reused_until_closed():
+    client = shared_http_client()
+    try:
+        assert shared_http_client() is client
+    finally:
+        await close_shared_http_client()
+    assert client.is_closed
+    assert shared_http_client() is not client
+    await close_shared_http_client()
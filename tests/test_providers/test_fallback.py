@@ -0,0 +1,122 @@
+"""Tests for the provider fallback chain."""
+
+import asyncio
+import time
+
+import pytest
+
+from pyclaw.models import FailoverReason, FallbackCandidate, LLMResponse
+from pyclaw.providers.fallback import FallbackChain, _classify_error
+
+
+def test_classify_error():
+    assert _classify_error(Exception("HTTP 401 Unauthorized")) is FailoverReason.AUTH
+    assert _classify_error(Exception("Rate limit exceeded")) is FailoverReason.RATE_LIMIT
+    assert _classify_error(Exception("Quota exhausted")) is FailoverReason.BILLING
+    assert _classify_error(Exception("Request Timed Out")) is FailoverReason.TIMEOUT
+    assert _classify_error(Exception("server overloaded")) is FailoverReason.OVERLOADED
+    assert _classify_error(Exception("boom")) is FailoverReason.UNKNOWN
+
+
+def test_classify_error_keeps_priority_order():
+    # "rate" appears first, but auth outranks it
+    assert _classify_error(Exception("rate limited: auth failed")) is FailoverReason.AUTH
+
+
+async def test_failed_candidate_enters_cooldown():
+    class _Failing:
+        calls = 0
+
+        async def chat(self, messages, tools, model, options=None):
+            self.calls += 1
+            raise RuntimeError("429 rate limited")
+
+    provider = _Failing()
+    chain = FallbackChain({"p": provider})
+    candidates = [FallbackCandidate(provider="p", model="m")]
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await chain.execute(candidates, [], [])
+    assert provider.calls == 1
+
+
+async def test_skipped_candidates_recorded_before_live_ones():
+    class _Ok:
+        async def chat(self, messages, tools, model, options=None):
+            return LLMResponse(content=model)
+
+    chain = FallbackChain({"ok": _Ok()})
+    chain._cooldowns["ok:cold"] = time.monotonic_ns()
+    candidates = [
+        FallbackCandidate(provider="ok", model="cold"),
+        FallbackCandidate(provider="missing", model="m"),
+        FallbackCandidate(provider="ok", model="warm"),
+    ]
+    response, attempts = await chain.execute(candidates, [], [])
+    assert response.content == "warm"
+    assert [a.skipped for a in attempts] == [True, True, False]
+    assert attempts[0].reason is FailoverReason.RATE_LIMIT
+
+
+async def test_speculative_returns_first_success_and_cancels_losers():
+    class _Slow:
+        cancelled = False
+
+        async def chat(self, messages, tools, model, options=None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+            return LLMResponse(content="slow")
+
+    class _Fast:
+        async def chat(self, messages, tools, model, options=None):
+            return LLMResponse(content="fast")
+
+    slow = _Slow()
+    chain = FallbackChain({"slow": slow, "fast": _Fast()}, speculative=2)
+    candidates = [
+        FallbackCandidate(provider="slow", model="a"),
+        FallbackCandidate(provider="fast", model="b"),
+    ]
+    response, attempts = await chain.execute(candidates, [], [])
+    assert response.content == "fast"
+    assert slow.cancelled
+    assert [(a.provider, a.skipped) for a in attempts] == [("fast", False), ("slow", True)]
+
+
+async def test_speculative_duplicate_in_flight_not_reported_as_cooldown():
+    class _Ok:
+        async def chat(self, messages, tools, model, options=None):
+            await asyncio.sleep(0)
+            return LLMResponse(content=model)
+
+    chain = FallbackChain({"ok": _Ok()}, speculative=2)
+    candidates = [
+        FallbackCandidate(provider="ok", model="m"),
+        FallbackCandidate(provider="ok", model="m"),
+    ]
+    response, attempts = await chain.execute(candidates, [], [])
+    assert response.content == "m"
+    skipped = [a for a in attempts if a.skipped]
+    assert [(a.error, a.reason) for a in skipped] == [
+        ("Duplicate already in flight", FailoverReason.UNKNOWN)
+    ]
+
+
+async def test_cancelled_race_does_not_claim_a_winner():
+    class _Hang:
+        async def chat(self, messages, tools, model, options=None):
+            await asyncio.sleep(10)
+
+    provider = _Hang()
+    chain = FallbackChain({"p": provider}, speculative=2)
+    live = [(provider, "p", "a", "p:a"), (provider, "p", "b", "p:b")]
+    attempts = []
+    task = asyncio.ensure_future(chain._race(live, set(), attempts, [], [], None))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert [a.error for a in attempts] == ["Cancelled", "Cancelled"]
@@ -0,0 +1,150 @@
+"""Tests for streaming response helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+from pyclaw.providers.streaming import (
+    _ChunkBatcher,
+    _parse_arguments,
+    stream_anthropic_response,
+    stream_openai_response,
+)
+
+
+class _FakeStream:
+    def __init__(self, texts):
+        self._chunks = [
+            SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content=t, tool_calls=None))]
+            )
+            for t in texts
+        ]
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeClient:
+    def __init__(self, texts):
+        async def create(**kwargs):
+            return _FakeStream(texts)
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+
+async def test_chunk_batcher_coalesces_until_limit():
+    seen: list[str] = []
+    batcher = _ChunkBatcher(seen.append, max_chars=4, max_delay=60)
+    for ch in "abcdef":
+        await batcher.add(ch)
+    assert seen == ["abcd"]
+    await batcher.flush()
+    assert seen == ["abcd", "ef"]
+
+
+async def test_chunk_batcher_flushes_after_delay_without_more_text():
+    seen: list[str] = []
+    batcher = _ChunkBatcher(seen.append, max_chars=64, max_delay=0.01)
+    await batcher.add("Hel")
+    await batcher.add("lo")
+    # e.g. a long run of tool-call argument deltas, or a pause upstream
+    await asyncio.sleep(0.05)
+    assert seen == ["Hello"]
+    await batcher.flush()
+    assert seen == ["Hello"]
+
+
+async def test_stream_openai_batches_on_chunk():
+    texts = ["x"] * 100
+    seen: list[str] = []
+
+    async def on_chunk(text: str) -> None:
+        seen.append(text)
+
+    resp = await stream_openai_response(_FakeClient(texts), [], "m", on_chunk=on_chunk)
+    assert resp.content == "x" * 100
+    assert "".join(seen) == resp.content
+    assert len(seen) < len(texts)
+
+
+def test_parse_arguments():
+    assert _parse_arguments('{"path": "a.txt"}') == {"path": "a.txt"}
+    assert _parse_arguments("") == {}
+    assert _parse_arguments('{"trunc') == {}
+    assert _parse_arguments("[1, 2]") == {}
+
+
+async def test_stream_openai_joins_tool_call_fragments():
+    def _tc(arguments, call_id=None, name=None):
+        fn = SimpleNamespace(name=name, arguments=arguments)
+        return SimpleNamespace(index=0, id=call_id, function=fn)
+
+    stream = _FakeStream([])
+    stream._chunks = [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=None, tool_calls=[tc]))]
+        )
+        for tc in (_tc('{"pa', call_id="c1", name="read_file"), _tc('th": '), _tc('"a.txt"}'))
+    ]
+
+    async def create(**kwargs):
+        return stream
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    resp = await stream_openai_response(client, [], "m")
+    (call,) = resp.tool_calls
+    assert call.id == "c1"
+    assert call.function.arguments == '{"path": "a.txt"}'
+
+
+async def test_chunk_batcher_awaits_async_callable_objects():
+    class _Sink:
+        def __init__(self):
+            self.seen: list[str] = []
+
+        async def __call__(self, text: str) -> None:
+            self.seen.append(text)
+
+    sink = _Sink()
+    batcher = _ChunkBatcher(sink, max_chars=1)
+    await batcher.add("hi")
+    assert sink.seen == ["hi"]
+
+
+async def test_stream_anthropic_collects_text_and_tool_use():
+    events = [
+        SimpleNamespace(type="message_start", message=SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=5))),
+        SimpleNamespace(type="content_block_start", content_block=SimpleNamespace(type="text")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="Hel")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text="lo")),
+        SimpleNamespace(type="content_block_stop"),
+        SimpleNamespace(type="content_block_start", content_block=SimpleNamespace(
+            type="tool_use", id="t1", name="ls")),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(partial_json='{"d"')),
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(partial_json=": 1}")),
+        SimpleNamespace(type="content_block_stop"),
+        SimpleNamespace(type="message_delta", usage=SimpleNamespace(output_tokens=7)),
+    ]
+
+    class _Stream:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def __aiter__(self):
+            for event in events:
+                yield event
+
+    client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: _Stream()))
+    resp = await stream_anthropic_response(client, "", [], "m")
+    assert resp.content == "Hello"
+    assert (resp.tool_calls[0].name, resp.tool_calls[0].arguments) == ("ls", {"d": 1})
+    assert resp.tool_calls[0].function is None
+    assert (resp.usage.prompt_tokens, resp.usage.completion_tokens) == (5, 7)
@@ -0,0 +1,74 @@
+"""Tests for provider tool-schema conversion."""
+
+from pyclaw.models import (
+    FunctionCall,
+    Message,
+    ToolCall,
+    ToolDefinition,
+    ToolFunctionDefinition,
+)
+from pyclaw.providers.anthropic_provider import _split_system, _to_anthropic_tool
+from pyclaw.providers.openai_provider import _to_openai_messages, _to_openai_tool
+
+
+def _tool() -> ToolDefinition:
+    return ToolDefinition(
+        function=ToolFunctionDefinition(
+            name="read_file",
+            description="Read a file",
+            parameters={"type": "object", "properties": {}},
+        )
+    )
+
+
+def test_tool_schema_cached_per_definition():
+    tool = _tool()
+    oai = _to_openai_tool(tool)
+    assert oai["function"]["name"] == "read_file"
+    assert _to_openai_tool(tool) is oai
+
+    claude = _to_anthropic_tool(tool)
+    assert claude["input_schema"] == {"type": "object", "properties": {}}
+    assert _to_anthropic_tool(tool) is claude
+
+    assert _to_openai_tool(_tool()) is not oai
+    assert "_wire_cache" not in tool.model_dump()
+
+
+def test_split_system_reuses_parsed_arguments():
+    args = {"path": "a.txt"}
+    tc = ToolCall(
+        id="c1",
+        function=FunctionCall(name="read_file", arguments="not json"),
+        arguments=args,
+    )
+    streamed = ToolCall(id="c2", function=FunctionCall(name="ls", arguments='{"d": 1}'))
+    _, msgs = _split_system([Message(role="assistant", tool_calls=[tc, streamed])])
+    blocks = msgs[0]["content"]
+    assert blocks[0]["input"] is args
+    assert blocks[1]["input"] == {"d": 1}
+
+
+def test_message_conversion_lengths():
+    msgs = [
+        Message(role="system", content="sys"),
+        Message(role="user", content="hi"),
+        Message(role="tool", content="ok", tool_call_id="c1"),
+    ]
+    system, claude = _split_system(msgs)
+    assert system == "sys"
+    assert [m["role"] for m in claude] == ["user", "user"]
+    assert [m["role"] for m in _to_openai_messages(msgs)] == ["system", "user", "tool"]
+
+
+def test_openai_tool_calls_serialised():
+    msg = Message(role="assistant", tool_calls=[
+        ToolCall(id="c1", function=FunctionCall(name="ls", arguments='{"d":1}')),
+        ToolCall(id="c2", name="cat", arguments={"p": "x"}),
+    ])
+    (oai,) = _to_openai_messages([msg])
+    assert "tool_call_id" not in oai
+    assert [tc["function"] for tc in oai["tool_calls"]] == [
+        {"name": "ls", "arguments": '{"d":1}'},
+        {"name": "cat", "arguments": '{"p":"x"}'},
+    ]
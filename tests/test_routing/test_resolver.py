@@ -44,3 +44,42 @@ def test_peer_binding():
     ))
     assert route.agent_id == "agent2"
     assert route.matched_by == "peer"
+
+
+def test_first_matching_binding_wins():
+    cfg = Config(bindings=[
+        AgentBinding(agent_id="by_account", match=BindingMatch(account_id="u1")),
+        AgentBinding(
+            agent_id="by_peer",
+            match=BindingMatch(peer=PeerMatch(kind="direct", id="u1")),
+        ),
+        AgentBinding(agent_id="by_guild", match=BindingMatch(guild_id="g1")),
+        AgentBinding(
+            agent_id="peer_other_channel",
+            match=BindingMatch(channel="slack", peer=PeerMatch(kind="direct", id="u2")),
+        ),
+    ])
+    resolver = RouteResolver(cfg)
+    peer = RoutePeer(kind="direct", id="u1")
+
+    route = resolver.resolve(RouteInput(channel="discord", account_id="u1", peer=peer))
+    assert (route.agent_id, route.matched_by) == ("by_account", "account")
+
+    route = resolver.resolve(
+        RouteInput(channel="discord", account_id="x", peer=peer, guild_id="g1")
+    )
+    assert (route.agent_id, route.matched_by) == ("by_peer", "peer")
+
+    route = resolver.resolve(RouteInput(
+        channel="discord", peer=RoutePeer(kind="direct", id="u2"), guild_id="g1",
+    ))
+    assert (route.agent_id, route.matched_by) == ("by_guild", "guild")
+
+
+def test_session_keys_reused_across_resolves():
+    resolver = RouteResolver(Config())
+    first = resolver.resolve(RouteInput(channel="cli", account_id="me"))
+    second = resolver.resolve(RouteInput(channel="cli", account_id="me"))
+    assert first.session_key == "agent:default:cli:me"
+    assert first.main_session_key == "agent:default:main"
+    assert second.session_key is first.session_key
@@ -1,7 +1,10 @@
 """Tests for heartbeat service."""
 
+import asyncio
 from pathlib import Path
 
+import pytest
+
 from pyclaw.services.heartbeat import HeartbeatService
 
 
@@ -20,3 +23,101 @@ def test_minimum_interval(tmp_path):
     svc = HeartbeatService(workspace=str(tmp_path), interval_minutes=1)
     # Should enforce minimum of 5 minutes = 300 seconds
     assert svc._interval == 300
+
+
+async def test_skip_unchanged_runs_handler_once(tmp_path):
+    (tmp_path / "HEARTBEAT.md").write_text("- check the queue\n")
+    svc = HeartbeatService(workspace=str(tmp_path), skip_unchanged=True)
+    calls: list[str] = []
+
+    async def handler(prompt, channel, chat_id):
+        calls.append(prompt)
+        return None
+
+    svc.set_handler(handler)
+    await svc._execute_heartbeat()
+    await svc._execute_heartbeat()
+    assert len(calls) == 1
+    await svc._execute_heartbeat(force=True)
+    assert len(calls) == 2
+
+
+async def test_skip_unchanged_retries_after_failed_run(tmp_path):
+    (tmp_path / "HEARTBEAT.md").write_text("- check the queue\n")
+    svc = HeartbeatService(workspace=str(tmp_path), skip_unchanged=True)
+    calls: list[str] = []
+
+    async def handler(prompt, channel, chat_id):
+        calls.append(prompt)
+        if len(calls) == 1:
+            raise RuntimeError("provider down")
+        return None
+
+    svc.set_handler(handler)
+    with pytest.raises(RuntimeError):
+        await svc._execute_heartbeat()
+    await svc._execute_heartbeat()
+    await svc._execute_heartbeat()
+    assert len(calls) == 2
+
+
+async def test_comment_only_heartbeat_is_skipped(tmp_path):
+    svc = HeartbeatService(workspace=str(tmp_path))
+    svc._ensure_heartbeat_file()
+    called = False
+
+    async def handler(prompt, channel, chat_id):
+        nonlocal called
+        called = True
+
+    svc.set_handler(handler)
+    await svc._execute_heartbeat()
+    assert not called
+    assert svc._read_heartbeat()[1] is False
+
+
+async def test_log_written_through_long_lived_fd(tmp_path):
+    svc = HeartbeatService(workspace=str(tmp_path), enabled=True)
+    svc.start()
+    try:
+        svc._log("INFO", "first")
+        svc._log("INFO", "second")
+        # Unbuffered: entries are on disk without any flush
+        lines = (tmp_path / "heartbeat.log").read_text().splitlines()
+        assert [line.split(" ", 1)[1] for line in lines] == ["[INFO] first", "[INFO] second"]
+    finally:
+        svc.stop()
+    assert svc._log_fd is None
+
+
+async def test_run_loop_skips_missed_ticks(tmp_path, monkeypatch):
+    svc = HeartbeatService(workspace=str(tmp_path))
+    svc._interval = 0.05
+    svc._running = True
+    ticks = 0
+
+    async def slow_tick(force=False):
+        nonlocal ticks
+        ticks += 1
+        if ticks == 1:
+            await asyncio.sleep(0.12)  # overrun more than two intervals
+        else:
+            svc._running = False
+
+    monkeypatch.setattr(svc, "_execute_heartbeat", slow_tick)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.wait_for(svc._run_loop(), timeout=1)
+    # Second tick lands on the next interval boundary (0.2s), not immediately
+    assert ticks == 2
+    assert loop.time() - start >= 0.19
+
+
+async def test_start_schedules_named_task(tmp_path):
+    svc = HeartbeatService(workspace=str(tmp_path), enabled=True)
+    svc.start()
+    try:
+        assert svc._task is not None
+        assert svc._task.get_name() == "heartbeat"
+    finally:
+        svc.stop()
@@ -3,15 +3,15 @@
 from pyclaw.session.manager import SessionManager
 
 
-def test_get_or_create(tmp_path):
-    sm = SessionManager(str(tmp_path))
+def test_get_or_create(fast_tmp_path):
+    sm = SessionManager(str(fast_tmp_path))
     session = sm.get_or_create("test")
     assert session.key == "test"
     assert session.messages == []
 
 
-def test_add_and_get_history(tmp_path):
-    sm = SessionManager(str(tmp_path))
+def test_add_and_get_history(fast_tmp_path):
+    sm = SessionManager(str(fast_tmp_path))
     sm.add_message("test", "user", "hello")
     sm.add_message("test", "assistant", "hi there")
     history = sm.get_history("test")
@@ -20,31 +20,45 @@ def test_add_and_get_history(tmp_path):
     assert history[1].content == "hi there"
 
 
-def test_save_and_reload(tmp_path):
-    sm = SessionManager(str(tmp_path))
+def test_save_and_reload(fast_tmp_path):
+    sm = SessionManager(str(fast_tmp_path))
     sm.add_message("test", "user", "hello")
     sm.set_summary("test", "User said hello")
     sm.save("test")
 
     # Reload
-    sm2 = SessionManager(str(tmp_path))
+    sm2 = SessionManager(str(fast_tmp_path))
     history = sm2.get_history("test")
     assert len(history) == 1
     assert sm2.get_summary("test") == "User said hello"
 
 
-def test_truncate_history(tmp_path):
-    sm = SessionManager(str(tmp_path))
+def test_truncate_history(fast_tmp_path):
+    sm = SessionManager(str(fast_tmp_path))
     for i in range(10):
         sm.add_message("test", "user", f"msg {i}")
     sm.truncate_history("test", 3)
     assert len(sm.get_history("test")) == 3
 
 
-def test_clear(tmp_path):
-    sm = SessionManager(str(tmp_path))
+def test_clear(fast_tmp_path):
+    sm = SessionManager(str(fast_tmp_path))
     sm.add_message("test", "user", "hello")
     sm.set_summary("test", "summary")
     sm.clear("test")
     assert sm.get_history("test") == []
     assert sm.get_summary("test") == ""
+
+
+def test_reload_round_trips_with_and_without_orjson(fast_tmp_path, monkeypatch):
+    from pyclaw.session import manager
+
+    sm = SessionManager(str(fast_tmp_path))
+    sm.add_message("a", "user", "grüß dich 👋")
+    sm.save("a")
+    monkeypatch.setattr(manager, "orjson", None)
+    assert SessionManager(str(fast_tmp_path)).get_history("a")[0].content == "grüß dich 👋"
+    sm.add_message("b", "user", "plain json")
+    sm.save("b")
+    monkeypatch.undo()
+    assert SessionManager(str(fast_tmp_path)).get_history("b")[0].content == "plain json"
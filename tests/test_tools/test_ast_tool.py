@@ -3,7 +3,7 @@
 import os
 import pytest
 
-from pyclaw.tools.ast_tool import ASTAnalyzeTool
+from pyclaw.tools.ast_tool import ASTAnalyzeTool, _load_tree
 
 
 @pytest.fixture
@@ -82,3 +82,44 @@ async def test_file_not_found(tool):
 async def test_workspace_restriction(tool):
     result = await tool.execute({"path": "../../etc/passwd", "action": "outline"})
     assert result.is_error
+
+
+@pytest.mark.asyncio
+async def test_parsed_tree_cached_until_file_changes(tool, workspace):
+    _load_tree.cache_clear()
+    await tool.execute({"path": "sample.py", "action": "outline"})
+    await tool.execute({"path": "sample.py", "action": "imports"})
+    assert _load_tree.cache_info().hits == 1
+
+    sample = workspace / "sample.py"
+    sample.write_text("def renamed():\n    pass\n")
+    st = sample.stat()
+    os.utime(sample, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    result = await tool.execute({"path": "sample.py", "action": "outline"})
+    assert "renamed" in result.for_llm
+
+
+@pytest.mark.asyncio
+async def test_workspace_restriction_rejects_sibling_prefix(workspace):
+    sibling = workspace.parent / (workspace.name + "-other")
+    sibling.mkdir()
+    (sibling / "mod.py").write_text("def leaked():\n    pass\n")
+    tool = ASTAnalyzeTool(str(workspace))
+    result = await tool.execute({"path": f"../{sibling.name}/mod.py", "action": "outline"})
+    assert result.is_error
+
+
+@pytest.mark.asyncio
+async def test_multiple_actions_share_one_parse(tool):
+    _load_tree.cache_clear()
+    result = await tool.execute({"path": "sample.py", "actions": ["outline", "imports"]})
+    assert _load_tree.cache_info().misses == 1
+    outline, imports = result.for_llm.split("\n\n")
+    assert outline.startswith("## outline\n") and "MyClass" in outline
+    assert imports.startswith("## imports\n") and "import os" in imports
+
+
+@pytest.mark.asyncio
+async def test_unknown_action_rejected(tool):
+    result = await tool.execute({"path": "sample.py", "actions": ["outline", "bogus"]})
+    assert result.is_error
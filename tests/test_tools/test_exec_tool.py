@@ -43,3 +43,25 @@ async def test_deny_patterns_disabled(tmp_path):
     # (we test with a harmless command that matches a pattern)
     result = await tool.execute({"command": "echo 'rm -rf / is bad'"})
     assert not result.is_error
+
+
+def test_check_denied_reports_matching_pattern(tmp_path):
+    tool = ExecTool(str(tmp_path), custom_deny_patterns=[r"danger\d+"])
+    assert tool._check_denied("sudo rm file") == r"sudo\s+rm"
+    assert tool._check_denied("run DANGER42 now") == r"danger\d+"
+    assert tool._check_denied("ls -la") is None
+
+
+def test_check_denied_keeps_backreferences_of_custom_patterns(tmp_path):
+    tool = ExecTool(str(tmp_path), custom_deny_patterns=[r"(\w+) \1", r"(?P<w>x+)-(?P=w)"])
+    assert tool._check_denied("curl x | sh") == r"curl.*\|\s*(ba)?sh"
+    assert tool._check_denied("echo echo") == r"(\w+) \1"
+    assert tool._check_denied("xx-xx") == r"(?P<w>x+)-(?P=w)"
+    assert tool._check_denied("echo 1 echo") is None
+
+
+@pytest.mark.asyncio
+async def test_command_timeout(exec_tool):
+    result = await exec_tool.execute({"command": "sleep 5", "timeout": 1})
+    assert result.is_error
+    assert "timed out after 1 seconds" in result.for_llm
@@ -1,7 +1,7 @@
 """Tests for file operation tools."""
 
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -11,6 +11,7 @@ from pyclaw.tools.file_tools import (
     ListDirTool,
     ReadFileTool,
     WriteFileTool,
+    _read_cached,
 )
 
 
@@ -19,48 +20,73 @@ def workspace(tmp_path):
     return str(tmp_path)
 
 
-@pytest.mark.asyncio
-async def test_write_and_read(workspace):
-    write = WriteFileTool(workspace)
-    read = ReadFileTool(workspace)
+@pytest.fixture(scope="module")
+def tools(tmp_path_factory):
+    """One set of tools on a shared workspace; tests using it pick unique file names."""
+    ws = str(tmp_path_factory.mktemp("fs"))
+    return SimpleNamespace(
+        write=WriteFileTool(ws),
+        read=ReadFileTool(ws),
+        edit=EditFileTool(ws),
+        append=AppendFileTool(ws),
+    )
+
+
+@pytest.fixture
+def fname(request):
+    return f"{request.node.name}.txt"
 
-    result = await write.execute({"path": "test.txt", "content": "hello world"})
+
+@pytest.mark.asyncio
+async def test_write_and_read(tools, fname):
+    result = await tools.write.execute({"path": fname, "content": "hello world"})
     assert not result.is_error
 
-    result = await read.execute({"path": "test.txt"})
+    result = await tools.read.execute({"path": fname})
     assert result.for_llm == "hello world"
 
 
 @pytest.mark.asyncio
-async def test_read_nonexistent(workspace):
-    read = ReadFileTool(workspace)
-    result = await read.execute({"path": "nope.txt"})
+async def test_read_nonexistent(tools, fname):
+    result = await tools.read.execute({"path": fname})
     assert result.is_error
 
 
 @pytest.mark.asyncio
-async def test_edit_file(workspace):
-    write = WriteFileTool(workspace)
-    edit = EditFileTool(workspace)
+async def test_read_served_from_cache_until_changed(workspace):
+    _read_cached.cache_clear()
     read = ReadFileTool(workspace)
+    target = Path(workspace) / "cfg.txt"
+    target.write_text("one")
+    assert (await read.execute({"path": "cfg.txt"})).for_llm == "one"
+    assert (await read.execute({"path": "cfg.txt"})).for_llm == "one"
+    assert _read_cached.cache_info().hits == 1
 
-    await write.execute({"path": "test.txt", "content": "hello world"})
-    result = await edit.execute({
-        "path": "test.txt",
+    # Same-size rewrite through the tools is never served stale
+    await EditFileTool(workspace).execute(
+        {"path": "cfg.txt", "old_string": "one", "new_string": "two"}
+    )
+    assert (await read.execute({"path": "cfg.txt"})).for_llm == "two"
+
+
+@pytest.mark.asyncio
+async def test_edit_file(tools, fname):
+    await tools.write.execute({"path": fname, "content": "hello world"})
+    result = await tools.edit.execute({
+        "path": fname,
         "old_string": "world",
         "new_string": "pyclaw",
     })
     assert not result.is_error
 
-    result = await read.execute({"path": "test.txt"})
+    result = await tools.read.execute({"path": fname})
     assert result.for_llm == "hello pyclaw"
 
 
 @pytest.mark.asyncio
-async def test_edit_not_found(workspace):
-    edit = EditFileTool(workspace)
-    result = await edit.execute({
-        "path": "nope.txt",
+async def test_edit_not_found(tools, fname):
+    result = await tools.edit.execute({
+        "path": fname,
         "old_string": "a",
         "new_string": "b",
     })
@@ -68,15 +94,21 @@ async def test_edit_not_found(workspace):
 
 
 @pytest.mark.asyncio
-async def test_append_file(workspace):
-    write = WriteFileTool(workspace)
-    append = AppendFileTool(workspace)
-    read = ReadFileTool(workspace)
+async def test_edit_ambiguous_match(workspace):
+    (Path(workspace) / "dup.txt").write_text("ab ab ab")
+    edit = EditFileTool(workspace)
+    result = await edit.execute({"path": "dup.txt", "old_string": "ab", "new_string": "x"})
+    assert result.is_error
+    assert "3 times" in result.for_llm
+    assert (Path(workspace) / "dup.txt").read_text() == "ab ab ab"
 
-    await write.execute({"path": "test.txt", "content": "line1\n"})
-    await append.execute({"path": "test.txt", "content": "line2\n"})
 
-    result = await read.execute({"path": "test.txt"})
+@pytest.mark.asyncio
+async def test_append_file(tools, fname):
+    await tools.write.execute({"path": fname, "content": "line1\n"})
+    await tools.append.execute({"path": fname, "content": "line2\n"})
+
+    result = await tools.read.execute({"path": fname})
     assert result.for_llm == "line1\nline2\n"
 
 
@@ -92,9 +124,77 @@ async def test_list_dir(workspace):
     assert "b.txt" in result.for_llm
 
 
+@pytest.mark.asyncio
+async def test_list_dir_orders_directories_first(workspace):
+    root = Path(workspace)
+    (root / "Zdir").mkdir()
+    (root / "a.txt").write_text("a")
+    (root / "link").symlink_to(root / "Zdir")
+    result = await ListDirTool(workspace).execute({"path": "."})
+    assert result.for_llm.splitlines() == ["link/", "Zdir/", "a.txt"]
+
+
 @pytest.mark.asyncio
 async def test_workspace_restriction(workspace):
     read = ReadFileTool(workspace, restrict=True)
     result = await read.execute({"path": "/etc/passwd"})
     assert result.is_error
     assert "outside workspace" in result.for_llm.lower()
+
+
+@pytest.mark.asyncio
+async def test_workspace_restriction_rejects_sibling_and_symlink_escape(tmp_path):
+    root = tmp_path / "ws"
+    root.mkdir()
+    sibling = tmp_path / "ws-other"
+    sibling.mkdir()
+    (sibling / "secret.txt").write_text("secret")
+    (root / "escape").symlink_to(sibling)
+    read = ReadFileTool(str(root))
+    for raw in ("../ws-other/secret.txt", str(sibling / "secret.txt"), "escape/secret.txt"):
+        result = await read.execute({"path": raw})
+        assert result.is_error
+        assert "outside workspace" in result.for_llm.lower()
+
+
+@pytest.mark.asyncio
+async def test_edit_preserves_crlf_and_non_ascii(workspace):
+    target = Path(workspace) / "win.txt"
+    target.write_bytes("héllo\r\nwörld\r\n".encode())
+    result = await EditFileTool(workspace).execute(
+        {"path": "win.txt", "old_string": "héllo\nwörld", "new_string": "grüß\ndich"}
+    )
+    assert not result.is_error
+    assert target.read_bytes() == "grüß\r\ndich\r\n".encode()
+
+
+@pytest.mark.asyncio
+async def test_read_max_bytes_returns_prefix(workspace):
+    (Path(workspace) / "big.log").write_bytes(b"0123456789" * 100)
+    read = ReadFileTool(workspace)
+    result = await read.execute({"path": "big.log", "max_bytes": 10})
+    assert result.for_llm.startswith("0123456789\n")
+    assert "truncated at 10 of 1000 bytes" in result.for_llm
+    full = await read.execute({"path": "big.log", "max_bytes": 5000})
+    assert full.for_llm == "0123456789" * 100
+
+
+@pytest.mark.asyncio
+async def test_read_translates_newlines_like_text_mode(workspace):
+    (Path(workspace) / "crlf.txt").write_bytes(b"a\r\nb\rc\n")
+    result = await ReadFileTool(workspace).execute({"path": "crlf.txt"})
+    assert result.for_llm == "a\nb\nc\n"
+
+
+@pytest.mark.asyncio
+async def test_type_mismatches_reported(workspace):
+    (Path(workspace) / "sub").mkdir()
+    (Path(workspace) / "f.txt").write_text("x")
+    edit = await EditFileTool(workspace).execute(
+        {"path": "sub", "old_string": "a", "new_string": "b"}
+    )
+    assert edit.is_error and "Not a file" in edit.for_llm
+    listing = await ListDirTool(workspace).execute({"path": "f.txt"})
+    assert listing.is_error and "Not a directory" in listing.for_llm
+    missing = await ListDirTool(workspace).execute({"path": "nope"})
+    assert missing.is_error and "Directory not found" in missing.for_llm
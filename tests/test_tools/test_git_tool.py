@@ -1,18 +1,35 @@
 """Tests for git tool."""
 
-import os
+import shutil
+import subprocess
+
 import pytest
 
 from pyclaw.tools.git_tool import GitTool
 
 
+@pytest.fixture(scope="module")
+def git_template(tmp_path_factory):
+    # Built once per module; each test gets a copy instead of re-running git
+    repo = tmp_path_factory.mktemp("git-template")
+    (repo / "README.md").write_text("# test\n")
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@test.com")
+    git("config", "user.name", "test")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+    return repo
+
+
 @pytest.fixture
-def git_workspace(tmp_path):
-    # Init a git repo in tmp_path
-    os.system(f"cd {tmp_path} && git init -q && git config user.email test@test.com && git config user.name test")
-    (tmp_path / "README.md").write_text("# test\n")
-    os.system(f"cd {tmp_path} && git add . && git commit -q -m 'init'")
-    return tmp_path
+def git_workspace(git_template, tmp_path):
+    workspace = tmp_path / "repo"
+    shutil.copytree(git_template, workspace, symlinks=True)
+    return workspace
 
 
 @pytest.fixture
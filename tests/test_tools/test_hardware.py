@@ -0,0 +1,106 @@
+"""Tests for hardware tool helpers (no devices needed)."""
+
+import ctypes
+import os
+import struct
+from glob import glob
+
+import pytest
+
+from pyclaw.tools import hardware
+from pyclaw.tools.hardware import (
+    _dev_exists,
+    _dev_nodes,
+    _DeviceFds,
+    _hex_dump,
+    _I2CMsg,
+    _I2CRdwrData,
+    _spi_full_duplex,
+    _spi_ioc_message,
+    _SpiIocTransfer,
+)
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def test_i2c_structs_match_kernel_layout():
+    # struct i2c_msg { __u16 addr, flags, len; __u8 *buf; }
+    assert ctypes.sizeof(_I2CMsg) == struct.calcsize("HHHP")
+    # struct i2c_rdwr_ioctl_data { struct i2c_msg *msgs; __u32 nmsgs; }
+    assert ctypes.sizeof(_I2CRdwrData) == struct.calcsize("PI0P")
+
+
+def test_spi_transfer_struct_and_ioctl_number():
+    assert ctypes.sizeof(_SpiIocTransfer) == 32
+    assert _spi_ioc_message(1) == 0x40206B00
+    assert _spi_ioc_message(3) == 0x40606B00
+
+
+def test_device_fds_reused_until_discarded(tmp_path):
+    node = tmp_path / "i2c-9"
+    node.write_bytes(b"")
+    fds = _DeviceFds()
+    fd = fds.get(str(node))
+    assert fds.get(str(node)) == fd
+    fds.applied[fd] = 0x40
+    fds.discard(str(node))
+    assert fd not in fds.applied
+    with pytest.raises(OSError):
+        os.fstat(fd)
+    fds.get(str(node))
+    fds.close()
+
+
+def test_spi_payload_split_at_bufsiz(monkeypatch):
+    sent = []
+
+    def fake_ioctl(fd, request, xfer):
+        assert request == _spi_ioc_message(1)
+        sent.append((xfer.len, xfer.cs_change))
+        # Loop MISO back to MOSI
+        ctypes.memmove(xfer.rx_buf, xfer.tx_buf, xfer.len)
+
+    monkeypatch.setattr(fcntl, "ioctl", fake_ioctl)
+    monkeypatch.setattr(hardware, "_SPI_BUFSIZ", 4)
+    payload = bytes(range(10))
+    assert _spi_full_duplex(-1, payload) == payload
+    assert sent == [(4, 1), (4, 1), (2, 0)]
+
+
+def test_hex_dump_matches_per_byte_format():
+    data = bytes([0, 1, 0xAB, 0xFF])
+    assert _hex_dump(data) == " ".join(f"0x{b:02x}" for b in data)
+    assert _hex_dump(b"") == ""
+
+
+def test_dev_exists_is_memoized(monkeypatch):
+    hardware._exists_cached.cache_clear()
+    calls = []
+    now = [100.0]
+    monkeypatch.setattr(hardware.os.path, "exists", lambda p: calls.append(p) or True)
+    monkeypatch.setattr(hardware.time, "monotonic", lambda: now[0])
+    assert _dev_exists("/dev/spidev0.0")
+    assert _dev_exists("/dev/spidev0.0")
+    assert len(calls) == 1
+    now[0] += 5  # next bucket re-checks
+    assert _dev_exists("/dev/spidev0.0")
+    assert len(calls) == 2
+    hardware._exists_cached.cache_clear()
+
+
+def test_dev_nodes_matches_glob():
+    assert _dev_nodes("tty") == sorted(glob("/dev/tty*"))
+
+
+def test_spi_read_clocks_out_shared_zeros(monkeypatch):
+    tx_addrs = []
+
+    def fake_ioctl(fd, request, xfer):
+        tx_addrs.append(xfer.tx_buf)
+        assert ctypes.string_at(xfer.tx_buf, xfer.len) == bytes(xfer.len)
+        ctypes.memset(xfer.rx_buf, 0x5A, xfer.len)
+
+    monkeypatch.setattr(fcntl, "ioctl", fake_ioctl)
+    monkeypatch.setattr(hardware, "_SPI_BUFSIZ", 4)
+    assert _spi_full_duplex(-1, 6) == b"\x5a" * 6
+    assert tx_addrs == [ctypes.addressof(hardware._SPI_ZEROS)] * 2
@@ -0,0 +1,34 @@
+"""Tests for pytest tool."""
+
+from pyclaw.tools.pytest_tool import PytestTool
+
+
+def test_parse_summary_counts():
+    tool = PytestTool(".")
+    output = (
+        "..F.s\n"
+        "FAILED tests/test_x.py::test_y\n"
+        "2 failed, 5 passed, 1 skipped, 3 errors in 0.4s\n"
+    )
+    assert tool._parse_summary(output) == {"passed": 5, "failed": 2, "errors": 3, "skipped": 1}
+
+
+def test_parse_summary_all_skipped():
+    assert PytestTool(".")._parse_summary("4 skipped in 0.01s")["skipped"] == 4
+
+
+def test_parse_summary_ignores_counts_before_the_tail():
+    output = "assert '7 failed' == ...\n" + "x\n" * 50 + "3 passed in 0.1s\n"
+    summary = PytestTool(".")._parse_summary(output)
+    assert summary["passed"] == 3
+    assert summary["failed"] == 0
+
+
+async def test_filter_with_spaces_reaches_pytest_intact(tmp_path):
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text(
+        "def test_ok():\n    pass\n\ndef test_bad():\n    assert 0\n\ndef test_other():\n    pass\n"
+    )
+    result = await PytestTool(str(tmp_path)).execute({"filter": "ok or bad"})
+    assert result.for_llm.startswith("FAILED: 1 failed, 1 passed")
+    assert "1 deselected" in result.for_llm
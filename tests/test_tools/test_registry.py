@@ -1,13 +1,19 @@
 """Tests for tool registry."""
 
+import asyncio
+import time
+from dataclasses import dataclass
 from typing import Any
 
 import pytest
 
 from pyclaw.models import ToolResult
-from pyclaw.protocols import Tool
+from pyclaw.protocols import BatchTool, ContextualTool, Tool, TypedTool
+from pyclaw.tools import registry as registry_module
 from pyclaw.tools.registry import ToolRegistry
 
+_DUMMY_PARAMS: dict[str, Any] = {"type": "object", "properties": {"x": {"type": "string"}}}
+
 
 class DummyTool(Tool):
     def name(self) -> str:
@@ -17,15 +23,31 @@ class DummyTool(Tool):
         return "A dummy tool for testing"
 
     def parameters(self) -> dict[str, Any]:
-        return {"type": "object", "properties": {"x": {"type": "string"}}}
+        return _DUMMY_PARAMS
 
     async def execute(self, args: dict[str, Any]) -> ToolResult:
         return ToolResult.success(f"got: {args.get('x', '')}")
 
 
+class OtherTool(DummyTool):
+    def name(self) -> str:
+        return "other"
+
+
+@pytest.fixture(scope="module")
+def _shared_registry():
+    return ToolRegistry()
+
+
+@pytest.fixture
+def registry(_shared_registry):
+    """One registry reused across the module, emptied after each test."""
+    yield _shared_registry
+    _shared_registry.reset()
+
+
 @pytest.mark.asyncio
-async def test_register_and_execute():
-    registry = ToolRegistry()
+async def test_register_and_execute(registry):
     registry.register(DummyTool())
 
     assert registry.count() == 1
@@ -35,16 +57,321 @@ async def test_register_and_execute():
     assert result.for_llm == "got: hello"
 
 
+def test_list_names_is_live_view(registry):
+    registry.register(DummyTool())
+    names = registry.list_names()
+    registry.register(OtherTool())
+    assert list(names) == ["dummy", "other"]
+
+
 @pytest.mark.asyncio
-async def test_unknown_tool():
-    registry = ToolRegistry()
+async def test_unknown_tool(registry):
     result = await registry.execute("nonexistent", {})
     assert result.is_error
+    assert result.for_llm == "Unknown tool: nonexistent"
 
 
-def test_get_definitions():
-    registry = ToolRegistry()
+def test_get_definitions(registry):
     registry.register(DummyTool())
     defs = registry.get_definitions()
     assert len(defs) == 1
     assert defs[0].function.name == "dummy"
+
+
+def test_get_definitions_built_at_register(registry):
+    registry.register(DummyTool())
+    defs = registry.get_definitions()
+    assert registry.get_definitions() is defs
+    registry.register(OtherTool())
+    assert [d.function.name for d in registry.get_definitions()] == ["dummy", "other"]
+    # Re-registering a name swaps its definition in place
+    registry.register(DummyTool())
+    assert [d.function.name for d in registry.get_definitions()] == ["dummy", "other"]
+
+
+@pytest.mark.asyncio
+async def test_reregister_replaces_dispatch_and_context(registry):
+    class ContextTool(ContextualTool, DummyTool):
+        def set_context(self, channel: str, chat_id: str) -> None:
+            self.context = (channel, chat_id)
+
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            return ToolResult.success(f"ctx: {self.context}")
+
+    registry.register(ContextTool())
+    result = await registry.execute("dummy", {}, channel="cli", chat_id="1")
+    assert result.for_llm == "ctx: ('cli', '1')"
+
+    registry.register(DummyTool())
+    result = await registry.execute("dummy", {"x": "plain"}, channel="cli", chat_id="1")
+    assert result.for_llm == "got: plain"
+
+
+@pytest.mark.asyncio
+async def test_execute_many_runs_calls_concurrently(registry):
+    class SleepyTool(DummyTool):
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            await asyncio.sleep(0.05)
+            return await super().execute(args)
+
+    registry.register(SleepyTool())
+    start = time.monotonic()
+    results = await registry.execute_many(
+        [("dummy", {"x": str(i)}) for i in range(10)] + [("missing", {})]
+    )
+    assert time.monotonic() - start < 0.25
+    assert [r.for_llm for r in results[:10]] == [f"got: {i}" for i in range(10)]
+    assert results[10].is_error
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_coalesced_into_batch(registry):
+    class Batched(BatchTool, DummyTool):
+        def __init__(self) -> None:
+            self.batches: list[list[dict[str, Any]]] = []
+
+        async def batch_execute(self, args_list: list[dict[str, Any]]) -> list[ToolResult]:
+            self.batches.append(args_list)
+            return [ToolResult.success(f"batched: {a['x']}") for a in args_list]
+
+    tool = Batched()
+    registry.register(tool)
+    results = await registry.execute_many([("dummy", {"x": str(i)}) for i in range(5)])
+    assert [r.for_llm for r in results] == [f"batched: {i}" for i in range(5)]
+    assert len(tool.batches) == 1
+
+    result = await registry.execute("dummy", {"x": "solo"})
+    assert result.for_llm == "batched: solo"
+    assert len(tool.batches) == 2
+
+
+class SlowBatch(BatchTool, DummyTool):
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def batch_execute(self, args_list: list[dict[str, Any]]) -> list[ToolResult]:
+        await self.release.wait()
+        return [ToolResult.success("done") for _ in args_list]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("started", [True, False])
+async def test_cancelled_batch_never_leaves_callers_waiting(registry, started):
+    tool = SlowBatch()
+    registry.register(tool)
+    call = asyncio.create_task(registry.execute("dummy", {}))
+    await asyncio.sleep(0)  # call queued, batch task scheduled
+    if started:
+        await asyncio.sleep(0)  # batch task now blocked inside batch_execute
+    for task in list(registry._batch_tasks):
+        task.cancel()
+    result = await asyncio.wait_for(call, timeout=1)
+    assert result.is_error and "cancelled" in result.for_llm
+
+    # A dead batch must not swallow later calls
+    tool.release.set()
+    result = await asyncio.wait_for(registry.execute("dummy", {}), timeout=1)
+    assert result.for_llm == "done"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("started", [True, False])
+async def test_reset_fails_outstanding_batches(started):
+    registry = ToolRegistry()
+    registry.register(SlowBatch())
+    call = asyncio.create_task(registry.execute("dummy", {}))
+    await asyncio.sleep(0)
+    if started:
+        await asyncio.sleep(0)
+    tasks = list(registry._batch_tasks)
+    registry.reset()
+    result = await asyncio.wait_for(call, timeout=1)
+    assert result.is_error
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(t.cancelled() for t in tasks)
+    assert not registry._batch_tasks
+
+
+@pytest.mark.asyncio
+async def test_contextual_batch_tool_runs_per_call(registry):
+    class ContextBatch(ContextualTool, BatchTool, DummyTool):
+        def set_context(self, channel: str, chat_id: str) -> None:
+            self.chat_id = chat_id
+
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            return ToolResult.success(self.chat_id)
+
+        async def batch_execute(self, args_list: list[dict[str, Any]]) -> list[ToolResult]:
+            raise AssertionError("contextual tools are not batched")
+
+    registry.register(ContextBatch())
+    results = await asyncio.gather(
+        registry.execute("dummy", {}, chat_id="a"), registry.execute("dummy", {}, chat_id="b")
+    )
+    assert [r.for_llm for r in results] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_validate_args_rejects_bad_arguments():
+    pytest.importorskip("jsonschema")
+    registry = ToolRegistry(validate_args=True)
+    registry.register(DummyTool())
+    result = await registry.execute("dummy", {"x": 5})
+    assert result.is_error
+    assert result.for_llm.startswith("Invalid arguments for dummy:")
+    assert (await registry.execute("dummy", {"x": "ok"})).for_llm == "got: ok"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_cacheable_tool_results_reused(registry, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(registry_module, "orjson", None)
+
+    class Counting(DummyTool):
+        cacheable = True
+
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            self.calls += 1
+            if args.get("x") == "bad":
+                return ToolResult.error("nope")
+            return await super().execute(args)
+
+    tool = Counting()
+    registry.register(tool)
+    for _ in range(3):
+        assert (await registry.execute("dummy", {"x": "a", "opts": {"b": 1, "a": [2]}})).for_llm
+    assert tool.calls == 1
+    await registry.execute("dummy", {"opts": {"a": [2], "b": 1}, "x": "a"})
+    assert tool.calls == 1
+    await registry.execute("dummy", {"x": "bad"})
+    await registry.execute("dummy", {"x": "bad"})
+    assert tool.calls == 3
+
+    # Re-registering drops the replaced tool's cached results
+    registry.register(Counting())
+    assert (await registry.execute("dummy", {"x": "a"})).for_llm == "got: a"
+    assert registry.get("dummy").calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        ({"n": 1}, {"n": True}),
+        ({"n": 1}, {"n": 1.0}),
+        ({"o": {"a": 1}}, {"o": [["a", 1]]}),
+        ({"o": ["a"]}, {"o": "a"}),
+    ],
+)
+async def test_cache_keys_distinguish_types(registry, monkeypatch, use_orjson, first, second):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(registry_module, "orjson", None)
+
+    class Echo(DummyTool):
+        cacheable = True
+
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            return ToolResult.success(repr(args))
+
+    registry.register(Echo())
+    assert (await registry.execute("dummy", first)).for_llm == repr(first)
+    assert (await registry.execute("dummy", second)).for_llm == repr(second)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {"x": "a", "opts": {"b": 1, "a": [2, 2.5, True, None]}},
+        {"text": "caf\u00e9 \u2713", "n": -0.0},
+        {"nested": [{"z": 1, "y": [[]]}, {}]},
+    ],
+)
+def test_canonical_args_same_with_and_without_orjson(monkeypatch, args):
+    pytest.importorskip("orjson")
+    fast = registry_module._canonical_args(args)
+    monkeypatch.setattr(registry_module, "orjson", None)
+    assert registry_module._canonical_args(args) == fast
+
+
+@pytest.mark.asyncio
+async def test_cached_result_not_shared_with_callers(registry):
+    class Cached(DummyTool):
+        cacheable = True
+
+    registry.register(Cached())
+    first = await registry.execute("dummy", {"x": "a"})
+    first.for_llm = "mutated"
+    second = await registry.execute("dummy", {"x": "a"})
+    assert second.for_llm == "got: a"
+    second.for_user = "mutated"
+    assert (await registry.execute("dummy", {"x": "a"})).for_user == ""
+
+
+@pytest.mark.asyncio
+async def test_uncacheable_tool_always_runs(registry):
+    class Counting(DummyTool):
+        calls = 0
+
+        async def execute(self, args: dict[str, Any]) -> ToolResult:
+            type(self).calls += 1
+            return await super().execute(args)
+
+    registry.register(Counting())
+    await registry.execute("dummy", {"x": "a"})
+    await registry.execute("dummy", {"x": "a"})
+    assert Counting.calls == 2
+
+
+@dataclass(slots=True, frozen=True)
+class DummyArgs:
+    x: str = ""
+
+
+class TypedDummy(TypedTool[DummyArgs], DummyTool):
+    args_model = DummyArgs
+
+    async def execute_typed(self, args: DummyArgs) -> ToolResult:
+        return ToolResult.success(f"got: {args.x}")
+
+
+@pytest.mark.asyncio
+async def test_args_model_decoded_before_execute(registry):
+    registry.register(TypedDummy())
+    assert (await registry.execute("dummy", {"x": "typed"})).for_llm == "got: typed"
+    assert (await registry.execute("dummy", {})).for_llm == "got: "
+    bad = await registry.execute("dummy", {"x": ["not", "a", "string"]})
+    assert bad.is_error
+    assert bad.for_llm.startswith("Invalid arguments for dummy:")
+
+
+@pytest.mark.asyncio
+async def test_typed_tool_execute_keeps_dict_contract():
+    tool = TypedDummy()
+    assert (await tool.execute({"x": "direct"})).for_llm == "got: direct"
+    assert (await tool.execute({"x": 1})).for_llm.startswith("Invalid arguments for dummy:")
+
+
+@pytest.mark.asyncio
+async def test_typed_batch_tool_batches_raw_dicts(registry):
+    class TypedBatch(BatchTool, TypedDummy):
+        seen: list[Any] = []
+
+        async def batch_execute(self, args_list: list[dict[str, Any]]) -> list[ToolResult]:
+            type(self).seen.extend(args_list)
+            return [ToolResult.success(f"batch: {a['x']}") for a in args_list]
+
+    registry.register(TypedBatch())
+    results = await asyncio.gather(
+        registry.execute("dummy", {"x": "a"}), registry.execute("dummy", {"x": "b"})
+    )
+    assert [r.for_llm for r in results] == ["batch: a", "batch: b"]
+    assert TypedBatch.seen == [{"x": "a"}, {"x": "b"}]
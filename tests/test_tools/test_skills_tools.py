@@ -0,0 +1,59 @@
+"""Tests for skills tools."""
+
+import asyncio
+
+from pyclaw.tools import skills_tools
+from pyclaw.tools.skills_tools import FindSkillsTool
+
+
+class _Registry:
+    def __init__(self, name, hits, delay=0.0, fail=False):
+        self.name = name
+        self._hits = hits
+        self._delay = delay
+        self._fail = fail
+
+    async def search(self, query, limit):
+        await asyncio.sleep(self._delay)
+        if self._fail:
+            raise RuntimeError("registry down")
+        return [
+            {"display_name": slug, "slug": slug, "summary": "", "version": "1",
+             "registry": self.name, "score": score}
+            for slug, score in self._hits
+        ]
+
+
+class _Manager:
+    def __init__(self, regs):
+        self._regs = regs
+
+    def registries(self):
+        return list(self._regs)
+
+
+async def test_find_skills_merges_registries_and_skips_slow_ones(monkeypatch):
+    monkeypatch.setattr(skills_tools, "_REGISTRY_SEARCH_TIMEOUT", 0.05)
+    tool = FindSkillsTool()
+    tool.set_registry_manager(_Manager([
+        _Registry("a", [("alpha", 0.2)]),
+        _Registry("b", [("beta", 0.9)]),
+        _Registry("slow", [("never", 1.0)], delay=1.0),
+        _Registry("broken", [], fail=True),
+    ]))
+    result = await tool.execute({"query": "x"})
+    assert not result.is_error
+    assert result.for_llm.index("beta") < result.for_llm.index("alpha")
+    assert "never" not in result.for_llm
+
+
+async def test_find_skills_output_format():
+    tool = FindSkillsTool()
+    tool.set_registry_manager(_Manager([_Registry("hub", [("pdf", 1.0)])]))
+    result = await tool.execute({"query": "pdf"})
+    assert result.for_llm == (
+        "- pdf (pdf)\n"
+        "  \n"
+        "  Version: 1 | Registry: hub\n"
+        '  Install: install_skill(slug="pdf", registry="hub")'
+    )
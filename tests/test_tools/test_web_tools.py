@@ -0,0 +1,95 @@
+"""Tests for web tools."""
+
+import httpx
+
+from pyclaw import http_client
+from pyclaw.http_client import close_shared_http_client
+from pyclaw.tools.web_tools import WebFetchTool, WebSearchTool
+
+
+async def test_fetch_uses_shared_client(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, text="hello")
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "_http_client", client)
+    try:
+        result = await WebFetchTool().execute({"url": "https://example.com/a"})
+        await WebFetchTool().execute({"url": "https://example.com/b"})
+    finally:
+        await close_shared_http_client()
+    assert result.for_llm == "hello"
+    assert seen == ["https://example.com/a", "https://example.com/b"]
+
+
+async def test_fetch_stops_reading_past_limit(monkeypatch):
+    served = 0
+
+    async def body():
+        nonlocal served
+        for _ in range(100):
+            served += 1
+            yield b"x" * 10_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "_http_client", client)
+    try:
+        result = await WebFetchTool().execute({"url": "https://example.com/big"})
+    finally:
+        await close_shared_http_client()
+    assert result.for_llm.endswith("\n... (content truncated)")
+    assert len(result.for_llm) == 50000 + len("\n... (content truncated)")
+    assert served < 10
+
+
+async def test_brave_results_parsed_from_body(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = {"web": {"results": [{"title": "Ünïcode", "url": "u", "description": "d"}]}}
+        return httpx.Response(200, json=body)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "_http_client", client)
+    try:
+        result = await WebSearchTool(brave_api_key="k").execute({"query": "q"})
+    finally:
+        await close_shared_http_client()
+    assert result.for_llm == "1. Ünïcode\n   u\n   d"
+
+
+_DDG_PAGE = """
+<div class="result results_links web-result">
+  <h2 class="result__title">
+    <a rel="nofollow" class="result__a"
+       href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fpython.org%2F&amp;rut=abc"
+       >Welcome to <b>Python</b>.org</a>
+  </h2>
+  <a class="result__snippet" href="#">The official home of the <b>Python</b>
+     Programming Language</a>
+</div>
+<div class="result"><a class="result__a" href="https://docs.python.org/">Docs</a>
+  <div class="result__snippet">Documentation</div></div>
+<div class="result"><a class="result__a" href="https://example.com/">Third</a></div>
+"""
+
+
+async def test_duckduckgo_html_reduced_to_results(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=_DDG_PAGE)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "_http_client", client)
+    try:
+        result = await WebSearchTool().execute({"query": "python", "num_results": 2})
+    finally:
+        await close_shared_http_client()
+    assert result.for_llm == (
+        "1. Welcome to Python.org\n   https://python.org/\n"
+        "   The official home of the Python Programming Language\n\n"
+        "2. Docs\n   https://docs.python.org/\n   Documentation"
+    )